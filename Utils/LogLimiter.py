@@ -0,0 +1,166 @@
+# ======================== Imports ========================
+import random
+import threading
+import time
+
+from Utils.Logger import find_caller_frame
+
+
+# ======================== Constants ========================
+
+LEVEL_COUNT = 6
+
+# Returned by RateLimiter.check when a message passes with nothing to report.
+NO_SUMMARIES = ()
+
+
+# ======================== Independent Functions ========================
+
+def per_level(setting, name: str) -> tuple:
+    """Expand a scalar or per-level mapping into one value per level.
+
+    Args:
+        setting (float | dict[int, float] | None): A value applied to every
+            level, a mapping of level to value (missing levels get None), or
+            None.
+        name (str): Setting name used in error messages.
+
+    Returns:
+        tuple: `LEVEL_COUNT` values, None meaning "no limit" for that level.
+
+    Raises:
+        ValueError: If a mapping contains a level outside 0..5.
+    """
+    if isinstance(setting, dict):
+        invalid = [level for level in setting if not 0 <= level < LEVEL_COUNT]
+        if invalid:
+            raise ValueError(f"Invalid levels {invalid} in {name}, expected 0..{LEVEL_COUNT - 1}")
+        return tuple(setting.get(level) for level in range(LEVEL_COUNT))
+    return (setting,) * LEVEL_COUNT
+
+
+# ======================== Rate Limiter ========================
+class RateLimiter:
+
+    def __init__(self, rate=None, burst=None, sample=None, summary_interval: float = 10.0):
+        """Limit how often each call site may log, per level.
+
+        Call sites are keyed by the code object and line number of the first
+        frame outside the logger. Each site gets a token bucket per
+        configuration: `rate` tokens per second up to `burst` tokens. Messages
+        are first sampled with probability `sample`, then have to take a
+        token. Suppressed messages are counted per site and reported as
+        summaries once they have been held for `summary_interval` seconds,
+        ahead of the next message the logger emits (or on :meth:`drain`).
+
+        Each setting is either one value for all levels or a dict mapping
+        level (0..5) to value; None (or a missing level) disables that limit.
+
+        Args:
+            rate (float | dict[int, float] | None): Sustained messages per
+                second allowed per call site.
+            burst (float | dict[int, float] | None): Bucket capacity; defaults
+                to ``max(1, rate)``.
+            sample (float | dict[int, float] | None): Probability (0..1) that
+                a message is considered at all.
+            summary_interval (float): Maximum seconds suppressed counts are
+                held before being reported.
+        """
+        self.rates = per_level(rate, "rate")
+        bursts = per_level(burst, "burst")
+        self.bursts = tuple(
+            (b if b is not None else max(1.0, r)) if r is not None else None
+            for r, b in zip(self.rates, bursts))
+        self.samples = per_level(sample, "sample")
+        self.summary_interval = summary_interval
+        self.suppressed_total = 0
+        self._limited = tuple(r is not None or s is not None for r, s in zip(self.rates, self.samples))
+        self._sites = {}
+        self._lock = threading.Lock()
+        self._last_sweep = time.monotonic()
+
+    def check(self, log_level: int):
+        """Decide whether the current call site may log a message now.
+
+        Must be called from inside the logger so the first frame outside it
+        is the call site.
+
+        Args:
+            log_level (int): Level of the message (0..5).
+
+        Returns:
+            tuple[tuple[int, str], ...] | None: None when the message is
+                suppressed. Otherwise ``(level, text)`` summaries of
+                previously suppressed messages that should be emitted before
+                it (usually empty).
+        """
+        if not self._limited[log_level]:
+            if not self.suppressed_total:
+                return NO_SUMMARIES
+            with self._lock:
+                return self._sweep(time.monotonic())
+        frame = find_caller_frame()
+        if frame is None:
+            return NO_SUMMARIES
+        key = (frame.f_code, frame.f_lineno, log_level)
+        now = time.monotonic()
+        with self._lock:
+            site = self._sites.get(key)
+            if site is None:
+                # [tokens, last refill, suppressed count, first suppression time]
+                site = self._sites[key] = [self.bursts[log_level], now, 0, 0.0]
+            allowed = True
+            sample = self.samples[log_level]
+            if sample is not None and random.random() >= sample:
+                allowed = False
+            rate = self.rates[log_level]
+            if allowed and rate is not None:
+                tokens = min(self.bursts[log_level], site[0] + (now - site[1]) * rate)
+                site[1] = now
+                if tokens >= 1.0:
+                    site[0] = tokens - 1.0
+                else:
+                    site[0] = tokens
+                    allowed = False
+            if not allowed:
+                if not site[2]:
+                    site[3] = now
+                site[2] += 1
+                self.suppressed_total += 1
+                return None
+            if not self.suppressed_total:
+                return NO_SUMMARIES
+            if site[2] and now - site[3] >= self.summary_interval:
+                return (self._summary(key, site, now),) + self._sweep(now)
+            return self._sweep(now)
+
+    def drain(self) -> tuple:
+        """Return summaries for every site with suppressed messages and reset them.
+
+        Returns:
+            tuple[tuple[int, str], ...]: ``(level, text)`` summaries.
+        """
+        with self._lock:
+            return self._collect(lambda site: True, time.monotonic())
+
+    def _sweep(self, now: float) -> tuple:
+        """Collect summaries held longer than `summary_interval`, at most once per interval."""
+        if now - self._last_sweep < self.summary_interval:
+            return NO_SUMMARIES
+        self._last_sweep = now
+        interval = self.summary_interval
+        return self._collect(lambda site: now - site[3] >= interval, now)
+
+    def _collect(self, due, now: float) -> tuple:
+        """Summarise and reset every suppressing site for which `due(site)` is True."""
+        return tuple(self._summary(key, site, now)
+                     for key, site in list(self._sites.items()) if site[2] and due(site))
+
+    def _summary(self, key: tuple, site: list, now: float) -> tuple:
+        """Build the summary for one site and reset its suppressed count."""
+        code, lineno, log_level = key
+        text = (f"{site[2]} messages suppressed at {code.co_filename}:{lineno} ({code.co_name}) "
+                f"in the last {now - site[3]:.1f}s")
+        self.suppressed_total -= site[2]
+        site[2] = 0
+        return log_level, text
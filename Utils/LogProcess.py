@@ -0,0 +1,167 @@
+# ======================== Imports ========================
+import heapq
+import itertools
+import multiprocessing
+import os
+import queue as queue_module
+import sys
+import threading
+import time
+from typing import Optional
+
+import Utils.Logger
+from Utils.LogSinks import LogSink, StreamSink
+
+
+# ======================== Worker Side ========================
+class QueueSink(LogSink):
+
+    def __init__(self, queue):
+        """Send records to a :class:`LogCollector` in another process.
+
+        Each write call becomes one queue message holding the already
+        formatted lines, stamped with the wall-clock time so the collector
+        can order records from different workers.
+
+        Args:
+            queue (multiprocessing.Queue): The collector's `queue`.
+        """
+        self.queue = queue
+        self.pid = os.getpid()
+
+    def write(self, records) -> None:
+        """Send all records as one message."""
+        self.queue.put((time.time(), self.pid, [(level, line) for level, line in records]))
+
+
+def init_worker_logging(queue, logger_level: Optional[int] = None):
+    """Route all logging in a worker process to a :class:`LogCollector`.
+
+    Intended as a ``multiprocessing.Pool`` initializer::
+
+        with LogCollector() as collector:
+            pool = Pool(initializer=init_worker_logging, initargs=(collector.queue,))
+
+    Every live logger (for example module-level loggers inherited through
+    fork) and every logger created later in the worker writes to a
+    :class:`QueueSink` instead of stdout. Async writers are dropped because
+    their threads do not survive fork and the queue already sends from a
+    background thread.
+
+    Args:
+        queue (multiprocessing.Queue): The collector's `queue`.
+        logger_level (Optional[int]): If given, applied to every live logger.
+    """
+    sink = QueueSink(queue)
+    Utils.Logger.set_default_sinks(lambda: [sink])
+    for logger in Utils.Logger.live_loggers():
+        logger.sinks = [sink]
+        logger.writer = None
+        if logger_level is not None:
+            logger.logger_level = logger_level
+
+
+# ======================== Parent Side ========================
+class LogCollector:
+
+    def __init__(self, sinks: Optional[list] = None, order_window: float = 0.05,
+                 batch_size: int = 4096, context=None):
+        """Collect records sent by worker processes and write them in batches.
+
+        A collector thread in the parent reads messages from `queue`, holds
+        records for `order_window` seconds so records from different workers
+        can be put in timestamp order, and writes each ordered batch to the
+        sinks with one call per sink.
+
+        Args:
+            sinks (Optional[list[LogSink]]): Destinations; defaults to a
+                stdout :class:`StreamSink`.
+            order_window (float): Seconds records are held for reordering.
+                0 writes records in arrival order.
+            batch_size (int): Maximum records written per sink call.
+            context (multiprocessing.context.BaseContext | None): Context used
+                to create the queue; defaults to the global context.
+        """
+        self.sinks = list(sinks) if sinks is not None else [StreamSink(auto_flush=True)]
+        self.order_window = order_window
+        self.batch_size = batch_size
+        self.queue = (context or multiprocessing).Queue()
+        self.received = 0
+        self._pending = []
+        self._sequence = itertools.count()
+        self._thread = None
+
+    def start(self) -> "LogCollector":
+        """Start the collector thread.
+
+        Returns:
+            LogCollector: self, for chaining.
+        """
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="LogCollector", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = None):
+        """Write every remaining record and stop the collector thread.
+
+        Call after the workers have exited (``pool.close(); pool.join()``)
+        so their queued records have been sent.
+
+        Args:
+            timeout (Optional[float]): Maximum seconds to wait for the thread.
+        """
+        if self._thread is None:
+            return
+        self.queue.put(None)
+        self._thread.join(timeout)
+        self._thread = None
+        for sink in self.sinks:
+            sink.flush()
+
+    def __enter__(self) -> "LogCollector":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def _run(self):
+        """Collector loop: receive, order and write records until stopped."""
+        stopping = False
+        while not stopping:
+            timeout = self.order_window if self._pending else None
+            try:
+                message = self.queue.get(timeout=timeout)
+            except queue_module.Empty:
+                message = ()
+            while message is not None:
+                if message:
+                    self._add(message)
+                try:
+                    message = self.queue.get_nowait()
+                except queue_module.Empty:
+                    break
+            else:
+                stopping = True
+            self._write_due(None if stopping else time.time() - self.order_window)
+
+    def _add(self, message: tuple):
+        """Push one worker message's records onto the ordering heap."""
+        timestamp, pid, records = message
+        for level, line in records:
+            heapq.heappush(self._pending, (timestamp, next(self._sequence), level, line))
+        self.received += len(records)
+
+    def _write_due(self, cutoff: Optional[float]):
+        """Write pending records stamped at or before `cutoff` (all when None)."""
+        pending = self._pending
+        while pending and (cutoff is None or pending[0][0] <= cutoff):
+            batch = []
+            while pending and len(batch) < self.batch_size and (cutoff is None or pending[0][0] <= cutoff):
+                _, _, level, line = heapq.heappop(pending)
+                batch.append((level, line))
+            for sink in self.sinks:
+                try:
+                    sink.write(batch)
+                except Exception as e:
+                    sys.stderr.write(f"[Logger_ERROR]; Sink {sink!r} of LogCollector failed: {e}\n")
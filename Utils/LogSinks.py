@@ -0,0 +1,246 @@
+# ======================== Imports ========================
+from __future__ import annotations
+
+import _thread
+import os
+import sys
+import time
+
+
+# ======================== Sink Base ========================
+class LogSink:
+    """Destination for formatted log lines.
+
+    A record is a ``(log_level, line)`` tuple where `line` is the fully
+    formatted message without a trailing newline. LoggerClass formats each
+    record once and passes the same tuple to every sink it owns, either one
+    record at a time or in batches from the async writer.
+    """
+
+    def write(self, records) -> None:
+        """Write a sequence of ``(log_level, line)`` records.
+
+        Args:
+            records (Sequence[tuple[int, str]]): Records to write, in order.
+        """
+        raise NotImplementedError
+
+    def flush(self) -> None:
+        """Push any buffered output to its destination."""
+
+    def close(self) -> None:
+        """Flush and release any resources held by the sink."""
+        self.flush()
+
+
+# ======================== Stream Sink ========================
+class StreamSink(LogSink):
+
+    def __init__(self, stream=None, auto_flush: bool = False):
+        """Write records to a text stream.
+
+        Args:
+            stream (TextIO | None): Stream to write to. None means the
+                current ``sys.stdout`` at write time, matching ``print()``.
+            auto_flush (bool): Flush the stream after every write call.
+        """
+        self.stream = stream
+        self.auto_flush = auto_flush
+
+    def write(self, records) -> None:
+        """Write all records with a single ``stream.write`` call."""
+        stream = sys.stdout if self.stream is None else self.stream
+        if len(records) == 1:
+            stream.write(records[0][1] + "\n")
+        else:
+            stream.write("\n".join([line for _, line in records]) + "\n")
+        if self.auto_flush:
+            stream.flush()
+
+    def flush(self) -> None:
+        """Flush the underlying stream."""
+        (sys.stdout if self.stream is None else self.stream).flush()
+
+
+# ======================== File Sink ========================
+class FileSink(LogSink):
+
+    def __init__(self, path, buffer_size: int = 64 * 1024, flush_level: int | None = None,
+                 flush_interval: float | None = None, max_bytes: int | None = None,
+                 rotate_interval: float | None = None, backup_count: int = 5,
+                 encoding: str = "utf-8"):
+        """Append records to a block-buffered file with optional rotation.
+
+        Records are encoded once per write call and go through a
+        ``buffer_size`` byte buffer, so high-volume logging costs one write
+        syscall per full buffer rather than one per line.
+
+        Args:
+            path (str | os.PathLike): Log file path; parent directories are
+                created if needed.
+            buffer_size (int): Size of the write buffer in bytes.
+            flush_level (Optional[int]): Flush immediately after a write that
+                contains a record at or above this level (e.g. 5 for ERROR).
+            flush_interval (Optional[float]): Flush when at least this many
+                seconds passed since the last flush.
+            max_bytes (Optional[int]): Rotate before a write would grow the
+                file beyond this size. Checked per write call, so one batch
+                is never split across files.
+            rotate_interval (Optional[float]): Rotate when the current file
+                has been open for at least this many seconds.
+            backup_count (int): Number of rotated files to keep
+                (``path.1`` .. ``path.N``, newest first).
+            encoding (str): Text encoding of the log file.
+
+        Writes, rotation and flushes hold a lock, so one sink can be shared
+        by loggers used from several threads.
+        """
+        self._lock = _thread.RLock()
+        self.path = os.fspath(path)
+        self.buffer_size = buffer_size
+        self.flush_level = flush_level
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes
+        self.rotate_interval = rotate_interval
+        self.backup_count = backup_count
+        self.encoding = encoding
+        self._file = None
+        self._open()
+
+    def _open(self):
+        """Open the log file for appending and reset rotation state."""
+        parent = os.path.dirname(self.path)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+        self._file = open(self.path, "ab", buffering=self.buffer_size)
+        self._size = self._file.tell()
+        self._opened_at = self._flushed_at = time.monotonic()
+
+    def rotate(self):
+        """Close the current file, shift backups by one and start a new file."""
+        with self._lock:
+            self._file.close()
+            if self.backup_count > 0:
+                for index in range(self.backup_count - 1, 0, -1):
+                    source = f"{self.path}.{index}"
+                    if os.path.exists(source):
+                        os.replace(source, f"{self.path}.{index + 1}")
+                os.replace(self.path, f"{self.path}.1")
+            else:
+                os.remove(self.path)
+            self._open()
+
+    def write(self, records) -> None:
+        """Encode and append records, rotating and flushing as configured."""
+        if len(records) == 1:
+            data = (records[0][1] + "\n").encode(self.encoding)
+        else:
+            data = ("\n".join([line for _, line in records]) + "\n").encode(self.encoding)
+        with self._lock:
+            now = time.monotonic() if self.rotate_interval is not None or self.flush_interval is not None else 0.0
+            if self._size and (
+                    (self.max_bytes is not None and self._size + len(data) > self.max_bytes)
+                    or (self.rotate_interval is not None and now - self._opened_at >= self.rotate_interval)):
+                self.rotate()
+            self._file.write(data)
+            self._size += len(data)
+            if (self.flush_level is not None and max(level for level, _ in records) >= self.flush_level) \
+                    or (self.flush_interval is not None and now - self._flushed_at >= self.flush_interval):
+                self.flush()
+
+    def flush(self) -> None:
+        """Write the buffered bytes to the file."""
+        with self._lock:
+            if not self._file.closed:
+                self._file.flush()
+                self._flushed_at = time.monotonic()
+
+    def close(self) -> None:
+        """Flush and close the log file."""
+        with self._lock:
+            self._file.close()
+
+
+# ======================== Ring Buffer Sink ========================
+class RingBufferSink(LogSink):
+
+    def __init__(self, capacity: int = 1000, dump_level: int | None = None, dump_stream=None):
+        """Keep the most recent records in a fixed-size in-memory buffer.
+
+        The buffer is preallocated and overwritten in place, so writing never
+        allocates beyond the records themselves. Use :meth:`dump` to write the
+        retained history somewhere, e.g. after an error.
+
+        Args:
+            capacity (int): Number of records retained.
+            dump_level (Optional[int]): When a record at or above this level
+                is written, the buffer (including that record) is dumped to
+                `dump_stream` and cleared.
+            dump_stream (TextIO | None): Stream used for automatic dumps;
+                None means the current ``sys.stderr``.
+
+        Writes, dumps and clears hold a lock, so one sink can be shared by
+        loggers used from several threads.
+
+        Raises:
+            ValueError: If `capacity` is not positive.
+        """
+        if capacity < 1:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+        self._lock = _thread.RLock()
+        self.capacity = capacity
+        self.dump_level = dump_level
+        self.dump_stream = dump_stream
+        self._lines = [None] * capacity
+        self._next = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def write(self, records) -> None:
+        """Store records, overwriting the oldest once the buffer is full."""
+        with self._lock:
+            lines = self._lines
+            capacity = self.capacity
+            index = self._next
+            dump = False
+            for level, line in records:
+                lines[index] = line
+                index = index + 1 if index + 1 < capacity else 0
+                if self.dump_level is not None and level >= self.dump_level:
+                    dump = True
+            self._next = index
+            self._count = min(self._count + len(records), capacity)
+            if dump:
+                self.dump(self.dump_stream)
+                self.clear()
+
+    def lines(self) -> list:
+        """Return the retained lines, oldest first.
+
+        Returns:
+            list[str]: Up to `capacity` formatted lines.
+        """
+        with self._lock:
+            if self._count < self.capacity:
+                return self._lines[:self._count]
+            return self._lines[self._next:] + self._lines[:self._next]
+
+    def dump(self, stream=None):
+        """Write the retained lines to `stream` with a single write.
+
+        Args:
+            stream (TextIO | None): Destination; None means ``sys.stderr``.
+        """
+        lines = self.lines()
+        if lines:
+            stream = sys.stderr if stream is None else stream
+            stream.write("\n".join(lines) + "\n")
+            stream.flush()
+
+    def clear(self):
+        """Forget all retained lines."""
+        with self._lock:
+            self._next = 0
+            self._count = 0
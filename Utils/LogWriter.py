@@ -0,0 +1,159 @@
+# ======================== Imports ========================
+import atexit
+import sys
+import threading
+from collections import deque
+from typing import Callable, Optional
+
+
+# ======================== Constants ========================
+
+OVERFLOW_POLICIES = ("block", "drop_oldest", "drop_newest")
+
+
+# ======================== Queued Writer ========================
+class QueuedWriter:
+
+    def __init__(self, write_batch: Callable[[list], None], max_size: int = 10000,
+                 overflow_policy: str = "block", batch_size: int = 1024, name: str = "QueuedWriter"):
+        """Create a bounded record queue drained by a background thread.
+
+        Producers call :meth:`put`; the writer thread takes up to
+        `batch_size` queued records at a time and hands them to
+        `write_batch` in one call. The queue is drained by :meth:`close`,
+        which is registered with atexit so pending records are written on
+        normal interpreter shutdown.
+
+        Args:
+            write_batch (Callable[[list], None]): Called from the writer
+                thread with a non-empty list of records.
+            max_size (int): Maximum number of queued records.
+            overflow_policy (str): What :meth:`put` does when the queue is
+                full: "block" waits for space, "drop_oldest" discards the
+                oldest queued record, "drop_newest" discards the new record.
+                Both drop policies count discarded records in `dropped`.
+            batch_size (int): Maximum number of records per `write_batch`
+                call.
+            name (str): Name of the writer thread.
+
+        Raises:
+            ValueError: If `overflow_policy` is unknown or `max_size` /
+                `batch_size` is not positive.
+        """
+        if overflow_policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow_policy {overflow_policy!r}, expected one of {OVERFLOW_POLICIES}")
+        if max_size < 1 or batch_size < 1:
+            raise ValueError(f"max_size and batch_size must be positive, got {max_size} and {batch_size}")
+        self.write_batch = write_batch
+        self.max_size = max_size
+        self.overflow_policy = overflow_policy
+        self.batch_size = batch_size
+        self.dropped = 0
+
+        self._records = deque()
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        self._idle = threading.Condition(self._lock)
+        self._writing = False
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    @property
+    def closed(self) -> bool:
+        """bool: True once :meth:`close` has been called."""
+        return self._closed
+
+    def put(self, record) -> bool:
+        """Queue a record for the writer thread.
+
+        After :meth:`close` the record is written synchronously instead, so
+        late records are not lost.
+
+        Args:
+            record: Record passed on to `write_batch`.
+
+        Returns:
+            bool: False if the record was dropped by the "drop_newest"
+                policy, True otherwise.
+        """
+        with self._lock:
+            if not self._closed:
+                if len(self._records) >= self.max_size:
+                    if self.overflow_policy == "drop_newest":
+                        self.dropped += 1
+                        return False
+                    if self.overflow_policy == "drop_oldest":
+                        self._records.popleft()
+                        self.dropped += 1
+                    else:
+                        while len(self._records) >= self.max_size and not self._closed:
+                            self._not_full.wait()
+                if not self._closed:
+                    self._records.append(record)
+                    self._not_empty.notify()
+                    return True
+        self._write([record])
+        return True
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until every queued record has been written.
+
+        Args:
+            timeout (Optional[float]): Maximum seconds to wait; None waits
+                indefinitely.
+
+        Returns:
+            bool: True if the queue was fully drained.
+        """
+        with self._lock:
+            return self._idle.wait_for(lambda: not (self._records or self._writing)
+                                       or not self._thread.is_alive(), timeout)
+
+    def close(self, timeout: Optional[float] = None):
+        """Stop accepting queued records, drain the queue and stop the thread.
+
+        Safe to call more than once.
+
+        Args:
+            timeout (Optional[float]): Maximum seconds to wait for the writer
+                thread; None waits until the queue is drained.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._not_empty.notify_all()
+            self._not_full.notify_all()
+        if self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+        atexit.unregister(self.close)
+
+    def _write(self, batch: list):
+        """Pass `batch` to `write_batch`, reporting failures on stderr."""
+        try:
+            self.write_batch(batch)
+        except Exception as e:
+            sys.stderr.write(f"[Logger_ERROR]; {self._thread.name} failed to write {len(batch)} records: {e}\n")
+
+    def _run(self):
+        """Writer thread loop: take batches until closed and drained."""
+        records = self._records
+        while True:
+            with self._lock:
+                while not records and not self._closed:
+                    self._not_empty.wait()
+                if not records:
+                    self._idle.notify_all()
+                    return
+                count = min(len(records), self.batch_size)
+                batch = [records.popleft() for _ in range(count)]
+                self._writing = True
+                self._not_full.notify_all()
+            self._write(batch)
+            with self._lock:
+                self._writing = False
+                if not records:
+                    self._idle.notify_all()
@@ -1,11 +1,47 @@
 # ======================== Imports ========================
-from datetime import datetime
-from typing import Optional
+from __future__ import annotations
+
+import _thread
+import os
+import sys
+import weakref
+from collections.abc import Mapping
+from time import localtime, time_ns
+
+from Utils.LogSinks import StreamSink
 failed_imports=[]
-try:
-    import colorama as color #Try catch due to colors being an optional feature that should not be enforced
-except:
-    failed_imports.append("colorama")
+# colorama is an optional feature that should not be enforced; it is imported
+# on the first colored render by load_colorama().
+color = None
+_colorama_loaded = False
+
+
+# ======================== Constants ========================
+
+LEVEL_LABELS = (" DEBUG ", " VALUE ", "  INFO ", "SUCCESS", "WARNING", " ERROR ")
+LEVEL_NAMES = ("DEBUG", "VALUE", "INFO", "SUCCESS", "WARNING", "ERROR")
+
+# Level used by registry loggers when neither code nor LOGGER_LEVEL configures one.
+DEFAULT_LEVEL = 2
+# Environment variable read by the registry, e.g. "WARNING,ioHelper.fileOperations=DEBUG".
+LEVEL_ENV_VAR = "LOGGER_LEVEL"
+
+# Prefix flags in the order used for the compiled prefix cache key.
+_PREFIX_FLAGS = ("log_date", "log_time", "log_name", "log_function", "log_level", "log_color")
+# Attributes baked into a compiled prefix; assigning one invalidates it.
+_PREFIX_ATTRIBUTES = frozenset(_PREFIX_FLAGS + ("logger_name", "prevent_color"))
+
+# Maps code objects to whether frames running them belong to a LoggerClass.
+_logger_code_cache = {}
+
+# (second, struct_time) of the last rendered timestamp, reused within a second.
+_localtime_cache = (None, None)
+
+# Every LoggerClass instance alive in this process.
+_live_loggers = weakref.WeakSet()
+
+# Callable returning the sinks for loggers created without explicit sinks.
+_default_sink_factory = None
 
 
 # ======================== Independent Functions ========================
@@ -24,12 +60,203 @@ def logger_logger(msg: str, logger_name: str):
     print(f"[LOGGER_DEBUG][{logger_name}]; {msg}")
 
 
+def live_loggers() -> list:
+    """Return every LoggerClass instance currently alive in this process.
+
+    Returns:
+        list[LoggerClass]: Live logger instances, in no particular order.
+    """
+    return list(_live_loggers)
+
+
+def set_default_sinks(factory):
+    """Set the sinks used by loggers created without an explicit `sinks` argument.
+
+    Args:
+        factory (Callable[[], list[LogSink]] | None): Called once per new
+            logger to build its sinks. None restores the default stdout
+            :class:`StreamSink`.
+    """
+    global _default_sink_factory
+    _default_sink_factory = factory
+
+
+def load_colorama():
+    """Import colorama on first use and return it.
+
+    The import is attempted once; on failure "colorama" is added to
+    `failed_imports` and None is returned from then on.
+
+    Returns:
+        module | None: The colorama module, or None if it is unavailable.
+    """
+    global color, _colorama_loaded
+    if not _colorama_loaded:
+        _colorama_loaded = True
+        try:
+            import colorama as color
+        except ImportError:
+            failed_imports.append("colorama")
+    return color
+
+
+def colored_level_labels() -> tuple:
+    """Return the level labels wrapped in their colorama escape sequences.
+
+    Requires colorama; callers must check :func:`load_colorama` first.
+
+    Returns:
+        tuple[str, ...]: One colored label per level (0=DEBUG .. 5=ERROR).
+    """
+    return (color.Fore.LIGHTWHITE_EX + ' DEBUG ' + color.Fore.RESET,
+            color.Fore.MAGENTA + ' VALUE ' + color.Fore.RESET,
+            color.Fore.CYAN + ' INFO ' + color.Fore.RESET,
+            color.Fore.LIGHTGREEN_EX + 'SUCCESS' + color.Fore.RESET,
+            color.Fore.YELLOW + 'WARNING' + color.Fore.RESET,
+            color.Back.RED + color.Style.BRIGHT + color.Fore.BLACK + ' ERROR ' + color.Style.RESET_ALL)
+
+
+def current_time() -> tuple:
+    """Return the local time and milliseconds used to render timestamps.
+
+    The `struct_time` is reused while the second does not change, so most
+    calls skip the `localtime` conversion.
+
+    Returns:
+        tuple[time.struct_time, int]: Local time truncated to the second and
+            the milliseconds within that second.
+    """
+    global _localtime_cache
+    seconds, ms = divmod(time_ns() // 1000000, 1000)
+    cached_seconds, now = _localtime_cache
+    if seconds != cached_seconds:
+        now = localtime(seconds)
+        _localtime_cache = (seconds, now)
+    return now, ms
+
+
+def compile_prefix(logger_name: str, log_date: bool, log_time: bool, log_name: bool,
+                   log_function: bool, log_level: bool, log_color: bool) -> tuple:
+    """Compile the prefix layout for one combination of formatting flags.
+
+    The result is a `str.format` template with the logger name already
+    baked in, plus the level labels to substitute into it. Filling the
+    template only needs the current time, the caller name and the label.
+
+    Args:
+        logger_name (str): Logger name inserted literally into the template.
+        log_date (bool): Include the date.
+        log_time (bool): Include the time (with milliseconds).
+        log_name (bool): Include the logger name.
+        log_function (bool): Include a ``{func}`` field for the caller name.
+        log_level (bool): Include a ``{level}`` field for the level label.
+        log_color (bool): Use colored level labels.
+
+    Returns:
+        tuple[str, tuple[str, ...]]: The template and the level labels.
+    """
+    parts = []
+    if log_date and log_time:
+        parts.append("[{t.tm_mday:02d}-{t.tm_mon:02d}-{t.tm_year:04d} {t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}.{ms:03d}]")
+    elif log_date:
+        parts.append("[{t.tm_mday:02d}-{t.tm_mon:02d}-{t.tm_year:04d}]")
+    elif log_time:
+        parts.append("[{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}.{ms:03d}]")
+    if log_name:
+        parts.append("[" + logger_name.replace("{", "{{").replace("}", "}}") + "]")
+    if log_function:
+        parts.append("[{func}]")
+    if log_level:
+        parts.append("[{level}]")
+    labels = colored_level_labels() if log_color else LEVEL_LABELS
+    return f"{' '.join(parts)}; ", labels
+
+
+def render_message(msg, args: tuple, logger_name: str) -> str:
+    """Render a deferred log message body.
+
+    Called only once a message has passed the level check. A callable `msg`
+    is called to produce the body. When `args` are given the body is
+    ``%``-formatted with them; a single mapping argument is used for named
+    placeholders, like the standard library logging module.
+
+    Args:
+        msg: Message body, or a callable returning it.
+        args (tuple): Positional values for ``%`` formatting.
+        logger_name (str): Logger name used for formatting diagnostics.
+
+    Returns:
+        str: The rendered message body.
+    """
+    if callable(msg):
+        msg = msg()
+    if not args:
+        return str(msg)
+    if len(args) == 1 and isinstance(args[0], Mapping) and args[0]:
+        args = args[0]
+    try:
+        return str(msg) % args
+    except (TypeError, ValueError, KeyError) as e:
+        logger_logger(f"Failed to format message {msg!r} with args {args!r}: {e}", logger_name)
+        return f"{msg} {args}"
+
+
+# ======================== Caller Resolution ========================
+
+def is_logger_frame(frame) -> bool:
+    """Return True if `frame` runs code bound to a LoggerClass instance.
+
+    The answer is cached per code object: a code object without a `self`
+    variable is never inside the logger, and one with `self` is classified
+    by the first frame seen running it. Only cache misses read `f_locals`.
+
+    Args:
+        frame (types.FrameType): Frame to classify.
+
+    Returns:
+        bool: True when the frame should be skipped during caller lookup.
+    """
+    code = frame.f_code
+    inside = _logger_code_cache.get(code)
+    if inside is None:
+        inside = ('self' in code.co_varnames or 'self' in code.co_cellvars) \
+            and isinstance(frame.f_locals.get('self'), LoggerClass)
+        _logger_code_cache[code] = inside
+    return inside
+
+
+def find_caller_frame(depth: int = 1):
+    """Return the first frame outside the logger, walking outwards.
+
+    Walks raw frames starting `depth` levels above the function that calls
+    this one and stops at the first frame for which :func:`is_logger_frame`
+    is False.
+
+    Args:
+        depth (int): Number of frames to skip above the calling function
+            (default 1, i.e. start at the caller's caller).
+
+    Returns:
+        types.FrameType | None: The caller frame, or None if the whole
+            stack belongs to the logger.
+    """
+    try:
+        frame = sys._getframe(depth + 1)
+    except ValueError:
+        return None
+    while frame is not None and is_logger_frame(frame):
+        frame = frame.f_back
+    return frame
+
+
 # ======================== Logger Class ========================
 class LoggerClass:
 
     def __init__(self, logger_level: int, logger_name: str = 'UNNAMED_LOGGER',
                  log_date: bool = False, log_time: bool = True, log_name: bool = True,
-                 log_function: bool = True,log_level: bool = True, log_color: bool = True, logger_debug: bool = False
+                 log_function: bool = True,log_level: bool = True, log_color: bool = True, logger_debug: bool = False,
+                 async_mode: bool = False, queue_size: int = 10000, overflow_policy: str = "block",
+                 sinks: list | None = None, rate_limiter=None
                  ):
         """Create a LoggerClass instance with formatting options.
 
@@ -48,12 +275,30 @@ class LoggerClass:
                 available.
             logger_debug (bool): If True, enable internal debug diagnostics
                 from the logger implementation itself.
+            async_mode (bool): If True, formatted lines are queued and
+                written in batches by a background thread (see
+                :class:`Utils.LogWriter.QueuedWriter`) instead of printed by
+                the calling thread.
+            queue_size (int): Maximum number of queued lines in async mode.
+            overflow_policy (str): Behaviour when the async queue is full:
+                "block", "drop_oldest" or "drop_newest".
+            sinks (Optional[list[LogSink]]): Destinations for formatted lines
+                (see :mod:`Utils.LogSinks`). Each line is formatted once and
+                written to every sink. Defaults to a single stdout
+                :class:`StreamSink`, or to the sinks set with
+                :func:`set_default_sinks`.
+            rate_limiter (Optional[RateLimiter]): Per-call-site rate limiting
+                and sampling applied to messages that pass the level check
+                (see :class:`Utils.LogLimiter.RateLimiter`).
 
 
         Attributes:
             logger_name, logger_level, log_date, log_time, log_name,
             log_level, log_color, prevent_color, logger_debug, log_function
                 Stored configuration used by other methods.
+            sinks (list[LogSink]): Destinations every emitted line is written to.
+            writer (QueuedWriter | None): Background writer in async mode.
+            rate_limiter (RateLimiter | None): Configured rate limiter.
         """
         if logger_debug:
             self.logger_debug = True
@@ -67,11 +312,9 @@ class LoggerClass:
                 f"[Logger_ERROR]; Invalid logger_level {logger_level} for logger {logger_name} setting using default 2")
             logger_level = 0
 
+        # Whether colorama is available is only checked on the first colored
+        # render, see _compile_prefix.
         prevent_color = False
-        if "colorama" in failed_imports and log_color:
-            logger_logger("Color is enabled", logger_name)
-            prevent_color = True
-            log_color = False
 
         self.logger_name = logger_name
         self.logger_level = logger_level
@@ -84,23 +327,88 @@ class LoggerClass:
         self.prevent_color = prevent_color
         self.logger_debug = logger_debug
 
+        self.rate_limiter = rate_limiter
+        if sinks is not None:
+            self.sinks = list(sinks)
+        elif _default_sink_factory is not None:
+            self.sinks = list(_default_sink_factory())
+        else:
+            self.sinks = [StreamSink(auto_flush=async_mode)]
+        self.writer = None
+        if async_mode:
+            from Utils.LogWriter import OVERFLOW_POLICIES, QueuedWriter
+            if overflow_policy not in OVERFLOW_POLICIES:
+                print(
+                    f"[Logger_ERROR]; Invalid overflow_policy {overflow_policy} for logger {logger_name} setting using default block")
+                overflow_policy = "block"
+            self.writer = QueuedWriter(self._write_records, max_size=max(1, queue_size),
+                                       overflow_policy=overflow_policy, name=f"{logger_name}-writer")
+        _live_loggers.add(self)
+
+    def __setattr__(self, name, value):
+        """Set an attribute, dropping compiled prefixes when formatting changes.
+
+        Compiled prefixes bake in the logger name and formatting flags, so
+        assigning any of those after construction must invalidate them.
+        """
+        object.__setattr__(self, name, value)
+        if name in _PREFIX_ATTRIBUTES:
+            object.__setattr__(self, "_compiled_prefix", None)
+            object.__setattr__(self, "_prefix_cache", {})
+
+    def _compile_prefix(self, log_date: bool, log_time: bool, log_name: bool,
+                        log_function: bool, log_level: bool, log_color: bool) -> tuple:
+        """Return the compiled prefix for a set of flags, compiling it on first use.
+
+        Compiled prefixes are memoized per flag combination so that per-call
+        overrides only pay for compilation once.
+
+        Returns:
+            tuple: ``(template, labels, wants_time, wants_function, wants_level)``.
+        """
+        key = (log_date, log_time, log_name, log_function, log_level, log_color)
+        compiled = self._prefix_cache.get(key)
+        if compiled is None:
+            use_color = bool(log_color) and not self.prevent_color
+            if use_color and load_colorama() is None:
+                logger_logger("Color is enabled", self.logger_name)
+                self.prevent_color = True
+                self.log_color = False
+                use_color = False
+            template, labels = compile_prefix(self.logger_name, log_date, log_time, log_name,
+                                              log_function, log_level, use_color)
+            compiled = (template, labels, bool(log_date or log_time), bool(log_function), bool(log_level))
+            self._prefix_cache[key] = compiled
+        return compiled
+
     def _get_caller_name(self) -> str:
         """Return the name of the first caller outside the LoggerClass.
 
-        Uses the inspect stack to find the first frame that is not bound to a
-        LoggerClass instance and returns its function name. If no such frame
-        is found, returns "<module>".
+        Walks raw frames with :func:`find_caller_frame`, skipping frames bound
+        to a LoggerClass instance, and returns the function name of the first
+        other frame. If no such frame is found, returns "<module>".
 
         Returns:
             str: Caller function name or "<module>" when called from top-level.
         """
-        import inspect
-        for frame_info in inspect.stack()[1:]:
-            f_locals = frame_info.frame.f_locals
-            if 'self' in f_locals and isinstance(f_locals['self'], LoggerClass):
-                continue
-            return frame_info.function
-        return "<module>"
+        frame = find_caller_frame()
+        if frame is None:
+            return "<module>"
+        return frame.f_code.co_name
+
+    def _get_caller_location(self) -> str:
+        """Return ``filename:lineno`` of the first caller outside the LoggerClass.
+
+        Uses the same frame walk as :meth:`_get_caller_name`.
+
+        Returns:
+            str: Location of the calling line, or "<unknown>:0" when no caller
+                outside the logger exists.
+        """
+        frame = find_caller_frame()
+        if frame is None:
+            return "<unknown>:0"
+        return f"{frame.f_code.co_filename}:{frame.f_lineno}"
 
     def logger_log(self, msg):
         """Emit an internal logger diagnostic message when internal debugging is enabled.
@@ -114,10 +422,10 @@ class LoggerClass:
         if self.logger_debug:
             logger_logger(msg, logger_name = self.logger_name)
 
-    def construct_prefix(self, message_log_level: int = 1, log_date: Optional[bool] = None,
-                         log_time: Optional[bool] = None, log_name: Optional[bool] = None,
-                         log_level: Optional[bool] = None, log_color: Optional[bool] = None,
-                         log_function: Optional[bool] = None) -> str:
+    def construct_prefix(self, message_log_level: int = 1, log_date: bool | None = None,
+                         log_time: bool | None = None, log_name: bool | None = None,
+                         log_level: bool | None = None, log_color: bool | None = None,
+                         log_function: bool | None = None) -> str:
         """Build the textual prefix used for log messages.
 
         The prefix is composed of optional parts (date/time, logger name,
@@ -125,6 +433,11 @@ class LoggerClass:
         determined by falling back to the instance configuration when the
         corresponding parameter is None.
 
+        The layout is compiled once from the instance flags (see
+        :func:`compile_prefix`), so the common call without overrides is a
+        single template fill. Calls with overrides look up (or compile) the
+        layout for their flag combination first.
+
         Args:
             message_log_level (int): Severity level for the message (0..5).
             log_date (Optional[bool]): Override instance `log_date` if provided.
@@ -137,112 +450,382 @@ class LoggerClass:
         Returns:
             str: Formatted prefix that should be prepended to the log message.
         """
-        if log_date is None:
-            log_date = self.log_date
-        if log_time is None:
-            log_time = self.log_time
-        if log_name is None:
-            log_name = self.log_name
-        if log_level is None:
-            log_level = self.log_level
-        if log_color is None:
-            log_color = self.log_color
-        if log_function is None:
-            log_function = self.log_function
+        if (log_date is None and log_time is None and log_name is None and log_level is None
+                and log_color is None and log_function is None):
+            compiled = self._compiled_prefix
+            if compiled is None:
+                compiled = self._compiled_prefix = self._compile_prefix(
+                    self.log_date, self.log_time, self.log_name,
+                    self.log_function, self.log_level, self.log_color)
+        else:
+            overrides = (log_date, log_time, log_name, log_function, log_level, log_color)
+            compiled = self._compile_prefix(*(getattr(self, flag) if value is None else value
+                                              for flag, value in zip(_PREFIX_FLAGS, overrides)))
+        template, labels, wants_time, wants_function, wants_level = compiled
 
         if message_log_level - 5 > 0:
             logger_logger(f"Encountered invalid message_log_level: {message_log_level} during prefix construction",
                           self.logger_name)
 
-        levels = [" DEBUG ", " VALUE ", "  INFO ", "SUCCESS", "WARNING", " ERROR "]
-        if not self.prevent_color and log_color:
-            levels = [color.Fore.LIGHTWHITE_EX + ' DEBUG ' + color.Fore.RESET,
-                      color.Fore.MAGENTA + ' VALUE ' + color.Fore.RESET,
-                      color.Fore.CYAN + ' INFO ' + color.Fore.RESET,
-                      color.Fore.LIGHTGREEN_EX + 'SUCCESS' + color.Fore.RESET,
-                      color.Fore.YELLOW + 'WARNING' + color.Fore.RESET,
-                      color.Back.RED + color.Style.BRIGHT + color.Fore.BLACK + ' ERROR ' + color.Style.RESET_ALL]
-
-        time = datetime.now()
-        parts = []
-
-        if log_date and log_time:
-            parts.append(f"[{time.strftime('%d-%m-%Y')} {time.strftime('%H:%M:%S')}.{time.microsecond // 1000:03d}]")
-        elif log_date:
-            parts.append(f"[{time.strftime('%d-%m-%Y')}]")
-        elif log_time:
-            parts.append(f"[{time.strftime('%H:%M:%S')}.{time.microsecond // 1000:03d}]")
-        if log_name:
-            parts.append(f"[{self.logger_name}]")
-        if log_function:
-            parts.append(f"[{self._get_caller_name()}]")
-        if log_level:
-            parts.append(f"[{levels[message_log_level]}]")
-        return f"{' '.join(parts)}; "
-
-    def log_message(self, msg: str, log_level: int):
+        if wants_time:
+            now, ms = current_time()
+        else:
+            now = ms = None
+        return template.format(t=now, ms=ms,
+                               func=self._get_caller_name() if wants_function else None,
+                               level=labels[message_log_level] if wants_level else None)
+
+    def is_enabled(self, log_level: int) -> bool:
+        """Return True if a message at `log_level` would be emitted.
+
+        Use this to guard expensive argument computation that lazy messages
+        cannot defer on their own.
+
+        Args:
+            log_level (int): Severity level to check (0..5).
+
+        Returns:
+            bool: True when `log_level` meets the logger threshold.
+        """
+        return log_level >= self.logger_level
+
+    def log_message(self, msg, log_level: int, *args):
         """Log a message to stdout if its level meets the logger threshold.
 
         The message is formatted using :meth:`construct_prefix` and printed to
-        standard output. Messages with `log_level` lower than the instance
-        `logger_level` are discarded.
+        standard output, or queued for the background writer in async mode.
+        Messages with `log_level` lower than the instance
+        `logger_level` are discarded before the message body is rendered (see
+        :func:`render_message`), so discarded calls do no string formatting.
+        Messages suppressed by the rate limiter are discarded the same way;
+        its summaries are emitted ahead of the next message that passes.
 
         Args:
-            msg (str): Message body to log.
+            msg (str | Callable[[], object] | object): Message body to log. A
+                callable is called to produce the body; any other object is
+                converted with ``str()`` when rendered.
             log_level (int): Severity level for the message (0..5).
+            *args: Values merged into the message with ``%`` formatting.
         """
         if log_level < self.logger_level:
             if self.logger_debug: logger_logger(
                 f"log level {log_level} is lower than set logger level {self.logger_level}. Message will be discarded",
                 self.logger_name)
             return
-        log_message = f"{self.construct_prefix(log_level)}{msg}"
-        print(log_message)
+        if self.rate_limiter is not None:
+            summaries = self.rate_limiter.check(log_level)
+            if summaries is None:
+                return
+            for summary_level, summary in summaries:
+                self._emit(summary_level, summary)
+        self._emit(log_level, render_message(msg, args, self.logger_name))
+
+    def _emit(self, log_level: int, body: str):
+        """Prefix a rendered message body and hand it to the sinks or the writer."""
+        log_message = f"{self.construct_prefix(log_level)}{body}"
+        if self.writer is not None:
+            self.writer.put((log_level, log_message))
+        else:
+            self._write_records(((log_level, log_message),))
+
+    def _write_records(self, records):
+        """Fan a batch of ``(log_level, line)`` records out to every sink.
+
+        A failing sink is reported on stderr and does not stop the others.
+        """
+        for sink in self.sinks:
+            try:
+                sink.write(records)
+            except Exception as e:
+                sys.stderr.write(f"[Logger_ERROR]; Sink {sink!r} of logger {self.logger_name} failed: {e}\n")
+
+    def add_sink(self, sink):
+        """Start writing emitted lines to `sink` as well.
+
+        Args:
+            sink (LogSink): Sink to add.
+        """
+        self.sinks = self.sinks + [sink]
+
+    def remove_sink(self, sink):
+        """Stop writing to `sink`. The sink is flushed but not closed.
 
-    def debug(self, msg: str):
+        Args:
+            sink (LogSink): Previously added sink.
+        """
+        self.flush()
+        self.sinks = [s for s in self.sinks if s is not sink]
+        sink.flush()
+
+    def flush(self):
+        """Block until every queued message has been written and flush all sinks."""
+        if self.writer is not None:
+            self.writer.flush()
+        for sink in self.sinks:
+            sink.flush()
+
+    def close(self):
+        """Drain the async writer, then close every sink.
+
+        Async loggers are also drained automatically at interpreter exit;
+        closing is only needed to release sink resources such as files.
+        Pending rate limiter summaries are emitted first.
+        """
+        if self.rate_limiter is not None:
+            for summary_level, summary in self.rate_limiter.drain():
+                self._emit(summary_level, summary)
+        if self.writer is not None:
+            self.writer.close()
+        for sink in self.sinks:
+            sink.close()
+
+    def debug(self, msg, *args):
         """Log a DEBUG level message (level 0).
 
         Args:
-            msg (str): Message body.
+            msg: Message body or callable producing it (see :meth:`log_message`).
+            *args: Values merged into the message with ``%`` formatting.
         """
-        self.log_message(msg, 0)
+        if self.logger_level <= 0 or self.logger_debug:
+            self.log_message(msg, 0, *args)
 
-    def value(self, msg: str):
+    def value(self, msg, *args):
         """Log a VALUE level message (level 1).
 
         Args:
-            msg (str): Message body.
+            msg: Message body or callable producing it (see :meth:`log_message`).
+            *args: Values merged into the message with ``%`` formatting.
         """
-        self.log_message(msg, 1)
+        if self.logger_level <= 1 or self.logger_debug:
+            self.log_message(msg, 1, *args)
 
-    def info(self, msg: str):
+    def info(self, msg, *args):
         """Log an INFO level message (level 2).
 
         Args:
-            msg (str): Message body.
+            msg: Message body or callable producing it (see :meth:`log_message`).
+            *args: Values merged into the message with ``%`` formatting.
         """
-        self.log_message(msg, 2)
+        if self.logger_level <= 2 or self.logger_debug:
+            self.log_message(msg, 2, *args)
 
-    def success(self, msg: str):
+    def success(self, msg, *args):
         """Log a SUCCESS level message (level 3).
 
         Args:
-            msg (str): Message body.
+            msg: Message body or callable producing it (see :meth:`log_message`).
+            *args: Values merged into the message with ``%`` formatting.
         """
-        self.log_message(msg, 3)
+        if self.logger_level <= 3 or self.logger_debug:
+            self.log_message(msg, 3, *args)
 
-    def warning(self, msg):
+    def warning(self, msg, *args):
         """Log a WARNING level message (level 4).
 
         Args:
-            msg: Message body (converted to str when formatted).
+            msg: Message body or callable producing it (see :meth:`log_message`).
+            *args: Values merged into the message with ``%`` formatting.
         """
-        self.log_message(msg, 4)
+        if self.logger_level <= 4 or self.logger_debug:
+            self.log_message(msg, 4, *args)
 
-    def error(self, msg):
+    def error(self, msg, *args):
         """Log an ERROR level message (level 5).
 
         Args:
-            msg: Message body (converted to str when formatted).
+            msg: Message body or callable producing it (see :meth:`log_message`).
+            *args: Values merged into the message with ``%`` formatting.
         """
-        self.log_message(msg, 5)
+        if self.logger_level <= 5 or self.logger_debug:
+            self.log_message(msg, 5, *args)
+
+
+# ======================== Registry ========================
+
+# Registered loggers by dotted name.
+_registry = {}
+# Explicitly configured levels by dotted name; "" is the root.
+_configured_levels = {}
+# _thread.RLock is what threading.RLock returns; importing threading would add
+# several milliseconds to startup.
+_registry_lock = _thread.RLock()
+_env_loaded = False
+
+
+def parse_level(level) -> int:
+    """Convert a level number or name ("DEBUG" .. "ERROR") to an int.
+
+    Args:
+        level (int | str): Level number (0..5), numeric string or level name.
+
+    Returns:
+        int: The level number.
+
+    Raises:
+        ValueError: If `level` is not a known level.
+    """
+    if isinstance(level, str):
+        text = level.strip().upper()
+        if text in LEVEL_NAMES:
+            return LEVEL_NAMES.index(text)
+        if not text.isdigit():
+            raise ValueError(f"Unknown log level {level!r}, expected 0..5 or one of {LEVEL_NAMES}")
+        level = int(text)
+    if not 0 <= level <= 5:
+        raise ValueError(f"Invalid log level {level}, expected 0..5")
+    return level
+
+
+def _load_env_levels():
+    """Apply LOGGER_LEVEL once, before the first registry lookup.
+
+    The variable holds comma separated entries: a bare level sets the root
+    level, ``name=level`` sets the level of a logger subtree. Invalid
+    entries are reported and ignored.
+    """
+    global _env_loaded
+    if _env_loaded:
+        return
+    _env_loaded = True
+    for entry in os.environ.get(LEVEL_ENV_VAR, "").split(","):
+        if not entry.strip():
+            continue
+        name, _, level = entry.rpartition("=")
+        try:
+            _configured_levels[name.strip()] = parse_level(level)
+        except ValueError as e:
+            print(f"[Logger_ERROR]; Ignoring {LEVEL_ENV_VAR} entry {entry!r}: {e}")
+
+
+def get_effective_level(name: str) -> int:
+    """Return the level a registry logger called `name` runs at.
+
+    The nearest configured level wins, looking at `name` itself, then each
+    dotted parent, then the root, then :data:`DEFAULT_LEVEL`.
+
+    Args:
+        name (str): Dotted logger name.
+
+    Returns:
+        int: Effective level (0..5).
+    """
+    with _registry_lock:
+        _load_env_levels()
+        while True:
+            level = _configured_levels.get(name)
+            if level is not None:
+                return level
+            if not name:
+                return DEFAULT_LEVEL
+            name = name.rpartition(".")[0]
+
+
+def get_logger(name: str, **options) -> LoggerClass:
+    """Return the registry logger called `name`, creating it on first use.
+
+    Names are dotted paths ("ioHelper.fileOperations"); levels set with
+    :func:`set_level` on a parent apply to all its descendants. The level of
+    a registry logger is owned by the registry, so changing it at runtime
+    rewrites `logger_level` on every affected logger and the per-message
+    check stays a single comparison.
+
+    Args:
+        name (str): Dotted logger name.
+        **options: Keyword arguments for :class:`LoggerClass` used when the
+            logger is created (ignored afterwards). `logger_name` defaults to
+            `name`; `logger_level` is not accepted.
+
+    Returns:
+        LoggerClass: The shared logger for `name`.
+
+    Raises:
+        TypeError: If `logger_level` is passed in `options`.
+    """
+    logger = _registry.get(name)
+    if logger is not None:
+        return logger
+    if "logger_level" in options:
+        raise TypeError("get_logger() does not accept logger_level, use set_level() instead")
+    with _registry_lock:
+        logger = _registry.get(name)
+        if logger is None:
+            options.setdefault("logger_name", name)
+            logger = LoggerClass(get_effective_level(name), **options)
+            _registry[name] = logger
+        return logger
+
+
+class LazyLogger:
+    """Placeholder for a registry logger that is only created on first use.
+
+    Lets a module declare its logger at import time without constructing it
+    (and without reading LOGGER_LEVEL). The first attribute access calls
+    :func:`get_logger`; methods fetched from the real logger are cached on
+    the placeholder so later calls go straight to them. Attribute
+    assignments are forwarded to the real logger.
+    """
+
+    def __init__(self, name: str, **options):
+        """Remember the arguments for :func:`get_logger`.
+
+        Args:
+            name (str): Dotted logger name.
+            **options: Keyword arguments passed to :func:`get_logger`.
+        """
+        object.__setattr__(self, "_lazy_name", name)
+        object.__setattr__(self, "_lazy_options", options)
+
+    def resolve(self) -> LoggerClass:
+        """Return the real logger, creating it if needed.
+
+        Returns:
+            LoggerClass: The registry logger for this placeholder's name.
+        """
+        return get_logger(self._lazy_name, **self._lazy_options)
+
+    def __getattr__(self, name):
+        value = getattr(self.resolve(), name)
+        if callable(value) and hasattr(LoggerClass, name):
+            object.__setattr__(self, name, value)
+        return value
+
+    def __setattr__(self, name, value):
+        setattr(self.resolve(), name, value)
+
+
+def set_level(name: str | None, level):
+    """Set the level of a logger subtree and apply it to registered loggers now.
+
+    Args:
+        name (Optional[str]): Dotted logger name; None or "" sets the root
+            level used by every logger without a closer configured level.
+        level (int | str): Level number or name (see :func:`parse_level`).
+
+    Raises:
+        ValueError: If `level` is not a known level.
+    """
+    level = parse_level(level)
+    with _registry_lock:
+        _load_env_levels()
+        _configured_levels[name or ""] = level
+        _apply_levels(name or "")
+
+
+def reset_level(name: str | None):
+    """Remove a configured level so the subtree inherits from its parent again.
+
+    Args:
+        name (Optional[str]): Dotted logger name; None or "" resets the root
+            to :data:`DEFAULT_LEVEL`.
+    """
+    with _registry_lock:
+        _load_env_levels()
+        _configured_levels.pop(name or "", None)
+        _apply_levels(name or "")
+
+
+def _apply_levels(prefix: str):
+    """Recompute `logger_level` for registered loggers in the `prefix` subtree."""
+    for name, logger in _registry.items():
+        if not prefix or name == prefix or name.startswith(prefix + "."):
+            logger.logger_level = get_effective_level(name)
@@ -0,0 +1,118 @@
+"""Copy throughput of the fileOperations copy engine across file sizes.
+
+For each file size, copies a file of random data with ``shutil.copy2`` and
+with :func:`ioHelper.fileOperations.copy_file_contents` restricted to each
+mechanism (copy_file_range, sendfile, chunked at several buffer sizes), and
+prints the median throughput. Mechanisms the platform does not support are
+reported as unavailable.
+
+Usage (from the repository root)::
+
+    python benchmarks/copy_throughput.py
+    python benchmarks/copy_throughput.py --sizes 4K 1M 256M --runs 5 --dir /mnt/data
+
+Use ``--dir`` to benchmark a specific filesystem; the default is the system
+temporary directory (often tmpfs, where every mechanism is memory bound).
+"""
+# ======================== Imports ========================
+from __future__ import annotations
+
+import argparse
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("LOGGER_LEVEL", "5")
+
+import ioHelper.fileOperations as fileOperations  # noqa: E402
+
+# ======================== Constants ========================
+
+DEFAULT_SIZES = ("4K", "64K", "1M", "16M", "128M")
+CHUNKED_BUFFER_SIZES = (64 * 1024, fileOperations.COPY_BUFFER_SIZE, 8 * 1024 * 1024)
+_UNITS = {"K": 1024, "M": 1024 ** 2, "G": 1024 ** 3}
+
+
+# ======================== Helpers ========================
+
+def parse_size(text: str) -> int:
+    """Parse sizes like ``4096``, ``64K`` or ``1G`` into bytes."""
+    unit = _UNITS.get(text[-1:].upper())
+    return int(text[:-1]) * unit if unit else int(text)
+
+
+def format_size(size: int) -> str:
+    """Format a byte count with the largest whole unit (``64K``, ``1M``)."""
+    for suffix, unit in sorted(_UNITS.items(), key=lambda item: -item[1]):
+        if size >= unit and size % unit == 0:
+            return f"{size // unit}{suffix}"
+    return str(size)
+
+
+def candidates() -> list:
+    """Return ``(label, copy function)`` pairs to benchmark."""
+    result = [("shutil.copy2", lambda source, target: shutil.copy2(source, target))]
+    for method in ("copy_file_range", "sendfile"):
+        result.append((method, lambda source, target, method=method:
+                       fileOperations.copy_file_contents(source, target, methods=(method,))))
+    for buffer_size in CHUNKED_BUFFER_SIZES:
+        result.append((f"chunked {format_size(buffer_size)}", lambda source, target, buffer_size=buffer_size:
+                       fileOperations.copy_file_contents(source, target, buffer_size, ("chunked",))))
+    result.append(("engine (auto)", lambda source, target: fileOperations.copy_file_contents(source, target)))
+    return result
+
+
+def time_copy(copy, source: str, target: str, runs: int) -> float | None:
+    """Return the median seconds of `runs` copies, or None if unsupported."""
+    times = []
+    for _ in range(runs):
+        if os.path.exists(target):
+            os.unlink(target)
+        started = time.perf_counter()
+        try:
+            copy(source, target)
+        except ValueError:
+            return None
+        times.append(time.perf_counter() - started)
+    return statistics.median(times)
+
+
+# ======================== Main ========================
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", nargs="+", default=DEFAULT_SIZES, help="file sizes, e.g. 4K 1M 1G")
+    parser.add_argument("--runs", type=int, default=5, help="copies per size and mechanism (default 5)")
+    parser.add_argument("--dir", default=None, help="directory to benchmark in (default: system temp)")
+    args = parser.parse_args(argv)
+
+    copies = candidates()
+    print(f"{'size':>6}  " + "  ".join(f"{label:>16}" for label, _ in copies) + "   (MiB/s)")
+    with tempfile.TemporaryDirectory(dir=args.dir) as directory:
+        source = os.path.join(directory, "source.bin")
+        target = os.path.join(directory, "target.bin")
+        for size in map(parse_size, args.sizes):
+            with open(source, "wb") as handle:
+                remaining = size
+                while remaining:
+                    block = os.urandom(min(remaining, 1024 * 1024))
+                    handle.write(block)
+                    remaining -= len(block)
+            cells = []
+            for _, copy in copies:
+                seconds = time_copy(copy, source, target, args.runs)
+                if seconds is None:
+                    cells.append(f"{'unavailable':>16}")
+                else:
+                    cells.append(f"{size / (1024 * 1024) / max(seconds, 1e-9):>16.1f}")
+            print(f"{format_size(size):>6}  " + "  ".join(cells))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,144 @@
+"""Import-time benchmark for the Utils and ioHelper modules.
+
+Imports each module in fresh interpreters with ``python -X importtime``,
+takes the median cumulative import time and checks it against the budget in
+``startup_budget.json`` next to this file. The budget also lists modules that
+must not be imported eagerly (for example colorama).
+
+Usage (from the repository root)::
+
+    python benchmarks/startup.py            # check against the budget
+    python benchmarks/startup.py --update   # rewrite the budget from this machine
+
+Exits with status 1 when a module is over budget or imports a forbidden
+module.
+"""
+# ======================== Imports ========================
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+# ======================== Constants ========================
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+BUDGET_FILE = Path(__file__).resolve().parent / "startup_budget.json"
+MODULES = ("Utils.Logger", "ioHelper.fileOperations")
+# Budget written by --update, relative to the measured median.
+UPDATE_HEADROOM = 1.5
+
+
+# ======================== Measurement ========================
+
+def import_profile(module: str, pycache_dir: str) -> tuple:
+    """Import `module` in a fresh interpreter and parse its -X importtime output.
+
+    Args:
+        module (str): Dotted module name to import.
+        pycache_dir (str): Bytecode cache directory, so runs after the first
+            measure imports rather than compilation.
+
+    Returns:
+        tuple[int, set[str]]: Cumulative import time of `module` in
+            microseconds and the names of all modules imported with it.
+
+    Raises:
+        RuntimeError: If the import fails.
+    """
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-X", f"pycache_prefix={pycache_dir}", "-c", f"import {module}"],
+        cwd=REPO_ROOT, env=env, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr}")
+    cumulative = None
+    imported = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, _, fields = line.partition(":")
+        _, total, name = (field.strip() for field in fields.split("|"))
+        imported.add(name)
+        if name == module:
+            cumulative = int(total)
+    return cumulative, imported
+
+
+def measure(modules, runs: int) -> dict:
+    """Return the median import time and imported modules for each module.
+
+    Args:
+        modules (Iterable[str]): Modules to measure.
+        runs (int): Number of timed imports per module (after one warm-up
+            import that fills the bytecode cache).
+
+    Returns:
+        dict[str, dict]: Per module, ``median_us`` and ``imports``.
+    """
+    results = {}
+    with tempfile.TemporaryDirectory() as pycache_dir:
+        for module in modules:
+            _, imported = import_profile(module, pycache_dir)
+            times = [import_profile(module, pycache_dir)[0] for _ in range(runs)]
+            results[module] = {"median_us": int(statistics.median(times)), "imports": imported}
+    return results
+
+
+# ======================== Budget ========================
+
+def check(results: dict, budget: dict) -> list:
+    """Compare measurements against the budget.
+
+    Args:
+        results (dict): Output of :func:`measure`.
+        budget (dict): Parsed budget file.
+
+    Returns:
+        list[str]: One message per violation; empty when within budget.
+    """
+    failures = []
+    for module, measured in results.items():
+        limits = budget.get(module)
+        if limits is None:
+            continue
+        if measured["median_us"] > limits["max_import_us"]:
+            failures.append(f"{module}: import took {measured['median_us']}us, budget {limits['max_import_us']}us")
+        eager = sorted(name for name in limits.get("forbidden_imports", []) if name in measured["imports"])
+        if eager:
+            failures.append(f"{module}: imports {', '.join(eager)} eagerly")
+    return failures
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=15, help="timed imports per module (default 15)")
+    parser.add_argument("--update", action="store_true", help="rewrite the budget from this run")
+    args = parser.parse_args(argv)
+
+    budget = json.loads(BUDGET_FILE.read_text()) if BUDGET_FILE.exists() else {}
+    results = measure(MODULES, args.runs)
+    for module, measured in results.items():
+        limit = budget.get(module, {}).get("max_import_us", "-")
+        print(f"{module:<28} {measured['median_us']:>8}us  (budget {limit}us)")
+
+    if args.update:
+        for module, measured in results.items():
+            entry = budget.setdefault(module, {"forbidden_imports": []})
+            entry["max_import_us"] = int(measured["median_us"] * UPDATE_HEADROOM)
+        BUDGET_FILE.write_text(json.dumps(budget, indent=4) + "\n")
+        print(f"Budget written to {BUDGET_FILE}")
+        return 0
+
+    failures = check(results, budget)
+    for failure in failures:
+        print(f"REGRESSION: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,393 @@
+"""Benchmark suite for ioHelper.fileOperations and Utils.Logger.
+
+Builds deterministic synthetic trees (see ``tree_generator.py``) in a
+temporary directory and times:
+
+* listing: ``list_files``, ``iter_files``, ``list_subdirectories`` and
+  ``inventory_tree`` on wide, deep and bushy trees, serial, parallel and
+  with the listing cache;
+* transfers: single ``copy_file``/``move_file``/``rename_file`` and bulk
+  ``copy_files``/``move_files``;
+* logging: messages at every level with colour and caller lookup on and
+  off, filtered messages, and ``construct_prefix``.
+
+Each benchmark runs ``--runs`` times; the median and minimum time per
+operation are reported. Results can be written to JSON and compared with a
+saved baseline: a benchmark whose median is more than ``--threshold`` slower
+is flagged as a regression and the script exits with status 1.
+
+Usage (from the repository root)::
+
+    python benchmarks/suite.py --output baseline.json
+    python benchmarks/suite.py --compare baseline.json
+    python benchmarks/suite.py --only "logger.*" --runs 9
+    python benchmarks/suite.py --input current.json --compare baseline.json   # compare saved results
+
+Timings are only comparable between runs on the same machine and
+filesystem (see ``--dir``).
+"""
+# ======================== Imports ========================
+from __future__ import annotations
+
+import argparse
+import fnmatch
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("LOGGER_LEVEL", "5")
+
+import ioHelper.fileOperations as fileOperations  # noqa: E402
+import Utils.Logger  # noqa: E402
+from Utils.LogSinks import LogSink  # noqa: E402
+from tree_generator import generate_shape  # noqa: E402
+
+# ======================== Constants ========================
+
+RESULTS_VERSION = 1
+DEFAULT_RUNS = 5
+# A benchmark this much slower than its baseline is a regression.
+DEFAULT_THRESHOLD = 0.10
+# Operations timed together in one sample for benchmarks of cheap calls.
+SMALL_OPS = 200
+LOGGER_MESSAGES = 5000
+LEVEL_METHODS = ("debug", "value", "info", "success", "warning", "error")
+
+# ======================== Registry ========================
+BENCHMARKS = {}
+
+
+def benchmark(name: str):
+    """Register a benchmark function ``function(context) -> result`` under `name`."""
+    def register(function):
+        BENCHMARKS[name] = function
+        return function
+    return register
+
+
+class Context:
+
+    def __init__(self, directory: Path, runs: int):
+        """Shared state of one suite run.
+
+        Args:
+            directory (pathlib.Path): Scratch directory for trees and copies.
+            runs (int): Samples taken per benchmark.
+        """
+        self.directory = directory
+        self.runs = runs
+        self._trees = {}
+
+    def tree(self, shape: str) -> Path:
+        """Return the root of the preset tree `shape`, generating it on first use."""
+        root = self._trees.get(shape)
+        if root is None:
+            root = self._trees[shape] = self.directory / "trees" / shape
+            generate_shape(root, shape)
+        return root
+
+    def scratch(self, name: str) -> Path:
+        """Return an empty scratch directory called `name`."""
+        path = self.directory / "scratch" / name
+        shutil.rmtree(path, ignore_errors=True)
+        path.mkdir(parents=True)
+        return path
+
+    def time(self, function, ops: int = 1, setup=None) -> dict:
+        """Time `function` over `runs` samples of `ops` operations each.
+
+        Args:
+            function (Callable[[], object]): Performs `ops` operations.
+            ops (int): Operations per call, to report time per operation.
+            setup (Callable[[], object] | None): Untimed preparation before
+                each sample.
+
+        Returns:
+            dict: ``median_s`` and ``min_s`` per operation, ``ops`` and ``runs``.
+        """
+        samples = []
+        for _ in range(self.runs):
+            if setup is not None:
+                setup()
+            started = time.perf_counter()
+            function()
+            samples.append((time.perf_counter() - started) / ops)
+        return {"median_s": statistics.median(samples), "min_s": min(samples), "ops": ops, "runs": self.runs}
+
+
+def tree_files(root: Path) -> list:
+    """Return every file under `root`, sorted."""
+    return sorted(fileOperations.iter_files(root, recursive=True))
+
+
+# ======================== Listing ========================
+
+@benchmark("listing.list_files.wide")
+def bench_list_files_wide(context: Context) -> dict:
+    root = context.tree("wide")
+    return context.time(lambda: fileOperations.list_files(root))
+
+
+@benchmark("listing.iter_files.recursive.deep")
+def bench_iter_files_deep(context: Context) -> dict:
+    root = context.tree("deep")
+    return context.time(lambda: list(fileOperations.iter_files(root, recursive=True)))
+
+
+@benchmark("listing.iter_files.recursive.small")
+def bench_iter_files_small(context: Context) -> dict:
+    root = context.tree("small")
+    return context.time(lambda: list(fileOperations.iter_files(root, recursive=True)))
+
+
+@benchmark("listing.iter_files.parallel.small")
+def bench_iter_files_parallel(context: Context) -> dict:
+    root = context.tree("small")
+    return context.time(lambda: list(fileOperations.iter_files(root, recursive=True, workers=4, ordered=False)))
+
+
+@benchmark("listing.list_subdirectories.recursive.deep")
+def bench_list_subdirectories_deep(context: Context) -> dict:
+    root = context.tree("deep")
+    return context.time(lambda: fileOperations.list_subdirectories(root, recursive=True))
+
+
+@benchmark("listing.inventory_tree.small")
+def bench_inventory_tree(context: Context) -> dict:
+    root = context.tree("small")
+    return context.time(lambda: fileOperations.inventory_tree(root))
+
+
+@benchmark("listing.cached.iter_files.small")
+def bench_cached_iter_files(context: Context) -> dict:
+    root = context.tree("small")
+    fileOperations.enable_listing_cache()
+    try:
+        list(fileOperations.iter_files(root, recursive=True))
+        return context.time(lambda: list(fileOperations.iter_files(root, recursive=True)))
+    finally:
+        fileOperations.disable_listing_cache()
+
+
+# ======================== Transfers ========================
+
+@benchmark("copy.single.small")
+def bench_copy_small(context: Context) -> dict:
+    source = tree_files(context.tree("wide"))[0]
+    target = context.scratch("copy_small") / "target.dat"
+
+    def run():
+        for _ in range(SMALL_OPS):
+            fileOperations.copy_file(source, target, replace_existing_target_file=True)
+    return context.time(run, SMALL_OPS)
+
+
+@benchmark("copy.single.large")
+def bench_copy_large(context: Context) -> dict:
+    source = tree_files(context.tree("large"))[0]
+    target = context.scratch("copy_large") / "target.dat"
+    result = context.time(lambda: fileOperations.copy_file(source, target, replace_existing_target_file=True))
+    result["bytes"] = source.stat().st_size
+    return result
+
+
+@benchmark("move.single")
+def bench_move(context: Context) -> dict:
+    directory = context.scratch("move")
+    first, second = directory / "a.dat", directory / "b" / "a.dat"
+    first.write_bytes(b"x" * 1024)
+    second.parent.mkdir()
+
+    def run():
+        for _ in range(SMALL_OPS // 2):
+            fileOperations.move_file(first, second)
+            fileOperations.move_file(second, first)
+    return context.time(run, SMALL_OPS // 2 * 2)
+
+
+@benchmark("rename.single")
+def bench_rename(context: Context) -> dict:
+    directory = context.scratch("rename")
+    first, second = directory / "a.dat", directory / "b.dat"
+    first.write_bytes(b"x" * 1024)
+
+    def run():
+        for _ in range(SMALL_OPS // 2):
+            fileOperations.rename_file(first, second.name)
+            fileOperations.rename_file(second, first.name)
+    return context.time(run, SMALL_OPS // 2 * 2)
+
+
+@benchmark("copy.bulk.small")
+def bench_copy_bulk(context: Context) -> dict:
+    root = context.tree("small")
+    target_root = context.scratch("copy_bulk")
+    pairs = [(path, target_root / path.relative_to(root)) for path in tree_files(root)]
+    return context.time(lambda: fileOperations.copy_files(pairs, replace_existing_target_file=True), len(pairs))
+
+
+@benchmark("move.bulk.small")
+def bench_move_bulk(context: Context) -> dict:
+    source_root = context.scratch("move_bulk_source")
+    target_root = context.scratch("move_bulk_target")
+    generate_shape(source_root, "small")
+    forward = [(path, target_root / path.relative_to(source_root)) for path in tree_files(source_root)]
+    backward = [(target, source) for source, target in forward]
+
+    def run():
+        fileOperations.move_files(forward)
+        fileOperations.move_files(backward)
+    return context.time(run, len(forward) * 2)
+
+
+# ======================== Logger ========================
+class NullSink(LogSink):
+    """Sink that discards every record, so only formatting is measured."""
+
+    def write(self, records) -> None:
+        pass
+
+
+def make_logger(level: int, color: bool, caller: bool) -> Utils.Logger.LoggerClass:
+    """Return an unregistered logger at `level` writing to a NullSink."""
+    return Utils.Logger.LoggerClass(level, logger_name="BenchmarkLogger", log_color=color,
+                                    log_function=caller, sinks=[NullSink()])
+
+
+def _logger_benchmark(level: int, color: bool, caller: bool):
+    def run_benchmark(context: Context) -> dict:
+        method = getattr(make_logger(level, color, caller), LEVEL_METHODS[level])
+
+        def run():
+            for index in range(LOGGER_MESSAGES):
+                method("message %s", index)
+        return context.time(run, LOGGER_MESSAGES)
+    return run_benchmark
+
+
+for _level, _method in enumerate(LEVEL_METHODS):
+    for _color in (False, True):
+        for _caller in (False, True):
+            benchmark(f"logger.{_method}.color-{'on' if _color else 'off'}.caller-{'on' if _caller else 'off'}")(
+                _logger_benchmark(_level, _color, _caller))
+
+
+@benchmark("logger.filtered")
+def bench_logger_filtered(context: Context) -> dict:
+    debug = make_logger(5, False, False).debug
+
+    def run():
+        for index in range(LOGGER_MESSAGES):
+            debug("message %s", index)
+    return context.time(run, LOGGER_MESSAGES)
+
+
+@benchmark("logger.construct_prefix")
+def bench_construct_prefix(context: Context) -> dict:
+    construct_prefix = make_logger(0, True, True).construct_prefix
+
+    def run():
+        for _ in range(LOGGER_MESSAGES):
+            construct_prefix(2)
+    return context.time(run, LOGGER_MESSAGES)
+
+
+# ======================== Results ========================
+
+def run_benchmarks(names: list, directory: str | None, runs: int) -> dict:
+    """Run the benchmarks `names` and return the results document."""
+    results = {}
+    with tempfile.TemporaryDirectory(dir=directory) as scratch:
+        context = Context(Path(scratch), runs)
+        for name in names:
+            results[name] = BENCHMARKS[name](context)
+            print(f"{name:<48} {format_seconds(results[name]['median_s']):>10}", file=sys.stderr)
+    return {
+        "version": RESULTS_VERSION,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "runs": runs,
+        "results": results,
+    }
+
+
+def format_seconds(seconds: float) -> str:
+    """Format a duration with a unit that keeps three significant digits."""
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3g} {unit}"
+    return f"{seconds / 1e-9:.3g} ns"
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> list:
+    """Compare the medians of two results documents.
+
+    Returns:
+        list[tuple[str, float, float, float, str]]: ``(name, baseline_s,
+            current_s, change, verdict)`` for benchmarks present in both, where
+            `change` is the relative difference and `verdict` is
+            "regression", "improvement" or "".
+    """
+    rows = []
+    for name, result in current["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            continue
+        change = result["median_s"] / base["median_s"] - 1 if base["median_s"] else 0.0
+        verdict = "regression" if change > threshold else "improvement" if change < -threshold else ""
+        rows.append((name, base["median_s"], result["median_s"], change, verdict))
+    return rows
+
+
+# ======================== Main ========================
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--only", nargs="+", metavar="PATTERN", help="run benchmarks matching these globs")
+    parser.add_argument("--list", action="store_true", help="list benchmark names and exit")
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS, help=f"samples per benchmark (default {DEFAULT_RUNS})")
+    parser.add_argument("--dir", default=None, help="directory to benchmark in (default: system temp)")
+    parser.add_argument("--output", help="write results to this JSON file")
+    parser.add_argument("--input", help="use results from this JSON file instead of running")
+    parser.add_argument("--compare", metavar="BASELINE", help="compare with a saved results file")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help=f"relative slowdown flagged as a regression (default {DEFAULT_THRESHOLD})")
+    args = parser.parse_args(argv)
+
+    names = [name for name in BENCHMARKS
+             if args.only is None or any(fnmatch.fnmatchcase(name, pattern) for pattern in args.only)]
+    if args.list:
+        print("\n".join(names))
+        return 0
+
+    if args.input:
+        current = json.loads(Path(args.input).read_text())
+    else:
+        current = run_benchmarks(names, args.dir, args.runs)
+    if args.output:
+        Path(args.output).write_text(json.dumps(current, indent=2) + "\n")
+
+    if not args.compare:
+        return 0
+    baseline = json.loads(Path(args.compare).read_text())
+    rows = compare(baseline, current, args.threshold)
+    print(f"{'benchmark':<48} {'baseline':>10} {'current':>10} {'change':>8}")
+    for name, base, now, change, verdict in rows:
+        print(f"{name:<48} {format_seconds(base):>10} {format_seconds(now):>10} {change:>+8.1%}  {verdict}")
+    regressions = [row[0] for row in rows if row[4] == "regression"]
+    if regressions:
+        print(f"{len(regressions)} regression(s) over {args.threshold:.0%}: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,87 @@
+"""Filesystem call counts for move_file/copy_file.
+
+Runs each transfer scenario in a temporary directory under
+:func:`ioHelper.instrumentation.measure`, which counts calls to the ``os``
+functions that reach the kernel (stat family, rename, unlink, mkdir, open,
+...), including calls that fail. pathlib and shutil call these through the
+``os`` module, so their calls are counted too. Each scenario has a maximum
+number of stat-family and total calls; exceeding one is reported as a
+regression.
+
+Usage (from the repository root)::
+
+    python benchmarks/transfer_syscalls.py
+
+Exits with status 1 when a scenario makes more calls than allowed.
+"""
+# ======================== Imports ========================
+import os
+import sys
+import tempfile
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("LOGGER_LEVEL", "5")
+
+import ioHelper.fileOperations as fileOperations  # noqa: E402
+from ioHelper import instrumentation  # noqa: E402
+
+# ======================== Constants ========================
+
+STAT_CALLS = ("stat", "lstat", "fstat")
+# Scenario -> (max stat-family calls, max counted calls).
+SCENARIOS = {
+    "move": (2, 3),
+    "move, replace target": (2, 3),
+    "move, create parent": (3, 6),
+    "move, verify": (4, 5),
+    "copy": (4, 11),
+    "copy, replace target": (4, 12),
+    "copy, verify": (5, 12),
+}
+
+
+# ======================== Counting ========================
+
+def run_scenario(name: str, directory: Path) -> Counter:
+    """Prepare and run one scenario in `directory`; return its call counts."""
+    source = directory / "source.bin"
+    source.write_bytes(os.urandom(64 * 1024))
+    target = directory / "target.bin"
+    if "replace" in name:
+        target.write_bytes(b"old")
+    if "create parent" in name:
+        target = directory / "new" / "target.bin"
+    with instrumentation.measure() as stats:
+        # Looked up inside the block, where the module functions are instrumented.
+        operation = fileOperations.move_file if name.startswith("move") else fileOperations.copy_file
+        ok = operation(source, target, True, False, verify="verify" in name)
+    if not ok:
+        raise RuntimeError(f"Scenario {name!r} failed")
+    return Counter({call: calls for call, (calls, _) in stats.fs_calls.items()})
+
+
+def main() -> int:
+    # Warm-up pass, so lazy imports and logger setup are not counted.
+    for name in SCENARIOS:
+        with tempfile.TemporaryDirectory() as directory:
+            run_scenario(name, Path(directory))
+    failures = []
+    print(f"{'scenario':<24} {'stat':>5} {'total':>6}  calls")
+    for name, (max_stat, max_total) in SCENARIOS.items():
+        with tempfile.TemporaryDirectory() as directory:
+            counter = run_scenario(name, Path(directory))
+        stat_calls = sum(counter[call] for call in STAT_CALLS)
+        total = sum(counter.values())
+        details = ", ".join(f"{call}={count}" for call, count in sorted(counter.items()))
+        print(f"{name:<24} {stat_calls:>5} {total:>6}  {details}")
+        if stat_calls > max_stat or total > max_total:
+            failures.append(f"{name}: {stat_calls} stat / {total} total calls, allowed {max_stat} / {max_total}")
+    for failure in failures:
+        print(f"REGRESSION: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
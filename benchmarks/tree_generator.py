@@ -0,0 +1,114 @@
+"""Deterministic synthetic directory trees for the benchmarks.
+
+A tree is described by its depth, the number of subdirectories per directory
+(fanout), the number of files per directory and an average file size. Names,
+sizes and contents come from a seeded random generator, so the same shape
+and seed always produce byte-identical trees.
+
+Usage (from the repository root)::
+
+    python benchmarks/tree_generator.py /tmp/tree --shape deep
+    python benchmarks/tree_generator.py /tmp/tree --depth 3 --fanout 4 --files 50 --size 4K
+"""
+# ======================== Imports ========================
+import argparse
+import os
+import random
+import sys
+from pathlib import Path
+
+# ======================== Constants ========================
+
+# Preset shapes used by the benchmark suite.
+SHAPES = {
+    # One directory with many small files.
+    "wide": {"depth": 0, "fanout": 0, "files": 2000, "size": 1024},
+    # A binary tree of directories, few files each.
+    "deep": {"depth": 8, "fanout": 2, "files": 3, "size": 1024},
+    # A bushy tree of small files.
+    "small": {"depth": 3, "fanout": 4, "files": 20, "size": 512},
+    # A few large files.
+    "large": {"depth": 1, "fanout": 2, "files": 2, "size": 8 * 1024 * 1024},
+}
+DEFAULT_SEED = 0
+# File sizes vary by up to this fraction around the requested size.
+SIZE_JITTER = 0.5
+_UNITS = {"K": 1024, "M": 1024 ** 2, "G": 1024 ** 3}
+
+
+# ======================== Generator ========================
+
+def generate_tree(root, depth: int, fanout: int, files: int, size: int, seed: int = DEFAULT_SEED) -> dict:
+    """Create a synthetic tree under `root`.
+
+    Every directory, including `root`, gets `files` files; directories above
+    `depth` get `fanout` subdirectories each. Existing files are overwritten.
+
+    Args:
+        root (str | pathlib.Path): Directory to fill; created if missing.
+        depth (int): Levels of subdirectories below `root`.
+        fanout (int): Subdirectories per directory.
+        files (int): Files per directory.
+        size (int): Average file size in bytes.
+        seed (int): Seed for names, sizes and contents.
+
+    Returns:
+        dict[str, int]: ``directories``, ``files`` and ``bytes`` created.
+    """
+    rng = random.Random(seed)
+    counts = {"directories": 0, "files": 0, "bytes": 0}
+    pending = [(Path(root), 0)]
+    while pending:
+        directory, level = pending.pop()
+        directory.mkdir(parents=True, exist_ok=True)
+        counts["directories"] += 1
+        for index in range(files):
+            file_size = max(0, round(size * (1 + rng.uniform(-SIZE_JITTER, SIZE_JITTER))))
+            (directory / f"file_{index:05d}.dat").write_bytes(rng.randbytes(file_size))
+            counts["files"] += 1
+            counts["bytes"] += file_size
+        if level < depth:
+            pending.extend((directory / f"dir_{index:03d}", level + 1) for index in reversed(range(fanout)))
+    return counts
+
+
+def generate_shape(root, shape: str, seed: int = DEFAULT_SEED) -> dict:
+    """Create the preset tree `shape` (a key of SHAPES) under `root`.
+
+    Returns:
+        dict[str, int]: As for :func:`generate_tree`.
+    """
+    return generate_tree(root, seed=seed, **SHAPES[shape])
+
+
+def parse_size(text: str) -> int:
+    """Parse sizes like ``4096``, ``64K`` or ``1G`` into bytes."""
+    unit = _UNITS.get(text[-1:].upper())
+    return int(text[:-1]) * unit if unit else int(text)
+
+
+# ======================== Main ========================
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("root", help="directory to create the tree in")
+    parser.add_argument("--shape", choices=sorted(SHAPES), help="preset shape (other options override it)")
+    parser.add_argument("--depth", type=int, help="levels of subdirectories")
+    parser.add_argument("--fanout", type=int, help="subdirectories per directory")
+    parser.add_argument("--files", type=int, help="files per directory")
+    parser.add_argument("--size", type=parse_size, help="average file size, e.g. 512 or 4K")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="random seed (default 0)")
+    args = parser.parse_args(argv)
+
+    options = dict(SHAPES[args.shape or "small"])
+    for option in options:
+        if getattr(args, option) is not None:
+            options[option] = getattr(args, option)
+    counts = generate_tree(args.root, seed=args.seed, **options)
+    print(f"{os.path.abspath(args.root)}: {counts['directories']} directories, "
+          f"{counts['files']} files, {counts['bytes']} bytes")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
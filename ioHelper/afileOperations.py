@@ -0,0 +1,342 @@
+# ======================== Imports ========================
+from __future__ import annotations
+
+import asyncio
+import functools
+import itertools
+import os
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from ioHelper import fileOperations
+
+# ======================== Constants ========================
+
+DEFAULT_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+# Operations submitted to the pool at once, per event loop, as a multiple of
+# its workers; further calls wait on the loop without occupying the queue.
+PENDING_PER_WORKER = 2
+# Paths handed from a scan thread to the event loop at a time.
+DEFAULT_BATCH_SIZE = 256
+# Concurrent transfers per copy_files/move_files call.
+DEFAULT_TRANSFER_LIMIT = 16
+
+# ======================== Executor ========================
+_executor = None
+_max_workers = DEFAULT_MAX_WORKERS
+_executor_lock = threading.Lock()
+# One semaphore per running event loop (asyncio primitives are bound to a loop).
+_limiters = weakref.WeakKeyDictionary()
+
+
+def configure(max_workers: int = DEFAULT_MAX_WORKERS):
+    """Set the size of the shared thread pool.
+
+    The current pool, if any, finishes its queued work in the background and
+    a new one is created on next use.
+
+    Args:
+        max_workers (int): Threads running blocking file operations.
+    """
+    global _executor, _max_workers
+    if max_workers < 1:
+        raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+    with _executor_lock:
+        old, _executor, _max_workers = _executor, None, max_workers
+    _limiters.clear()
+    if old is not None:
+        old.shutdown(wait=False)
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Return the shared thread pool, creating it on first use."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=_max_workers, thread_name_prefix="afileOperations")
+    return _executor
+
+
+def _limiter() -> asyncio.Semaphore:
+    """Return the running loop's bound on operations submitted to the pool."""
+    loop = asyncio.get_running_loop()
+    limiter = _limiters.get(loop)
+    if limiter is None:
+        limiter = _limiters[loop] = asyncio.Semaphore(_max_workers * PENDING_PER_WORKER)
+    return limiter
+
+
+async def run_blocking(function, *args, **kwargs):
+    """Run a blocking callable on the shared pool and return its result.
+
+    Every function in this module goes through here, so file operations
+    never block the event loop. At most ``PENDING_PER_WORKER * max_workers``
+    calls per event loop are handed to the pool at once; the rest wait on
+    the loop, so thousands of concurrent calls neither grow the pool's
+    queue without bound nor starve the loop.
+
+    Cancelling a call that has not started yet removes it from the pool's
+    queue. A call already running in a thread cannot be interrupted and
+    finishes in the background (see :func:`copy_file_resumable` for a
+    transfer that stops early).
+
+    Args:
+        function (Callable): Blocking function.
+        *args: Positional arguments for `function`.
+        **kwargs: Keyword arguments for `function`.
+
+    Returns:
+        Any: What `function` returns.
+    """
+    async with _limiter():
+        return await asyncio.get_running_loop().run_in_executor(
+            _get_executor(), functools.partial(function, *args, **kwargs))
+
+
+# ======================== Checks ========================
+
+async def check_is_directory(target_directory: Path) -> bool:
+    """Async :func:`ioHelper.fileOperations.check_is_directory`."""
+    return await run_blocking(fileOperations.check_is_directory, target_directory)
+
+
+async def check_directory_exists(target_directory: Path) -> bool:
+    """Async :func:`ioHelper.fileOperations.check_directory_exists`."""
+    return await run_blocking(fileOperations.check_directory_exists, target_directory)
+
+
+async def check_file_exists(file_path) -> bool:
+    """Async :func:`ioHelper.fileOperations.check_file_exists`."""
+    return await run_blocking(fileOperations.check_file_exists, file_path)
+
+
+# ======================== Listing ========================
+
+async def _iterate(generator, batch_size: int):
+    """Drive a blocking generator on the pool, yielding its items on the loop.
+
+    Items are pulled `batch_size` at a time by one pool call. Closing the
+    async iterator (or cancelling the task consuming it) closes the
+    generator, which stops the walk.
+    """
+    # A cancelled batch may still be running in a thread when the generator
+    # is closed; the lock makes the close wait for it.
+    lock = threading.Lock()
+
+    def next_batch():
+        with lock:
+            return list(itertools.islice(generator, batch_size))
+
+    def close():
+        with lock:
+            generator.close()
+
+    try:
+        while True:
+            batch = await run_blocking(next_batch)
+            for item in batch:
+                yield item
+            if len(batch) < batch_size:
+                return
+    finally:
+        # Close on the pool: closing a parallel walk joins its threads.
+        await asyncio.shield(run_blocking(close))
+
+
+def iter_subdirectories(root_path, recursive: bool = False, max_depth: int | None = None,
+                        follow_symlinks: bool = False, scan_filter=None, workers: int | None = None,
+                        ordered: bool = True, batch_size: int = DEFAULT_BATCH_SIZE):
+    """Async iterator over :func:`ioHelper.fileOperations.iter_subdirectories`.
+
+    Args:
+        root_path, recursive, max_depth, follow_symlinks, scan_filter, workers, ordered:
+            As for the blocking function.
+        batch_size (int): Paths fetched per pool call.
+
+    Returns:
+        AsyncIterator[pathlib.Path]: Directories in walk order.
+    """
+    return _iterate(fileOperations.iter_subdirectories(root_path, recursive, max_depth, follow_symlinks,
+                                                       scan_filter, workers, ordered), batch_size)
+
+
+def iter_files(root_path, recursive: bool = False, max_depth: int | None = None,
+               follow_symlinks: bool = False, scan_filter=None, workers: int | None = None,
+               ordered: bool = True, batch_size: int = DEFAULT_BATCH_SIZE):
+    """Async iterator over :func:`ioHelper.fileOperations.iter_files`.
+
+    Args:
+        root_path, recursive, max_depth, follow_symlinks, scan_filter, workers, ordered:
+            As for the blocking function.
+        batch_size (int): Paths fetched per pool call.
+
+    Returns:
+        AsyncIterator[pathlib.Path]: Files in walk order.
+    """
+    return _iterate(fileOperations.iter_files(root_path, recursive, max_depth, follow_symlinks,
+                                              scan_filter, workers, ordered), batch_size)
+
+
+async def list_subdirectories(root_path, recursive: bool = False, follow_symlinks: bool = False,
+                              scan_filter=None, workers: int | None = None, ordered: bool = True) -> list:
+    """Async :func:`ioHelper.fileOperations.list_subdirectories`."""
+    return await run_blocking(fileOperations.list_subdirectories, root_path, recursive, follow_symlinks,
+                              scan_filter, workers, ordered)
+
+
+async def list_files(root_path, scan_filter=None) -> list:
+    """Async :func:`ioHelper.fileOperations.list_files`."""
+    return await run_blocking(fileOperations.list_files, root_path, scan_filter)
+
+
+# ======================== File Operations ========================
+
+async def create_file(file_path, replace_existing: bool = False) -> bool:
+    """Async :func:`ioHelper.fileOperations.create_file`."""
+    return await run_blocking(fileOperations.create_file, file_path, replace_existing)
+
+
+async def remove_file(file_path) -> bool:
+    """Async :func:`ioHelper.fileOperations.remove_file`."""
+    return await run_blocking(fileOperations.remove_file, file_path)
+
+
+async def rename_file(file_path, name: str, replace_existing_file: bool = False) -> bool:
+    """Async :func:`ioHelper.fileOperations.rename_file`."""
+    return await run_blocking(fileOperations.rename_file, file_path, name, replace_existing_file)
+
+
+async def move_file(source_file_path, target_file_path, replace_existing_target_file: bool = False,
+                    create_file_if_not_exist: bool = False, verify: bool = False) -> bool:
+    """Async :func:`ioHelper.fileOperations.move_file`."""
+    return await run_blocking(fileOperations.move_file, source_file_path, target_file_path,
+                              replace_existing_target_file, create_file_if_not_exist, verify)
+
+
+async def copy_file(source_file_path, target_file_path, replace_existing_target_file: bool = False,
+                    create_file_if_not_exist: bool = False, verify: bool = False) -> bool:
+    """Async :func:`ioHelper.fileOperations.copy_file`."""
+    return await run_blocking(fileOperations.copy_file, source_file_path, target_file_path,
+                              replace_existing_target_file, create_file_if_not_exist, verify)
+
+
+class CopyCancelled(Exception):
+    """Raised inside a resumable copy whose awaiting task was cancelled."""
+
+
+async def copy_file_resumable(source_file_path, target_file_path, replace_existing_target_file: bool = False,
+                              progress=None, **options) -> bool:
+    """Async :func:`ioHelper.fileOperations.copy_file_resumable`, cancellable mid-copy.
+
+    When the awaiting task is cancelled, the copy stops at the next progress
+    callback (every `progress_bytes` or `progress_seconds`, as for the
+    blocking function) and keeps its checkpoint, so a later call resumes it.
+    Pass a smaller `progress_bytes` to notice cancellation sooner.
+
+    Args:
+        source_file_path, target_file_path, replace_existing_target_file:
+            As for the blocking function.
+        progress (Callable[[int, int], None] | None): Progress callback; it
+            runs in a pool thread.
+        **options: Other keyword arguments of the blocking function, such
+            as `progress_bytes` and `progress_seconds`.
+
+    Returns:
+        bool: True on success, False on failure.
+    """
+    cancelled = threading.Event()
+
+    def check_progress(copied: int, total: int):
+        if cancelled.is_set():
+            raise CopyCancelled(f"copy to {target_file_path} was cancelled")
+        if progress is not None:
+            progress(copied, total)
+
+    future = asyncio.ensure_future(run_blocking(
+        fileOperations.copy_file_resumable, source_file_path, target_file_path,
+        replace_existing_target_file, check_progress, **options))
+    try:
+        return await asyncio.shield(future)
+    except asyncio.CancelledError:
+        cancelled.set()
+        raise
+
+
+async def _transfer_files(pairs, operation: str, replace_existing: bool, limit: int, verify: bool) -> list:
+    """Shared implementation of :func:`copy_files` and :func:`move_files`."""
+    items = [(source if isinstance(source, Path) else Path(source),
+              target if isinstance(target, Path) else Path(target)) for source, target in pairs]
+    results = [None] * len(items)
+
+    def make_parents() -> dict:
+        errors = {}
+        for parent in {target.parent for _, target in items}:
+            try:
+                parent.mkdir(parents=True, exist_ok=True)
+            except OSError as e:
+                errors[parent] = e
+        return errors
+
+    parent_errors = await run_blocking(make_parents)
+    pending = iter(range(len(items)))
+
+    async def worker():
+        for index in pending:
+            source, target = items[index]
+            error = parent_errors.get(target.parent)
+            if error is not None:
+                results[index] = fileOperations.TransferResult(source, target, False, error)
+                continue
+            results[index] = await run_blocking(fileOperations._transfer_result, source, target,
+                                                operation, replace_existing, verify)
+
+    # `limit` workers share one iterator, so no task is created per item.
+    await asyncio.gather(*(worker() for _ in range(max(1, min(limit, len(items))))))
+    for source, target in items:
+        fileOperations._invalidate_parents(source, target, target.parent)
+    return results
+
+
+async def copy_files(pairs, replace_existing_target_file: bool = False, limit: int = DEFAULT_TRANSFER_LIMIT,
+                     verify: bool = False) -> list:
+    """Copy many files, at most `limit` at a time.
+
+    Like :func:`ioHelper.fileOperations.copy_files`, on the shared pool.
+    Cancelling stops starting new copies.
+
+    Args:
+        pairs (Iterable[tuple[str | pathlib.Path, str | pathlib.Path]]):
+            ``(source, target)`` file paths.
+        replace_existing_target_file (bool): If True allow overwriting
+            existing targets.
+        limit (int): Maximum copies in flight for this call.
+        verify (bool): Check each target's size after copying.
+
+    Returns:
+        list[TransferResult]: One result per pair, in input order.
+    """
+    return await _transfer_files(pairs, "copy", replace_existing_target_file, limit, verify)
+
+
+async def move_files(pairs, replace_existing_target_file: bool = False, limit: int = DEFAULT_TRANSFER_LIMIT,
+                     verify: bool = False) -> list:
+    """Move many files, at most `limit` at a time.
+
+    Like :func:`ioHelper.fileOperations.move_files`, on the shared pool.
+    Cancelling stops starting new moves.
+
+    Args:
+        pairs (Iterable[tuple[str | pathlib.Path, str | pathlib.Path]]):
+            ``(source, target)`` file paths.
+        replace_existing_target_file (bool): If True allow overwriting
+            existing targets.
+        limit (int): Maximum moves in flight for this call.
+        verify (bool): Check each move's result.
+
+    Returns:
+        list[TransferResult]: One result per pair, in input order.
+    """
+    return await _transfer_files(pairs, "move", replace_existing_target_file, limit, verify)
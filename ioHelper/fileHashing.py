@@ -0,0 +1,333 @@
+# ======================== Imports ========================
+from __future__ import annotations
+
+import hashlib
+import marshal
+import os
+import threading
+from pathlib import Path
+
+import Utils.Logger
+
+# ======================== Initialization ========================
+log = Utils.Logger.LazyLogger("ioHelper.fileHashing", logger_name="FileHashingLogger", log_color=True)
+
+# ======================== Constants ========================
+
+DEFAULT_ALGORITHM = "blake2b"
+# Read size when streaming a file into the hash.
+HASH_CHUNK_SIZE = 1024 * 1024
+# Size of the first and last blocks hashed by the second duplicate stage.
+EDGE_BLOCK_SIZE = 64 * 1024
+# Hashing threads; hashlib releases the GIL while hashing large buffers.
+DEFAULT_HASH_WORKERS = min(32, (os.cpu_count() or 1) * 2)
+HASH_CACHE_VERSION = 2
+
+
+# ======================== Hashing ========================
+
+def hash_file(path, algorithm: str = DEFAULT_ALGORITHM, chunk_size: int = HASH_CHUNK_SIZE,
+              use_mmap: bool = False) -> bytes:
+    """Return the digest of a file's content.
+
+    The file is streamed through one reusable buffer of `chunk_size` bytes,
+    or with `use_mmap` mapped and hashed in one call (fewer copies for large
+    files on fast storage).
+
+    Args:
+        path (str | pathlib.Path): File to hash.
+        algorithm (str): Any name accepted by ``hashlib.new``.
+        chunk_size (int): Read size when streaming.
+        use_mmap (bool): Hash a memory map of the file instead.
+
+    Returns:
+        bytes: The digest.
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    digest = hashlib.new(algorithm)
+    with open(path, "rb", buffering=0) as handle:
+        if use_mmap:
+            import mmap
+            try:
+                with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    digest.update(mapped)
+                return digest.digest()
+            except ValueError:
+                # Empty files cannot be mapped.
+                pass
+        buffer = bytearray(chunk_size)
+        view = memoryview(buffer)
+        while read := handle.readinto(buffer):
+            digest.update(view[:read])
+    return digest.digest()
+
+
+def hash_file_edges(path, algorithm: str = DEFAULT_ALGORITHM, block_size: int = EDGE_BLOCK_SIZE) -> bytes:
+    """Return a digest of a file's size, first block and last block.
+
+    Cheap pre-filter for duplicate detection: files that differ in either
+    block cannot be identical. For files of up to two blocks the whole
+    content is covered, so the result is as good as a full hash.
+
+    Args:
+        path (str | pathlib.Path): File to hash.
+        algorithm (str): Any name accepted by ``hashlib.new``.
+        block_size (int): Bytes read from each end.
+
+    Returns:
+        bytes: The digest.
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    digest = hashlib.new(algorithm)
+    with open(path, "rb", buffering=0) as handle:
+        size = os.fstat(handle.fileno()).st_size
+        digest.update(size.to_bytes(8, "little"))
+        digest.update(os.pread(handle.fileno(), block_size, 0))
+        if size > block_size:
+            tail_offset = max(block_size, size - block_size)
+            digest.update(os.pread(handle.fileno(), size - tail_offset, tail_offset))
+    return digest.digest()
+
+
+def _hash_task(path: str, kind: str, algorithm: str, use_mmap: bool, block_size: int) -> bytes:
+    """Hash one file for a pool; module-level so process pools can pickle it."""
+    if kind == "edges":
+        return hash_file_edges(path, algorithm, block_size)
+    return hash_file(path, algorithm, use_mmap=use_mmap)
+
+
+# ======================== Hash Cache ========================
+class HashCache:
+
+    def __init__(self, path=None):
+        """Digests of files keyed by (device, inode, size, mtime_ns).
+
+        A file whose inode, size and modification time are unchanged is
+        assumed unchanged and never read again. Entries are also keyed by
+        algorithm and hash kind ("full" or "edges"), and edge digests by
+        their block size. With a `path`, the cache
+        is loaded from that file and written back by :meth:`save`; an
+        unreadable file starts an empty cache.
+
+        Args:
+            path (str | pathlib.Path | None): Cache file, or None for an
+                in-memory cache.
+
+        Attributes:
+            hits (int): Lookups answered from the cache.
+            misses (int): Lookups that were not.
+        """
+        self.path = Path(path) if path is not None else None
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._dirty = False
+        if self.path is not None:
+            self._load()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    @staticmethod
+    def key(file_stat: os.stat_result, kind: str, algorithm: str, block_size: int = EDGE_BLOCK_SIZE) -> tuple:
+        """Return the cache key of a file with stat result `file_stat`."""
+        if kind == "edges":
+            kind = f"edges/{block_size}"
+        return (file_stat.st_dev, file_stat.st_ino, file_stat.st_size, file_stat.st_mtime_ns, kind, algorithm)
+
+    def get(self, file_stat: os.stat_result, kind: str = "full", algorithm: str = DEFAULT_ALGORITHM,
+            block_size: int = EDGE_BLOCK_SIZE) -> bytes | None:
+        """Return the cached digest for `file_stat`, or None."""
+        digest = self.entries.get(self.key(file_stat, kind, algorithm, block_size))
+        if digest is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return digest
+
+    def put(self, file_stat: os.stat_result, digest: bytes, kind: str = "full", algorithm: str = DEFAULT_ALGORITHM,
+            block_size: int = EDGE_BLOCK_SIZE):
+        """Store `digest` for the file with stat result `file_stat`."""
+        with self._lock:
+            self.entries[self.key(file_stat, kind, algorithm, block_size)] = digest
+            self._dirty = True
+
+    def save(self):
+        """Write the cache to its file atomically, if it changed."""
+        if self.path is None or not self._dirty:
+            return
+        with self._lock:
+            data = marshal.dumps((HASH_CACHE_VERSION, list(self.entries), list(self.entries.values())))
+            self._dirty = False
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = self.path.with_name(self.path.name + ".tmp")
+        temporary.write_bytes(data)
+        os.replace(temporary, self.path)
+
+    def _load(self):
+        """Fill the cache from its file, ignoring a missing or unreadable one."""
+        try:
+            version, keys, digests = marshal.loads(self.path.read_bytes())
+        except (OSError, EOFError, ValueError, TypeError):
+            return
+        if version == HASH_CACHE_VERSION:
+            self.entries = dict(zip(map(tuple, keys), digests))
+
+
+# ======================== Bulk Hashing ========================
+
+def _stat_files(paths) -> list:
+    """Return ``(path, stat)`` for every regular file among `paths`."""
+    import stat
+    files = []
+    for path in paths:
+        path = path if isinstance(path, Path) else Path(path)
+        try:
+            file_stat = os.stat(path)
+        except OSError as e:
+            log.debug("cannot stat %s: %s", path, e)
+            continue
+        if stat.S_ISREG(file_stat.st_mode):
+            files.append((path, file_stat))
+    return files
+
+
+def _hash_stated(files: list, kind: str, algorithm: str, workers: int | None, cache: HashCache,
+                 use_processes: bool, use_mmap: bool, block_size: int) -> dict:
+    """Hash ``(path, stat)`` pairs on a pool, reusing and filling `cache`.
+
+    Hard links to one inode are read once. Files that cannot be read are
+    logged and left out.
+
+    Returns:
+        dict[pathlib.Path, bytes]: Digest per path.
+    """
+    digests = {}
+    pending = {}
+    for path, file_stat in files:
+        digest = cache.get(file_stat, kind, algorithm, block_size)
+        if digest is not None:
+            digests[path] = digest
+        else:
+            pending.setdefault(HashCache.key(file_stat, kind, algorithm, block_size), []).append((path, file_stat))
+    if not pending:
+        return digests
+    if use_processes:
+        from concurrent.futures import ProcessPoolExecutor as Executor
+    else:
+        from concurrent.futures import ThreadPoolExecutor as Executor
+    with Executor(max_workers=workers or DEFAULT_HASH_WORKERS) as pool:
+        futures = {pool.submit(_hash_task, str(links[0][0]), kind, algorithm, use_mmap, block_size): links
+                   for links in pending.values()}
+        for future, links in futures.items():
+            try:
+                digest = future.result()
+            except OSError as e:
+                log.debug("cannot hash %s: %s", links[0][0], e)
+                continue
+            cache.put(links[0][1], digest, kind, algorithm, block_size)
+            for path, _ in links:
+                digests[path] = digest
+    return digests
+
+
+def hash_files(paths, algorithm: str = DEFAULT_ALGORITHM, workers: int | None = None,
+               cache: HashCache | None = None, use_processes: bool = False, use_mmap: bool = False) -> dict:
+    """Hash many files in parallel.
+
+    Args:
+        paths (Iterable[str | pathlib.Path]): Files to hash; directories and
+            other non-regular files are skipped.
+        algorithm (str): Any name accepted by ``hashlib.new``.
+        workers (int | None): Pool size; defaults to DEFAULT_HASH_WORKERS.
+        cache (HashCache | None): Digests to reuse and extend. It is saved
+            afterwards if it has a file.
+        use_processes (bool): Use a process pool instead of threads (for
+            algorithms that hold the GIL).
+        use_mmap (bool): Hash memory maps instead of streaming.
+
+    Returns:
+        dict[pathlib.Path, bytes]: Digest per readable file.
+    """
+    cache = cache if cache is not None else HashCache()
+    digests = _hash_stated(_stat_files(paths), "full", algorithm, workers, cache, use_processes, use_mmap,
+                           EDGE_BLOCK_SIZE)
+    cache.save()
+    return digests
+
+
+def find_duplicates(paths, algorithm: str = DEFAULT_ALGORITHM, workers: int | None = None,
+                    cache: HashCache | None = None, min_size: int = 1, use_processes: bool = False,
+                    use_mmap: bool = False, block_size: int = EDGE_BLOCK_SIZE) -> list:
+    """Find files with identical content, reading as little as possible.
+
+    Works in stages, each only on the files still in a group of two or
+    more:
+
+    1. group by size (stat only);
+    2. group by a hash of the first and last `block_size` bytes;
+    3. group by a full content hash (skipped for files of up to two blocks,
+       which stage 2 already covered completely).
+
+    Args:
+        paths (str | pathlib.Path | Iterable[str | pathlib.Path]): A
+            directory (searched recursively) or the files to compare.
+        algorithm (str): Any name accepted by ``hashlib.new``.
+        workers (int | None): Pool size; defaults to DEFAULT_HASH_WORKERS.
+        cache (HashCache | None): Digests to reuse and extend. It is saved
+            afterwards if it has a file.
+        min_size (int): Ignore smaller files (empty files by default).
+        use_processes (bool): Use a process pool instead of threads.
+        use_mmap (bool): Hash memory maps instead of streaming.
+        block_size (int): Bytes read from each end in stage 2.
+
+    Returns:
+        list[list[pathlib.Path]]: Groups of identical files, each sorted,
+            largest files first.
+    """
+    if isinstance(paths, (str, Path)):
+        from ioHelper.fileOperations import iter_files
+        paths = iter_files(paths, recursive=True)
+    cache = cache if cache is not None else HashCache()
+
+    by_size = {}
+    for path, file_stat in _stat_files(paths):
+        if file_stat.st_size >= min_size:
+            by_size.setdefault(file_stat.st_size, []).append((path, file_stat))
+    candidates = [file for group in by_size.values() if len(group) > 1 for file in group]
+    log.debug("duplicates: %s files share a size with another file", len(candidates))
+
+    edges = _hash_stated(candidates, "edges", algorithm, workers, cache, use_processes, use_mmap, block_size)
+    by_edges = {}
+    for path, file_stat in candidates:
+        if path in edges:
+            by_edges.setdefault((file_stat.st_size, edges[path]), []).append((path, file_stat))
+    groups = []
+    to_hash = []
+    for (size, _), group in by_edges.items():
+        if len(group) < 2:
+            continue
+        if size <= 2 * block_size:
+            groups.append([path for path, _ in group])
+        else:
+            to_hash.extend(group)
+    log.debug("duplicates: %s files need a full hash", len(to_hash))
+
+    full = _hash_stated(to_hash, "full", algorithm, workers, cache, use_processes, use_mmap, block_size)
+    by_full = {}
+    for path, file_stat in to_hash:
+        if path in full:
+            by_full.setdefault((file_stat.st_size, full[path]), []).append(path)
+    groups.extend(group for group in by_full.values() if len(group) > 1)
+    cache.save()
+
+    sizes = {path: file_stat.st_size for path, file_stat in candidates}
+    groups = [sorted(group) for group in groups]
+    groups.sort(key=lambda group: (-sizes[group[0]], group[0]))
+    log.info("found %s groups of duplicate files", len(groups))
+    return groups
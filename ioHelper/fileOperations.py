@@ -1,9 +1,19 @@
-from pathlib import *
-import shutil
+from __future__ import annotations
+
+import errno
+import itertools
+import os
+import stat
+from pathlib import Path
 import Utils.Logger
+from ioHelper.scanFilter import ScanFilter
+from ioHelper.treeInventory import TreeInventory
+from ioHelper.treeWalker import entry_is_dir, walk_tree
 
 # ======================== Initialization ========================
-log = Utils.Logger.LoggerClass(logger_name="FileOperationsLogger",logger_level = 0,log_color = True)
+# Level comes from the logger registry (LOGGER_LEVEL or Utils.Logger.set_level).
+# The logger itself is created on first use.
+log = Utils.Logger.LazyLogger("ioHelper.fileOperations", logger_name="FileOperationsLogger", log_color=True)
 
 
 # ======================== Common Utils ========================
@@ -17,10 +27,74 @@ def convert_string_to_path(path: str):
     Returns:
         pathlib.Path: Path object representing the given path.
     """
-    log.debug(f"Converting {path} to Path object")
+    log.debug("Converting %s to Path object", path)
     return Path(path)
 
 
+# ======================== Listing Cache ========================
+# Opt-in cache of directory listings used by the listing functions.
+_listing_cache = None
+
+
+def enable_listing_cache(max_entries: int | None = None):
+    """Serve directory listings from a :class:`ioHelper.listingCache.ListingCache`.
+
+    Afterwards :func:`list_files`, :func:`list_subdirectories`, the
+    ``iter_*`` functions and :func:`inventory_tree` stat each directory and
+    reuse its previous listing when the directory is unchanged. The
+    functions in this module that modify files invalidate the affected
+    directories. Calling it again replaces the cache.
+
+    Args:
+        max_entries (int | None): Directories kept (LRU); defaults to
+            ``ListingCache``'s default.
+
+    Returns:
+        ListingCache: The cache, for statistics and invalidation.
+    """
+    global _listing_cache
+    from ioHelper.listingCache import DEFAULT_MAX_ENTRIES, ListingCache
+    _listing_cache = ListingCache(max_entries or DEFAULT_MAX_ENTRIES)
+    log.debug("listing cache enabled (%s entries)", _listing_cache.max_entries)
+    return _listing_cache
+
+
+def disable_listing_cache():
+    """Stop caching directory listings and drop the cache."""
+    global _listing_cache
+    _listing_cache = None
+
+
+def invalidate_listing_cache(path=None):
+    """Drop the cached listing of directory `path` (all when None).
+
+    Needed only after changing directories without this module, on
+    filesystems whose timestamps are too coarse to notice the change.
+
+    Args:
+        path (str | pathlib.Path | None): Directory to forget.
+    """
+    if _listing_cache is not None:
+        _listing_cache.invalidate(path)
+
+
+def listing_cache_stats() -> dict | None:
+    """Return the listing cache's counters, or None when it is disabled.
+
+    Returns:
+        dict | None: See :meth:`ioHelper.listingCache.ListingCache.stats`.
+    """
+    return _listing_cache.stats() if _listing_cache is not None else None
+
+
+def _invalidate_parents(*paths):
+    """Invalidate the cached listings of the directories containing `paths`."""
+    cache = _listing_cache
+    if cache is not None:
+        for path in paths:
+            cache.invalidate(os.path.dirname(os.path.abspath(path)))
+
+
 # ======================== Directory Utils ========================#
 
 def check_is_directory(target_directory: Path)-> bool:
@@ -33,9 +107,9 @@ def check_is_directory(target_directory: Path)-> bool:
         bool: True if the path exists and is a directory, False otherwise.
     """
     is_dir= target_directory.is_dir()
-    log.debug(f"{target_directory} is directory = {is_dir}")
+    log.debug("%s is directory = %s", target_directory, is_dir)
     if not is_dir:
-        log.info(f"{target_directory} is not a directory or does not exist")
+        log.info("%s is not a directory or does not exist", target_directory)
         return False
     return True
 
@@ -50,62 +124,272 @@ def check_directory_exists(target_directory: Path):
         bool: True if the path exists, False otherwise.
     """
     if not target_directory.exists():
-        log.debug(f"target directory does not exist. Target directory: ({target_directory})")
+        log.debug("target directory does not exist. Target directory: (%s)", target_directory)
         return False
     return True
 
 
-def list_subdirectories(root_path,recursive: bool = False):
+def _log_scan_error(error: OSError):
+    """Report a subdirectory that could not be scanned during a walk."""
+    log.debug("skipping unreadable directory: %s", error)
+
+
+def _start_walk(root: Path, recursive: bool, follow_symlinks: bool, max_depth: int | None = None,
+                scan_filter: ScanFilter | None = None, workers: int | None = None, ordered: bool = True):
+    """Start a :func:`walk_tree` over `root`, scanning `root` immediately.
+
+    Args:
+        root (pathlib.Path): Directory to walk.
+        recursive (bool): Walk the whole tree instead of only `root`.
+        follow_symlinks (bool): Descend into symlinked directories.
+        max_depth (int | None): Deepest directory level to scan when
+            recursive (`root` is level 0); None means unlimited.
+        scan_filter (ScanFilter | None): Filter whose prune rules decide
+            which subdirectories are skipped.
+        workers (int | None): Use
+            :func:`ioHelper.parallelWalker.walk_tree_parallel` with this many
+            threads; None walks serially.
+        ordered (bool): With `workers`, yield in sorted order rather than
+            completion order.
+
+    Returns:
+        Iterator[tuple[str, list[os.DirEntry]]]: The walk.
+
+    Raises:
+        OSError: If `root` does not exist, is not a directory or cannot be
+            read.
+    """
+    prune = scan_filter.prunes if scan_filter is not None and scan_filter.prune_pattern is not None else None
+    scanner = _listing_cache.scan if _listing_cache is not None else None
+    if workers is None:
+        walker = walk_tree(str(root), recursive, follow_symlinks, on_error=_log_scan_error,
+                           max_depth=max_depth, prune=prune, scanner=scanner)
+    else:
+        from ioHelper.parallelWalker import walk_tree_parallel
+        walker = walk_tree_parallel(str(root), workers, recursive, follow_symlinks, on_error=_log_scan_error,
+                                    max_depth=max_depth, prune=prune, ordered=ordered, scanner=scanner)
+    return itertools.chain((next(walker),), walker)
+
+
+def iter_subdirectories(root_path, recursive: bool = False, max_depth: int | None = None,
+                        follow_symlinks: bool = False, scan_filter: ScanFilter | None = None,
+                        workers: int | None = None, ordered: bool = True):
+    """Yield subdirectories under a root path while the tree is being scanned.
+
+    Built on :func:`ioHelper.treeWalker.walk_tree`: each directory is read
+    with one ``os.scandir`` call and entry types come from the scan, so no
+    per-entry stat is needed (except for symlinks). Symlinks to directories
+    are yielded; they are only descended into when `follow_symlinks` is
+    True. Unreadable subdirectories are skipped.
+
+    Results are produced directory by directory, so the first paths are
+    available before the walk finishes and breaking out of the loop stops
+    the walk.
+
+    Args:
+        root_path (str | pathlib.Path): Root path to search for subdirectories.
+        recursive (bool): If True, include nested subdirectories (default False).
+        max_depth (int | None): When recursive, the deepest directory level
+            whose subdirectories are yielded; `root_path` is level 0, so 0
+            yields only its immediate subdirectories. None means unlimited.
+        follow_symlinks (bool): If True, recurse into symlinked directories
+            (symlink loops are skipped).
+        scan_filter (ScanFilter | None): Rules evaluated on each scanned
+            entry before a Path is built; pruned directories are not
+            descended into.
+        workers (int | None): Scan up to this many directories in parallel
+            threads (useful on network mounts); None scans serially.
+        ordered (bool): With `workers`, yield in sorted, deterministic order
+            (default) instead of as directories finish scanning.
+
+    Yields:
+        pathlib.Path: Directories found under `root_path`, in walk order.
+            Nothing is yielded when `root_path` is invalid.
+    """
+    root = root_path if isinstance(root_path, Path) else Path(root_path)
+    try:
+        walker = _start_walk(root, recursive, follow_symlinks, max_depth, scan_filter, workers, ordered)
+    except FileNotFoundError:
+        log.debug("search path does not exist: %s", root)
+        return
+    except NotADirectoryError:
+        log.debug("search path is not a directory: %s", root)
+        return
+    except OSError as e:
+        log.debug("search path cannot be read: %s (%s)", root, e)
+        return
+    for _, entries in walker:
+        for entry in entries:
+            if entry_is_dir(entry) and (scan_filter is None or scan_filter.matches(entry, True)):
+                yield Path(entry.path)
+
+
+def list_subdirectories(root_path, recursive: bool = False, follow_symlinks: bool = False,
+                        scan_filter: ScanFilter | None = None, workers: int | None = None,
+                        ordered: bool = True):
     """List subdirectories under a root path.
 
     This function accepts either a Path or a string for `root_path`. If the
     path does not exist or is not a directory an empty list is returned.
+    Thin wrapper collecting :func:`iter_subdirectories`.
 
     Args:
         root_path (str | pathlib.Path): Root path to search for subdirectories.
         recursive (bool): If True, include nested subdirectories (default False).
+        follow_symlinks (bool): If True, recurse into symlinked directories
+            (symlink loops are skipped).
+        scan_filter (ScanFilter | None): Filter applied during the scan (see
+            :class:`ioHelper.scanFilter.ScanFilter`).
+        workers (int | None): Number of threads scanning directories in
+            parallel; None scans serially.
+        ordered (bool): With `workers`, return directories in sorted
+            pre-order (default) instead of completion order.
 
     Returns:
         list[pathlib.Path]: List of Path objects pointing to directories found
             under `root_path`. Returns an empty list when `root_path` is
             invalid.
     """
-    root = root_path if isinstance(root_path, Path) else Path(root_path)
-    if not root.exists():
-        log.debug(f"search path does not exist: {root}")
-        return []
-    if not root.is_dir():
-        log.debug(f"search path is not a directory: {root}")
-        return []
+    dirs = list(iter_subdirectories(root_path, recursive, follow_symlinks=follow_symlinks, scan_filter=scan_filter,
+                                    workers=workers, ordered=ordered))
     if recursive:
-        dirs = [p for p in root.rglob('*') if p.is_dir()]
-        log.debug(f"found {len(dirs)} directories under {root} (recursive)")
-        return dirs
-    dirs = [p for p in root.iterdir() if p.is_dir()]
-    log.debug(f"found {len(dirs)} immediate directories under {root}")
+        log.debug("found %s directories under %s (recursive)", len(dirs), root_path)
+    else:
+        log.debug("found %s immediate directories under %s", len(dirs), root_path)
     return dirs
 
 
+def inventory_tree(root_path, with_stat: bool = False, follow_symlinks: bool = False,
+                   scan_filter: ScanFilter | None = None, workers: int | None = None):
+    """Record every directory and file under `root_path` in a single walk.
+
+    Replaces calling :func:`list_subdirectories` followed by
+    :func:`list_files` for each directory, which reads every directory
+    twice. Entries are classified like those functions (symlinks to
+    directories count as directories) and stored in a columnar
+    :class:`ioHelper.treeInventory.TreeInventory` rather than as Path
+    objects.
+
+    Args:
+        root_path (str | pathlib.Path): Root directory to inventory.
+        with_stat (bool): Also record file size and mtime. Costs one stat
+            per file on platforms whose directory scan does not provide them
+            (e.g. Linux).
+        follow_symlinks (bool): If True, recurse into symlinked directories
+            (symlink loops are skipped).
+        scan_filter (ScanFilter | None): Filter for recorded files; pruned
+            directories are neither recorded nor descended into. Other rules
+            do not apply to directories, so every file keeps its parent.
+        workers (int | None): Number of threads scanning directories in
+            parallel (in completion order); None scans serially.
+
+    Returns:
+        TreeInventory | None: The inventory, or None when `root_path` does
+            not exist, is not a directory or cannot be read.
+    """
+    root = root_path if isinstance(root_path, Path) else Path(root_path)
+    try:
+        walker = _start_walk(root, True, follow_symlinks, scan_filter=scan_filter, workers=workers, ordered=False)
+    except FileNotFoundError:
+        log.debug("search path does not exist: %s", root)
+        return None
+    except NotADirectoryError:
+        log.debug("search path is not a directory: %s", root)
+        return None
+    except OSError as e:
+        log.debug("search path cannot be read: %s (%s)", root, e)
+        return None
+    inventory = TreeInventory(str(root), with_stat)
+    # Index of each directory that the walk has yet to reach.
+    pending = {str(root): 0}
+    for directory, entries in walker:
+        parent = pending.pop(directory)
+        for entry in entries:
+            if entry_is_dir(entry):
+                if scan_filter is None or not scan_filter.prunes(entry):
+                    pending[entry.path] = inventory.add_directory(entry.name, parent)
+            elif scan_filter is not None and not scan_filter.matches(entry, False):
+                continue
+            elif with_stat:
+                try:
+                    entry_stat = entry.stat()
+                except OSError:
+                    inventory.add_file(entry.name, parent)
+                else:
+                    inventory.add_file(entry.name, parent, entry_stat.st_size, entry_stat.st_mtime_ns)
+            else:
+                inventory.add_file(entry.name, parent)
+    log.debug("found %s directories and %s files under %s (inventory)",
+              inventory.dir_count, inventory.file_count, root)
+    return inventory
+
+
 # ======================== File Utils ========================
 
-def list_files(root_path):
+def iter_files(root_path, recursive: bool = False, max_depth: int | None = None,
+               follow_symlinks: bool = False, scan_filter: ScanFilter | None = None,
+               workers: int | None = None, ordered: bool = True):
+    """Yield non-directory entries under `root_path` while it is being scanned.
+
+    Reads each directory with a single ``os.scandir`` call and classifies
+    entries from the scan results. Results are produced directory by
+    directory, so consumers can start on the first files before the walk
+    finishes, and breaking out of the loop stops the walk.
+
+    Args:
+        root_path (str | pathlib.Path): Directory to list files from.
+        recursive (bool): If True, also yield files in nested directories.
+        max_depth (int | None): When recursive, the deepest directory level
+            whose files are yielded; `root_path` is level 0. None means
+            unlimited.
+        follow_symlinks (bool): If True, recurse into symlinked directories
+            (symlink loops are skipped).
+        scan_filter (ScanFilter | None): Rules evaluated on each scanned
+            entry before a Path is built; pruned directories are not
+            descended into.
+        workers (int | None): Scan up to this many directories in parallel
+            threads (useful on network mounts); None scans serially.
+        ordered (bool): With `workers`, yield in sorted, deterministic order
+            (default) instead of as directories finish scanning.
+
+    Yields:
+        pathlib.Path: File paths in walk order. Nothing is yielded when
+            `root_path` does not exist or is not a directory.
+    """
+    root = root_path if isinstance(root_path,Path) else Path(root_path)
+    try:
+        walker = _start_walk(root, recursive, follow_symlinks, max_depth, scan_filter, workers, ordered)
+    except FileNotFoundError:
+        log.debug("search path does not exist: %s", root)
+        return
+    except NotADirectoryError:
+        log.debug("search path is not a directory: %s", root)
+        return
+    except OSError as e:
+        log.debug("search path cannot be read: %s (%s)", root, e)
+        return
+    for _, entries in walker:
+        for entry in entries:
+            if not entry_is_dir(entry) and (scan_filter is None or scan_filter.matches(entry, False)):
+                yield Path(entry.path)
+
+
+def list_files(root_path, scan_filter: ScanFilter | None = None):
     """List non-directory entries directly under `root_path`.
 
+    Thin wrapper collecting :func:`iter_files`.
+
     Args:
         root_path (str | pathlib.Path): Directory to list files from.
+        scan_filter (ScanFilter | None): Filter applied during the scan (see
+            :class:`ioHelper.scanFilter.ScanFilter`).
 
     Returns:
         list[pathlib.Path]: List of file Path objects. Returns an empty list if
             `root_path` does not exist or is not a directory.
     """
-    root = root_path if isinstance(root_path,Path) else Path(root_path)
-    if not root.exists():
-        log.debug(f"search path does not exist: {root}")
-    if not root.is_dir():
-        log.debug(f"search path is not a directory: {root}")
-        return []
-    files= [f for f in root.iterdir() if not f.is_dir()]
-    log.debug(f"found {len(files)} files under {root}")
+    files = list(iter_files(root_path, scan_filter=scan_filter))
+    log.debug("found %s files under %s", len(files), root_path)
     return files
 
 def check_file_exists(file_path) -> bool:
@@ -120,10 +404,10 @@ def check_file_exists(file_path) -> bool:
     """
     file_path = file_path if isinstance(file_path, Path) else Path(file_path)
     if not file_path.exists():
-        log.debug(f"File does not exist at path: {file_path}")
+        log.debug("File does not exist at path: %s", file_path)
         return False
     if file_path.is_dir():
-        log.debug(f"Requested file is a directory: {file_path}")
+        log.debug("Requested file is a directory: %s", file_path)
         return False
     return True
 
@@ -141,17 +425,18 @@ def remove_file(file_path) -> bool:
           False. FileNotFoundError is handled internally.
     """
     file_path = file_path if isinstance(file_path, Path) else Path(file_path)
-    log.info(f"Trying to remove file: {file_path}")
+    log.info("Trying to remove file: %s", file_path)
     try:
         file_path.unlink()
     except FileNotFoundError:
-        log.error(f"Tried to remove file: {file_path} but file does not exist")
+        log.error("Tried to remove file: %s but file does not exist", file_path)
         return False
+    _invalidate_parents(file_path)
     if not file_path.exists():
-        log.success(f"Successfully removed {file_path}")
+        log.success("Successfully removed %s", file_path)
         return True
     else:
-        log.error(f"Failed to remove file: {file_path}")
+        log.error("Failed to remove file: %s", file_path)
         return False
 
 def create_file(file_path,replace_existing: bool = False)-> bool :
@@ -167,100 +452,210 @@ def create_file(file_path,replace_existing: bool = False)-> bool :
             on error.
     """
     file_path = file_path if isinstance(file_path, Path) else Path(file_path)
-    log.info(f"Trying to create file: {file_path}")
+    log.info("Trying to create file: %s", file_path)
     if file_path.exists() and not replace_existing:
-        log.error(f"File: {file_path} already exists and replace files is: False.")
+        log.error("File: %s already exists and replace files is: False.", file_path)
         return False
     if file_path.exists():
-        log.info(f"File: {file_path} already exists and will be replaced")
+        log.info("File: %s already exists and will be replaced", file_path)
     try:
         file_path.touch()
     except Exception as e:
-        log.error(f"Failed to create file due to: {e}")
+        log.error("Failed to create file due to: %s", e)
         return False
-    log.success(f"File: {file_path} was successfully replaced")
+    _invalidate_parents(file_path)
+    log.success("File: %s was successfully replaced", file_path)
     return True
 
+def _stat_or_none(path: Path):
+    """Return ``os.stat(path)``, or None if nothing exists at `path`."""
+    try:
+        return os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+def _replace_or_move(source: Path, target: Path):
+    """Move `source` to `target`, atomically when both are on one filesystem.
+
+    Tries ``os.replace`` (a single rename that also replaces an existing
+    target) and falls back to ``shutil.move`` for cross-device moves.
+    """
+    try:
+        os.replace(source, target)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        import shutil
+        shutil.move(str(source), str(target))
+
+
+def _copy_with_metadata(source: Path, target: Path, buffer_size: int | None = None) -> int:
+    """Copy `source` to `target` like ``shutil.copy2``.
+
+    Data goes through :func:`copy_file_contents`; permission bits, times,
+    flags and extended attributes are then copied with ``shutil.copystat``.
+
+    Returns:
+        int: Number of bytes copied.
+    """
+    import shutil
+    copied = copy_file_contents(source, target, buffer_size or COPY_BUFFER_SIZE)[0]
+    shutil.copystat(source, target)
+    return copied
+
+
+def _same_entry(source: Path, target: Path) -> bool:
+    """Return True if `source` and `target` name the same directory entry."""
+    try:
+        return source.name == target.name and os.path.samestat(os.stat(source.parent), os.stat(target.parent))
+    except OSError:
+        return False
+
+
+def _hard_linked(source: Path, target: Path, source_stat: os.stat_result) -> bool:
+    """Return True if `source` and `target` are two hard links of one file.
+
+    Only meaningful once both stat as the same file; a symlink on either
+    side means the paths merely resolve to it.
+    """
+    if source_stat.st_nlink < 2:
+        return False
+    try:
+        return not (stat.S_ISLNK(os.lstat(source).st_mode) or stat.S_ISLNK(os.lstat(target).st_mode))
+    except OSError:
+        return False
+
+
 def _transfer_file(source_file_path, target_file_path, operation: str,
                    replace_existing_target_file: bool = False,
-                   create_file_if_not_exist: bool = False) -> bool:
+                   create_file_if_not_exist: bool = False, verify: bool = False) -> bool:
     """Internal helper to move or copy files with shared validation.
 
     This centralizes common checks (existence, directory checks, parent
-    directory creation) and dispatches to shutil.move or shutil.copy2.
+    directory creation) and dispatches the operation. Source and target
+    are stat'ed once each and the results are reused for every check.
+    Moves use ``os.replace``, which renames within a filesystem and
+    replaces an existing target atomically; only cross-device moves fall
+    back to ``shutil.move``. A move between two hard links of one file
+    removes the source name. Copies go through :func:`_copy_with_metadata`
+    (:func:`copy_file_contents`, then ``shutil.copystat``) into a new
+    target file. The target's parent directory is only created when the
+    operation fails because it is missing.
 
     Args:
         source_file_path (str | pathlib.Path): Source file path.
         target_file_path (str | pathlib.Path): Destination file path.
         operation (str): Either "move" or "copy".
         replace_existing_target_file (bool): If True and the target exists,
-            it will be removed before the operation.
+            it is replaced (atomically for same-filesystem moves).
         create_file_if_not_exist (bool): If True and the source does not
             exist, an empty target file will be created (uses
             `create_file`) and the function returns True.
+        verify (bool): Stat source and target again after the operation to
+            confirm it took effect (costs one or two extra stat calls).
 
     Returns:
         bool: True on success, False on failure.
     """
     source = source_file_path if isinstance(source_file_path, Path) else Path(source_file_path)
     target = target_file_path if isinstance(target_file_path, Path) else Path(target_file_path)
-    log.info(f"Attempting to {operation} file: {source} -> {target}")
-    source_exists = check_file_exists(source)
-    target_exists = check_file_exists(target)
-    if source.is_dir():
-        log.error(f"Source is a directory: {source}")
+    log.info("Attempting to %s file: %s -> %s", operation, source, target)
+    if operation == "move":
+        transfer = _replace_or_move
+    elif operation == "copy":
+        transfer = _copy_with_metadata
+    else:
+        log.error("Unsupported operation: %s", operation)
+        return False
+    try:
+        source_stat = _stat_or_none(source)
+        target_stat = _stat_or_none(target)
+    except OSError as e:
+        log.error("Failed to %s file: %s -> %s: %s", operation, source, target, e)
+        return False
+    if source_stat is not None and stat.S_ISDIR(source_stat.st_mode):
+        log.error("Source is a directory: %s", source)
         return False
-    if target.is_dir():
-        log.error(f"Target is a directory: {target}")
+    if source_stat is not None and operation == "copy" and not stat.S_ISREG(source_stat.st_mode):
+        # Reading a FIFO or device would block or never end.
+        log.error("Source is not a regular file: %s", source)
         return False
-    if not source_exists:
+    if target_stat is not None and stat.S_ISDIR(target_stat.st_mode):
+        log.error("Target is a directory: %s", target)
+        return False
+    if source_stat is None:
         if create_file_if_not_exist:
             if not create_file(target, replace_existing_target_file):
-                log.error(f"Failed to create target file: {target}")
+                log.error("Failed to create target file: %s", target)
                 return False
-            log.success(f"Created target file {target} because source did not exist")
+            log.success("Created target file %s because source did not exist", target)
             return True
-        log.error(f"Source file does not exist: {source}")
+        log.error("Source file does not exist: %s", source)
         return False
-    if target_exists:
+    if target_stat is not None:
         if not replace_existing_target_file:
-            log.error(f"Target already exists and replace not allowed: {target}")
-            return False
-        try:
-            target.unlink()
-        except Exception as e:
-            log.error(f"Failed to remove existing target {target}: {e}")
+            log.error("Target already exists and replace not allowed: %s", target)
             return False
+        if os.path.samestat(source_stat, target_stat):
+            if operation == "copy" or _same_entry(source, target):
+                log.error("Source and target are the same file: %s", target)
+                return False
+            if _hard_linked(source, target, source_stat):
+                # Hard links to one inode: os.replace would leave both names,
+                # so the move only has to drop the source name.
+                try:
+                    source.unlink()
+                except Exception as e:
+                    log.error("Failed to remove source %s: %s", source, e)
+                    return False
+                finally:
+                    _invalidate_parents(source)
+                log.success("Successful %s of file: %s -> %s", operation, source, target)
+                return True
+        if operation == "copy":
+            # copy2 would write through the old file; unlink so the target is a new file.
+            try:
+                target.unlink()
+            except Exception as e:
+                log.error("Failed to remove existing target %s: %s", target, e)
+                return False
     try:
-        target.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            transfer(source, target)
+        except FileNotFoundError:
+            if target_stat is not None or target.parent.is_dir():
+                raise
+            try:
+                target.parent.mkdir(parents=True, exist_ok=True)
+            except Exception as e:
+                log.error("Failed to ensure parent directory for target %s: %s", target, e)
+                return False
+            _invalidate_parents(target.parent)
+            transfer(source, target)
     except Exception as e:
-        log.error(f"Failed to ensure parent directory for target {target}: {e}")
+        log.error("Failed to %s file: %s -> %s: %s", operation, source, target, e)
         return False
-    try:
+    finally:
+        _invalidate_parents(source, target)
+    if verify:
         if operation == "move":
-            shutil.move(str(source), str(target))
-        elif operation == "copy":
-            shutil.copy2(str(source), str(target))
+            source_exists = _stat_or_none(source) is not None
+            target_exists = _stat_or_none(target) is not None
+            if source_exists or not target_exists:
+                log.error("Move failed: source exists=%s, target exists=%s", source_exists, target_exists)
+                return False
         else:
-            log.error(f"Unsupported operation: {operation}")
-            return False
-    except Exception as e:
-        log.error(f"Failed to {operation} file: {source} -> {target}: {e}")
-        return False
-    if operation == "move":
-        if source.exists() or not target.exists():
-            log.error(f"Move failed: source exists={source.exists()}, target exists={target.exists()}")
-            return False
-    else:
-        if not target.exists():
-            log.error(f"Copy failed: target does not exist after copy: {target}")
-            return False
-    log.success(f"Successful {operation} of file: {source} -> {target}")
+            copied_stat = _stat_or_none(target)
+            if copied_stat is None or copied_stat.st_size != source_stat.st_size:
+                log.error("Copy failed: target missing or incomplete after copy: %s", target)
+                return False
+    log.success("Successful %s of file: %s -> %s", operation, source, target)
     return True
 
 
 def move_file(source_file_path, target_file_path, replace_existing_target_file: bool = False,
-              create_file_if_not_exist: bool = False) -> bool:
+              create_file_if_not_exist: bool = False, verify: bool = False) -> bool:
     """Move a file from source to target using shared validation logic.
 
     Thin wrapper around :func:`_transfer_file`.
@@ -271,16 +666,17 @@ def move_file(source_file_path, target_file_path, replace_existing_target_file:
         replace_existing_target_file (bool): If True allow overwriting target.
         create_file_if_not_exist (bool): If True create the target if source
             is missing (see _transfer_file behavior).
+        verify (bool): If True confirm the result with extra stat calls.
 
     Returns:
         bool: True on success, False on failure.
     """
     return _transfer_file(source_file_path, target_file_path, "move",
-                          replace_existing_target_file, create_file_if_not_exist)
+                          replace_existing_target_file, create_file_if_not_exist, verify)
 
 
 def copy_file(source_file_path, target_file_path, replace_existing_target_file: bool = False,
-              create_file_if_not_exist: bool = False) -> bool:
+              create_file_if_not_exist: bool = False, verify: bool = False) -> bool:
     """Copy a file from source to target using shared validation logic.
 
     Thin wrapper around :func:`_transfer_file`.
@@ -291,12 +687,13 @@ def copy_file(source_file_path, target_file_path, replace_existing_target_file:
         replace_existing_target_file (bool): If True allow overwriting target.
         create_file_if_not_exist (bool): If True create the target if source
             is missing (see _transfer_file behavior).
+        verify (bool): If True confirm the result with extra stat calls.
 
     Returns:
         bool: True on success, False on failure.
     """
     return _transfer_file(source_file_path, target_file_path, "copy",
-                          replace_existing_target_file, create_file_if_not_exist)
+                          replace_existing_target_file, create_file_if_not_exist, verify)
 
 def rename_file(file_path,name: str,replace_existing_file: bool = False) -> bool:
     """Rename a file to a new name within the same directory.
@@ -313,29 +710,553 @@ def rename_file(file_path,name: str,replace_existing_file: bool = False) -> bool
     """
     file_path = file_path if isinstance(file_path, Path) else Path(file_path)
     new_path = file_path.parent / name
-    log.info(f"Attempting to rename: {file_path} -> {new_path}")
+    log.info("Attempting to rename: %s -> %s", file_path, new_path)
     if not file_path.exists():
-        log.error(f"File: {file_path} does not exist.")
+        log.error("File: %s does not exist.", file_path)
         return False
     if file_path.is_dir():
-        log.error(f"Path: {file_path} is a directory and cannot be renamed as a file.")
+        log.error("Path: %s is a directory and cannot be renamed as a file.", file_path)
         return False
     if new_path.exists():
         if not replace_existing_file:
-            log.error(f"Target file already exists: {new_path}")
+            log.error("Target file already exists: %s", new_path)
             return False
-        log.info(f"File with the same name already exists: {new_path}, file will be replaced")
+        log.info("File with the same name already exists: %s, file will be replaced", new_path)
         if not remove_file(new_path):
-            log.error(f"Cannot rename file: {new_path} due to error during deletion of the existing file with the same name.")
+            log.error("Cannot rename file: %s due to error during deletion of the existing file with the same name.", new_path)
             return False
     try:
         file_path.rename(new_path)
     except Exception as e:
-        log.error(f"Failed to rename file: {file_path} to {new_path} due to: {e}")
+        log.error("Failed to rename file: %s to %s due to: %s", file_path, new_path, e)
+        return False
+    _invalidate_parents(file_path)
+    log.success("Successfully renamed file: %s to %s", file_path, new_path)
+    return True
+
+
+# ======================== Copy Engine ========================
+
+# Buffer for the userspace copy loop; also the minimum size of one kernel copy call.
+COPY_BUFFER_SIZE = 1024 * 1024
+# Copy mechanisms in order of preference, for copy_file_contents.
+COPY_METHODS = ("copy_file_range", "sendfile", "chunked")
+# errno values meaning "this mechanism cannot copy between these two files".
+_KERNEL_COPY_UNSUPPORTED = frozenset(
+    code for code in (getattr(errno, name, None) for name in
+                      ("ENOSYS", "EXDEV", "EINVAL", "EOPNOTSUPP", "ENOTSUP", "ETXTBSY", "EBADF", "ENOTSOCK"))
+    if code is not None)
+# Largest count passed to one kernel copy call (fits a 32-bit ssize_t).
+_MAX_KERNEL_CHUNK = 2 ** 30
+
+
+def _kernel_copy(method: str, source_fd: int, target_fd: int, chunk: int) -> int | None:
+    """Copy everything from `source_fd` to `target_fd` with one kernel mechanism.
+
+    Returns:
+        int | None: Bytes copied, or None if the mechanism is unavailable for
+            these files and nothing was copied (the caller tries the next
+            one). A mechanism that copies nothing at all also returns None, as
+            some filesystems (procfs, sysfs) report EOF to kernel copies.
+
+    Raises:
+        OSError: If copying fails after data was written.
+    """
+    if method == "copy_file_range":
+        copy_call = getattr(os, "copy_file_range", None)
+    else:
+        copy_call = getattr(os, "sendfile", None)
+    if copy_call is None:
+        return None
+    copied = 0
+    while True:
+        try:
+            if method == "copy_file_range":
+                sent = copy_call(source_fd, target_fd, chunk)
+            else:
+                sent = copy_call(target_fd, source_fd, copied, chunk)
+        except OSError as e:
+            if copied == 0 and e.errno in _KERNEL_COPY_UNSUPPORTED:
+                return None
+            raise
+        if sent == 0:
+            return copied if copied else None
+        copied += sent
+
+
+def _chunked_copy(source_fd: int, target_fd: int, buffer_size: int) -> int:
+    """Copy `source_fd` to `target_fd` through one reusable userspace buffer."""
+    buffer = bytearray(buffer_size)
+    view = memoryview(buffer)
+    copied = 0
+    while True:
+        read = os.readv(source_fd, [buffer])
+        if not read:
+            return copied
+        written = 0
+        while written < read:
+            written += os.write(target_fd, view[written:read])
+        copied += read
+
+
+def copy_file_contents(source, target, buffer_size: int = COPY_BUFFER_SIZE, methods=COPY_METHODS) -> tuple:
+    """Copy the data of file `source` to `target`, using the kernel where possible.
+
+    Tries each of `methods` in order:
+
+    - ``"copy_file_range"``: copies inside the kernel; on Btrfs/XFS this can
+      be a reflink and on NFS/SMB a server-side copy.
+    - ``"sendfile"``: copies inside the kernel via the page cache.
+    - ``"chunked"``: ``read``/``write`` through one buffer of `buffer_size`
+      bytes; works everywhere.
+
+    A kernel mechanism that fails before copying anything (unsupported
+    kernel or filesystem, cross-device on old kernels) falls back to the next
+    one. Empty sources skip the kernel mechanisms. Metadata is not copied
+    (see :func:`_copy_with_metadata`). `target` is created or truncated.
+
+    Args:
+        source (str | pathlib.Path): File to read.
+        target (str | pathlib.Path): File to write.
+        buffer_size (int): Buffer size of the chunked copy, and the minimum
+            count passed to one kernel copy call.
+        methods (Iterable[str]): Mechanisms to try, from COPY_METHODS.
+
+    Returns:
+        tuple[int, str]: Bytes copied and the mechanism that copied them.
+
+    Raises:
+        OSError: If a file cannot be opened, the source is not a regular
+            file (a FIFO or device) or copying fails.
+        ValueError: If `methods` contains an unknown name or nothing could
+            copy the file.
+    """
+    methods = tuple(methods)
+    unknown = set(methods) - set(COPY_METHODS)
+    if unknown:
+        raise ValueError(f"Unknown copy methods: {sorted(unknown)}")
+    # O_NONBLOCK keeps the open of a FIFO from waiting for a writer; it has
+    # no effect on regular files, and anything else is rejected below.
+    source_fd = os.open(source, os.O_RDONLY | getattr(os, "O_NONBLOCK", 0) | getattr(os, "O_CLOEXEC", 0))
+    try:
+        source_stat = os.fstat(source_fd)
+        if not stat.S_ISREG(source_stat.st_mode):
+            raise OSError(errno.EINVAL, "Source is not a regular file", str(source))
+        size = source_stat.st_size
+        target_fd = os.open(target, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_CLOEXEC", 0), 0o666)
+        try:
+            chunk = min(max(size, buffer_size), _MAX_KERNEL_CHUNK)
+            for method in methods:
+                if method == "chunked":
+                    # No need to allocate (and zero) a buffer much larger than the file.
+                    return _chunked_copy(source_fd, target_fd, min(buffer_size, max(size + 1, 64 * 1024))), method
+                # Empty (or procfs-like) files would only cost a wasted kernel call.
+                if size == 0:
+                    continue
+                copied = _kernel_copy(method, source_fd, target_fd, chunk)
+                if copied is not None:
+                    return copied, method
+            if size == 0:
+                return 0, methods[-1]
+            raise ValueError(f"None of the copy methods {tuple(methods)} could copy {source}")
+        finally:
+            os.close(target_fd)
+    finally:
+        os.close(source_fd)
+
+
+# ======================== Resumable Copy ========================
+
+# Bytes copied between checkpoints (each one costs an fsync).
+CHECKPOINT_INTERVAL = 64 * 1024 * 1024
+# Read/write size of the resumable copy.
+RESUMABLE_CHUNK_SIZE = 8 * 1024 * 1024
+
+
+def resumable_copy_paths(target: Path) -> tuple:
+    """Return the temporary data and checkpoint paths used to copy to `target`.
+
+    Both live next to `target`, so the final ``os.replace`` stays on one
+    filesystem.
+
+    Returns:
+        tuple[pathlib.Path, pathlib.Path]: The partial file and its checkpoint.
+    """
+    partial = target.with_name(f".{target.name}.partial")
+    return partial, target.with_name(f".{target.name}.partial.json")
+
+
+def _load_checkpoint(checkpoint: Path, partial_fd: int, source_key: list) -> int:
+    """Return the offset a copy may resume from, or 0 to start over.
+
+    The checkpoint must belong to the same source (device, inode, size and
+    mtime) and the partial file must still hold the last checkpointed chunk
+    with the recorded CRC32. A malformed or unreadable checkpoint also
+    means starting over.
+    """
+    import json
+    import zlib
+    try:
+        state = json.loads(checkpoint.read_text())
+        offset, length, crc = state["offset"], state["chunk_length"], state["chunk_crc32"]
+        if state["source"] != source_key or not 0 <= length <= offset \
+                or os.fstat(partial_fd).st_size < offset:
+            return 0
+        if zlib.crc32(os.pread(partial_fd, length, offset - length)) != crc:
+            return 0
+    except (OSError, ValueError, KeyError, TypeError, OverflowError):
+        return 0
+    return offset
+
+
+def _write_checkpoint(checkpoint: Path, source_key: list, offset: int, chunk: bytes):
+    """Atomically record that everything before `offset` is durable."""
+    import json
+    import zlib
+    temporary = checkpoint.with_name(checkpoint.name + ".tmp")
+    temporary.write_text(json.dumps({"source": source_key, "offset": offset,
+                                     "chunk_length": len(chunk), "chunk_crc32": zlib.crc32(chunk)}))
+    os.replace(temporary, checkpoint)
+
+
+def copy_file_resumable(source_file_path, target_file_path, replace_existing_target_file: bool = False,
+                        progress=None, progress_bytes: int = 16 * 1024 * 1024, progress_seconds: float = 0.5,
+                        chunk_size: int = RESUMABLE_CHUNK_SIZE, checkpoint_interval: int = CHECKPOINT_INTERVAL,
+                        resume: bool = True) -> bool:
+    """Copy a large file in chunks, resumably, replacing the target atomically.
+
+    Data is written to a temporary file next to the target (see
+    :func:`resumable_copy_paths`). Every `checkpoint_interval` bytes the
+    temporary file is fsync'ed and a checkpoint records the offset, the
+    source's identity and a CRC32 of the last chunk. If the copy is
+    interrupted or fails, the temporary file and checkpoint are left in
+    place, and the next call with `resume` continues from the last verified
+    offset (it starts over if the source changed or the data does not
+    match). On completion the file is fsync'ed, given the source's metadata
+    like ``shutil.copy2``, moved into place with ``os.replace`` and the
+    directory is fsync'ed, so the target is never seen half written.
+
+    Args:
+        source_file_path (str | pathlib.Path): File to copy.
+        target_file_path (str | pathlib.Path): Destination path.
+        replace_existing_target_file (bool): If True allow replacing an
+            existing target (atomically, at the end).
+        progress (Callable[[int, int], None] | None): Called with the bytes
+            copied so far and the total, at most every `progress_bytes` bytes
+            or `progress_seconds` seconds (whichever comes first) and once
+            at the end. Raising from it aborts the copy, which can then be
+            resumed.
+        progress_bytes (int): Byte interval between progress calls.
+        progress_seconds (float): Time interval between progress calls.
+        chunk_size (int): Bytes read and written per call.
+        checkpoint_interval (int): Bytes between checkpoints.
+        resume (bool): Continue from an existing checkpoint; False always
+            starts over.
+
+    Returns:
+        bool: True on success, False on failure.
+    """
+    from time import monotonic
+    source = source_file_path if isinstance(source_file_path, Path) else Path(source_file_path)
+    target = target_file_path if isinstance(target_file_path, Path) else Path(target_file_path)
+    log.info("Attempting resumable copy of file: %s -> %s", source, target)
+    try:
+        source_stat = os.stat(source)
+        target_stat = _stat_or_none(target)
+    except OSError as e:
+        log.error("Failed to copy file: %s -> %s: %s", source, target, e)
+        return False
+    if stat.S_ISDIR(source_stat.st_mode):
+        log.error("Source is a directory: %s", source)
+        return False
+    if not stat.S_ISREG(source_stat.st_mode):
+        log.error("Source is not a regular file: %s", source)
+        return False
+    if target_stat is not None:
+        if stat.S_ISDIR(target_stat.st_mode):
+            log.error("Target is a directory: %s", target)
+            return False
+        if not replace_existing_target_file:
+            log.error("Target already exists and replace not allowed: %s", target)
+            return False
+        if os.path.samestat(source_stat, target_stat):
+            log.error("Source and target are the same file: %s", target)
+            return False
+    partial, checkpoint = resumable_copy_paths(target)
+    source_key = [source_stat.st_dev, source_stat.st_ino, source_stat.st_size, source_stat.st_mtime_ns]
+    total = source_stat.st_size
+    try:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        source_fd = os.open(source, os.O_RDONLY | getattr(os, "O_CLOEXEC", 0))
+        try:
+            partial_fd = os.open(partial, os.O_RDWR | os.O_CREAT | getattr(os, "O_CLOEXEC", 0), 0o666)
+            try:
+                offset = _load_checkpoint(checkpoint, partial_fd, source_key) if resume else 0
+                if offset:
+                    log.info("Resuming copy of %s at byte %s of %s", source, offset, total)
+                os.ftruncate(partial_fd, offset)
+                next_checkpoint = offset + checkpoint_interval
+                next_progress_bytes = offset + progress_bytes
+                next_progress_time = monotonic() + progress_seconds
+                while True:
+                    chunk = os.pread(source_fd, chunk_size, offset)
+                    if not chunk:
+                        break
+                    view = memoryview(chunk)
+                    written = 0
+                    while written < len(chunk):
+                        written += os.pwrite(partial_fd, view[written:], offset + written)
+                    offset += len(chunk)
+                    if offset >= next_checkpoint:
+                        os.fsync(partial_fd)
+                        _write_checkpoint(checkpoint, source_key, offset, chunk)
+                        next_checkpoint = offset + checkpoint_interval
+                    if progress is not None and (offset >= next_progress_bytes or monotonic() >= next_progress_time):
+                        progress(offset, total)
+                        next_progress_bytes = offset + progress_bytes
+                        next_progress_time = monotonic() + progress_seconds
+                os.fsync(partial_fd)
+            finally:
+                os.close(partial_fd)
+        finally:
+            os.close(source_fd)
+        import shutil
+        shutil.copystat(source, partial)
+        os.replace(partial, target)
+        _invalidate_parents(target)
+        _fsync_directory(target.parent)
+        checkpoint.unlink(missing_ok=True)
+    except Exception as e:
+        log.error("Resumable copy failed: %s -> %s: %s: %s (partial data kept in %s)",
+                  source, target, type(e).__name__, e, partial)
         return False
-    log.success(f"Successfully renamed file: {file_path} to {new_path}")
+    if progress is not None:
+        progress(offset, total)
+    log.success("Successful resumable copy of file: %s -> %s (%s bytes)", source, target, offset)
     return True
 
 
+def _fsync_directory(directory: Path):
+    """fsync `directory` so a rename inside it survives a crash (no-op where unsupported)."""
+    try:
+        directory_fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(directory_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(directory_fd)
+
+
+# ======================== Batch Utils ========================
+
+# Threads used by copy_files/move_files when `workers` is not given; transfers
+# wait on I/O, so this is more than the number of CPUs.
+DEFAULT_TRANSFER_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+
+class TransferResult:
+
+    __slots__ = ("source", "target", "success", "error", "bytes", "duration")
+
+    def __init__(self, source: Path, target: Path, success: bool, error: Exception | None = None,
+                 bytes: int = 0, duration: float = 0.0):
+        """Outcome of one item of :func:`copy_files` or :func:`move_files`.
+
+        Args:
+            source (pathlib.Path): Source path.
+            target (pathlib.Path): Target path.
+            success (bool): Whether the transfer completed.
+            error (Exception | None): Why it failed (an OSError such as
+                FileNotFoundError, FileExistsError or IsADirectoryError).
+            bytes (int): Size of the transferred file; 0 on failure.
+            duration (float): Seconds spent on this item.
+        """
+        self.source = source
+        self.target = target
+        self.success = success
+        self.error = error
+        self.bytes = bytes
+        self.duration = duration
+
+    def __repr__(self) -> str:
+        state = "ok" if self.success else f"error={self.error!r}"
+        return f"TransferResult({self.source} -> {self.target}, {state}, bytes={self.bytes})"
+
+
+def _transfer_checked(source: Path, target: Path, operation: str, replace_existing: bool,
+                      verify: bool, source_stat=None) -> int:
+    """Move or copy one file, raising on any failure.
+
+    Same checks as :func:`_transfer_file` but errors are raised rather than
+    logged, and the target's parent directory must already exist.
+
+    Returns:
+        int: Size of the transferred file in bytes.
+
+    Raises:
+        OSError: If the source is missing or a directory, the target is a
+            directory or exists without `replace_existing`, or the transfer
+            fails.
+    """
+    if source_stat is None:
+        source_stat = os.stat(source)
+    if stat.S_ISDIR(source_stat.st_mode):
+        raise IsADirectoryError(errno.EISDIR, "Source is a directory", str(source))
+    if operation == "copy" and not stat.S_ISREG(source_stat.st_mode):
+        raise OSError(errno.EINVAL, "Source is not a regular file", str(source))
+    target_stat = _stat_or_none(target)
+    if target_stat is not None:
+        if stat.S_ISDIR(target_stat.st_mode):
+            raise IsADirectoryError(errno.EISDIR, "Target is a directory", str(target))
+        if not replace_existing:
+            raise FileExistsError(errno.EEXIST, "Target already exists and replace not allowed", str(target))
+        if os.path.samestat(source_stat, target_stat):
+            if operation == "copy" or _same_entry(source, target):
+                raise OSError(errno.EINVAL, "Source and target are the same file", str(target))
+            if _hard_linked(source, target, source_stat):
+                # Hard links to one inode: only the source name has to go.
+                source.unlink()
+                return source_stat.st_size
+        if operation == "copy":
+            target.unlink()
+    if operation == "move":
+        _replace_or_move(source, target)
+    else:
+        _copy_with_metadata(source, target)
+    if verify:
+        copied_stat = _stat_or_none(target)
+        if copied_stat is None or copied_stat.st_size != source_stat.st_size:
+            raise OSError(errno.EIO, "Target missing or incomplete after transfer", str(target))
+        if operation == "move" and _stat_or_none(source) is not None:
+            raise OSError(errno.EIO, "Source still exists after move", str(source))
+    return source_stat.st_size
+
+
+def _transfer_result(source: Path, target: Path, operation: str, replace_existing: bool, verify: bool,
+                     source_stat=None) -> TransferResult:
+    """Run :func:`_transfer_checked` and describe the outcome as a TransferResult."""
+    from time import perf_counter
+    started = perf_counter()
+    try:
+        size = _transfer_checked(source, target, operation, replace_existing, verify, source_stat)
+    except Exception as e:
+        return TransferResult(source, target, False, e, duration=perf_counter() - started)
+    return TransferResult(source, target, True, None, size, perf_counter() - started)
+
+
+def _transfer_files(pairs, operation: str, replace_existing: bool, workers: int | None,
+                    order_by_device: bool, verify: bool) -> list:
+    """Shared implementation of :func:`copy_files` and :func:`move_files`."""
+    from concurrent.futures import ThreadPoolExecutor
+    from time import perf_counter
+
+    started = perf_counter()
+    items = [(source if isinstance(source, Path) else Path(source),
+              target if isinstance(target, Path) else Path(target)) for source, target in pairs]
+    results = [None] * len(items)
+    source_stats = [None] * len(items)
+
+    # Create every target parent once, before any transfer starts.
+    parent_errors = {}
+    for parent in {target.parent for _, target in items}:
+        try:
+            parent.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            parent_errors[parent] = e
+    order = []
+    for index, (source, target) in enumerate(items):
+        error = parent_errors.get(target.parent)
+        if error is not None:
+            results[index] = TransferResult(source, target, False, error)
+        else:
+            order.append(index)
+
+    if order_by_device:
+        # Group by device, then inode (which roughly follows on-disk layout).
+        # Failed stats are left for the transfer itself to report.
+        keys = {}
+        for index in order:
+            try:
+                source_stats[index] = os.stat(items[index][0])
+                keys[index] = (source_stats[index].st_dev, source_stats[index].st_ino)
+            except OSError:
+                keys[index] = (-1, -1)
+        order.sort(key=keys.__getitem__)
+
+    def run(index: int):
+        source, target = items[index]
+        results[index] = _transfer_result(source, target, operation, replace_existing, verify, source_stats[index])
+
+    with ThreadPoolExecutor(max_workers=workers or DEFAULT_TRANSFER_WORKERS,
+                            thread_name_prefix=f"{operation}_files") as pool:
+        # Consuming the map re-raises anything unexpected from `run`.
+        for _ in pool.map(run, order):
+            pass
+
+    if _listing_cache is not None:
+        for source, target in items:
+            _invalidate_parents(source, target, target.parent)
+    failed = [result for result in results if not result.success]
+    for result in failed:
+        log.error("Failed to %s file: %s -> %s: %s", operation, result.source, result.target, result.error)
+    log.info("%s: %s of %s files succeeded (%s bytes) in %.3fs", operation, len(results) - len(failed),
+             len(results), sum(result.bytes for result in results), perf_counter() - started)
+    return results
+
+
+def copy_files(pairs, replace_existing_target_file: bool = False, workers: int | None = None,
+               order_by_device: bool = False, verify: bool = False) -> list:
+    """Copy many files on a thread pool.
+
+    Each target's parent directory is created once per unique parent before
+    the copies start. Items are independent: a failing item does not stop
+    the others.
+
+    Args:
+        pairs (Iterable[tuple[str | pathlib.Path, str | pathlib.Path]]):
+            ``(source, target)`` file paths.
+        replace_existing_target_file (bool): If True allow overwriting
+            existing targets.
+        workers (int | None): Number of threads; defaults to
+            DEFAULT_TRANSFER_WORKERS.
+        order_by_device (bool): Stat every source first and start the copies
+            grouped by device and sorted by inode, which helps on rotating
+            disks.
+        verify (bool): Check each target's size after copying.
+
+    Returns:
+        list[TransferResult]: One result per pair, in input order.
+    """
+    return _transfer_files(pairs, "copy", replace_existing_target_file, workers, order_by_device, verify)
+
+
+def move_files(pairs, replace_existing_target_file: bool = False, workers: int | None = None,
+               order_by_device: bool = False, verify: bool = False) -> list:
+    """Move many files on a thread pool.
+
+    Like :func:`copy_files`; same-filesystem moves are single
+    ``os.replace`` calls (see :func:`_transfer_file`).
+
+    Args:
+        pairs (Iterable[tuple[str | pathlib.Path, str | pathlib.Path]]):
+            ``(source, target)`` file paths.
+        replace_existing_target_file (bool): If True allow overwriting
+            existing targets.
+        workers (int | None): Number of threads; defaults to
+            DEFAULT_TRANSFER_WORKERS.
+        order_by_device (bool): Stat every source first and start the moves
+            grouped by device and sorted by inode.
+        verify (bool): Check that each source is gone and its target has the
+            source's size.
+
+    Returns:
+        list[TransferResult]: One result per pair, in input order.
+    """
+    return _transfer_files(pairs, "move", replace_existing_target_file, workers, order_by_device, verify)
+
+
 if __name__ == "__main__":
     print(list_subdirectories(Path("a")).__doc__)
\ No newline at end of file
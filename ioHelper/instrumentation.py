@@ -0,0 +1,389 @@
+# ======================== Imports ========================
+from __future__ import annotations
+
+import builtins
+import functools
+import inspect
+import os
+import threading
+from contextlib import contextmanager
+from time import perf_counter_ns
+
+# ======================== Constants ========================
+
+# os functions counted as filesystem calls, with how their result maps to
+# bytes: "read"/"write" count the returned size, None counts nothing.
+FS_CALLS = {
+    "stat": None, "lstat": None, "fstat": None, "scandir": None, "open": None,
+    "mkdir": None, "rmdir": None, "unlink": None, "remove": None, "rename": None, "replace": None,
+    "utime": None, "chmod": None, "listxattr": None, "getxattr": None, "setxattr": None,
+    "fsync": None, "ftruncate": None, "truncate": None,
+    "read": "read", "readv": "read", "pread": "read",
+    "write": "write", "pwrite": "write", "sendfile": "write", "copy_file_range": "write",
+}
+# Modules whose functions are timed, and functions they share by name.
+INSTRUMENTED_MODULES = ("ioHelper.fileOperations",)
+SHARED_FUNCTIONS = (("ioHelper.treeWalker", "scan_directory"),)
+# Methods only timed when called from instrumented code (logging done by
+# fileOperations, not by the rest of the program).
+NESTED_METHODS = (("Utils.Logger", "LoggerClass", "log_message"),)
+# Latency histogram buckets: bucket i counts durations below 2**i nanoseconds.
+HISTOGRAM_BUCKETS = 48
+
+# ======================== State ========================
+_active = None
+_local = threading.local()
+_patch_lock = threading.Lock()
+# (owner, attribute name, original value) for every patched attribute.
+_patched = []
+
+
+# ======================== Collector ========================
+class FunctionStats:
+
+    __slots__ = ("calls", "errors", "total_ns", "min_ns", "max_ns", "histogram")
+
+    def __init__(self):
+        """Call count, failures and a log2 latency histogram of one function."""
+        self.calls = 0
+        self.errors = 0
+        self.total_ns = 0
+        self.min_ns = None
+        self.max_ns = 0
+        self.histogram = [0] * HISTOGRAM_BUCKETS
+
+    def add(self, elapsed_ns: int, failed: bool):
+        """Record one call that took `elapsed_ns`."""
+        self.calls += 1
+        self.errors += failed
+        self.total_ns += elapsed_ns
+        if self.min_ns is None or elapsed_ns < self.min_ns:
+            self.min_ns = elapsed_ns
+        if elapsed_ns > self.max_ns:
+            self.max_ns = elapsed_ns
+        self.histogram[min(elapsed_ns.bit_length(), HISTOGRAM_BUCKETS - 1)] += 1
+
+    def percentile_ns(self, fraction: float) -> int:
+        """Return the upper bound of the histogram bucket holding `fraction` of calls."""
+        wanted = fraction * self.calls
+        seen = 0
+        for bucket, count in enumerate(self.histogram):
+            seen += count
+            if count and seen >= wanted:
+                return min(2 ** bucket, self.max_ns)
+        return self.max_ns
+
+    def to_dict(self) -> dict:
+        """Return the statistics as JSON-compatible values (times in microseconds)."""
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "total_us": self.total_ns / 1000,
+            "mean_us": self.total_ns / self.calls / 1000 if self.calls else 0.0,
+            "min_us": (self.min_ns or 0) / 1000,
+            "max_us": self.max_ns / 1000,
+            "p50_us": self.percentile_ns(0.5) / 1000,
+            "p99_us": self.percentile_ns(0.99) / 1000,
+            "histogram_us": [[2 ** bucket / 1000, count] for bucket, count in enumerate(self.histogram) if count],
+        }
+
+
+class Instrumentation:
+
+    def __init__(self):
+        """Measurements collected while instrumentation is enabled.
+
+        Function times are inclusive (a function's time contains the calls
+        it makes). Filesystem calls and bytes are only counted while an
+        instrumented function is running in the calling thread, so other
+        code in the process does not show up.
+
+        Attributes:
+            functions (dict[str, FunctionStats]): Per instrumented function.
+            fs_calls (dict[str, list[int]]): ``[calls, total_ns]`` per os
+                function.
+            bytes_read (int): Bytes returned by read-family calls.
+            bytes_written (int): Bytes written, sent or copied in-kernel.
+        """
+        self.functions = {}
+        self.fs_calls = {}
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self._lock = threading.Lock()
+
+    def record_call(self, name: str, elapsed_ns: int, failed: bool):
+        """Record one call of function `name`."""
+        with self._lock:
+            stats = self.functions.get(name)
+            if stats is None:
+                stats = self.functions[name] = FunctionStats()
+            stats.add(elapsed_ns, failed)
+
+    def record_fs_call(self, name: str, elapsed_ns: int, kind: str | None, size: int):
+        """Record one filesystem call and the bytes it moved."""
+        with self._lock:
+            counts = self.fs_calls.get(name)
+            if counts is None:
+                counts = self.fs_calls[name] = [0, 0]
+            counts[0] += 1
+            counts[1] += elapsed_ns
+            if kind == "read":
+                self.bytes_read += size
+            elif kind == "write":
+                self.bytes_written += size
+
+    def reset(self):
+        """Discard everything collected so far."""
+        with self._lock:
+            self.functions.clear()
+            self.fs_calls.clear()
+            self.bytes_read = 0
+            self.bytes_written = 0
+
+    def to_dict(self) -> dict:
+        """Return all measurements as JSON-compatible values."""
+        with self._lock:
+            return {
+                "functions": {name: stats.to_dict() for name, stats in sorted(self.functions.items())},
+                "fs_calls": {name: {"calls": calls, "total_us": total_ns / 1000}
+                             for name, (calls, total_ns) in sorted(self.fs_calls.items())},
+                "bytes_read": self.bytes_read,
+                "bytes_written": self.bytes_written,
+            }
+
+    def to_json(self, indent: int | None = 2) -> str:
+        """Return :meth:`to_dict` as a JSON string."""
+        import json
+        return json.dumps(self.to_dict(), indent=indent)
+
+    def summary_table(self) -> str:
+        """Return a plain-text table of the measurements, slowest functions first."""
+        data = self.to_dict()
+        lines = [f"{'function':<40} {'calls':>8} {'errors':>6} {'total ms':>10} {'mean us':>10} "
+                 f"{'p50 us':>9} {'p99 us':>9} {'max us':>10}"]
+        for name, stats in sorted(data["functions"].items(), key=lambda item: -item[1]["total_us"]):
+            lines.append(f"{name:<40} {stats['calls']:>8} {stats['errors']:>6} {stats['total_us'] / 1000:>10.2f} "
+                         f"{stats['mean_us']:>10.1f} {stats['p50_us']:>9.1f} {stats['p99_us']:>9.1f} "
+                         f"{stats['max_us']:>10.1f}")
+        lines.append("")
+        lines.append(f"{'filesystem call':<40} {'calls':>8} {'total ms':>17}")
+        for name, counts in sorted(data["fs_calls"].items(), key=lambda item: -item[1]["calls"]):
+            lines.append(f"{name:<40} {counts['calls']:>8} {counts['total_us'] / 1000:>17.2f}")
+        lines.append("")
+        lines.append(f"bytes read: {data['bytes_read']}, bytes written: {data['bytes_written']}")
+        return "\n".join(lines)
+
+
+# ======================== Wrappers ========================
+
+def _wrap_function(name: str, function):
+    """Return `function` timed under `name` (generators over their whole iteration)."""
+    if inspect.isgeneratorfunction(function):
+        @functools.wraps(function)
+        def generator_wrapper(*args, **kwargs):
+            generator = function(*args, **kwargs)
+            elapsed = 0
+            failed = False
+            try:
+                while True:
+                    _local.depth = getattr(_local, "depth", 0) + 1
+                    started = perf_counter_ns()
+                    try:
+                        item = next(generator)
+                    except StopIteration:
+                        return
+                    except BaseException:
+                        failed = True
+                        raise
+                    finally:
+                        elapsed += perf_counter_ns() - started
+                        _local.depth -= 1
+                    yield item
+            finally:
+                generator.close()
+                collector = _active
+                if collector is not None:
+                    collector.record_call(name, elapsed, failed)
+        return generator_wrapper
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        _local.depth = getattr(_local, "depth", 0) + 1
+        started = perf_counter_ns()
+        failed = False
+        try:
+            return function(*args, **kwargs)
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            elapsed = perf_counter_ns() - started
+            _local.depth -= 1
+            collector = _active
+            if collector is not None:
+                collector.record_call(name, elapsed, failed)
+    return wrapper
+
+
+def _wrap_method(name: str, method):
+    """Return `method` timed under `name` when called from instrumented code.
+
+    Calls made outside instrumented functions are passed straight through.
+    The wrapper takes `self` explicitly so its frame counts as part of the
+    object: Utils.Logger skips frames bound to a LoggerClass when looking up
+    the calling function, so wrapping ``log_message`` does not change the
+    function name in log lines or the rate limiter's call sites.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        depth = getattr(_local, "depth", 0)
+        if not depth:
+            return method(self, *args, **kwargs)
+        _local.depth = depth + 1
+        started = perf_counter_ns()
+        failed = False
+        try:
+            return method(self, *args, **kwargs)
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            elapsed = perf_counter_ns() - started
+            _local.depth -= 1
+            collector = _active
+            if collector is not None:
+                collector.record_call(name, elapsed, failed)
+    return wrapper
+
+
+def _wrap_fs_call(name: str, function, kind: str | None):
+    """Return `function` counted as filesystem call `name` inside instrumented code."""
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        collector = _active
+        if collector is None or not getattr(_local, "depth", 0):
+            return function(*args, **kwargs)
+        started = perf_counter_ns()
+        size = 0
+        try:
+            result = function(*args, **kwargs)
+            if kind is not None:
+                size = result if isinstance(result, int) else len(result)
+            return result
+        finally:
+            # Failed calls (e.g. existence probes raising FileNotFoundError) count too.
+            collector.record_fs_call(name, perf_counter_ns() - started, kind, size)
+    return wrapper
+
+
+def _patch(owner, attribute: str, replacement):
+    """Replace ``owner.attribute`` and remember the original."""
+    _patched.append((owner, attribute, getattr(owner, attribute)))
+    setattr(owner, attribute, replacement)
+
+
+def _install():
+    """Wrap the instrumented functions and the os filesystem calls."""
+    import importlib
+    import sys
+    for module_name in INSTRUMENTED_MODULES:
+        module = importlib.import_module(module_name)
+        short_name = module_name.rpartition(".")[2]
+        for attribute, value in list(vars(module).items()):
+            if inspect.isfunction(value) and value.__module__ == module_name:
+                _patch(module, attribute, _wrap_function(f"{short_name}.{attribute}", value))
+    for module_name, attribute in SHARED_FUNCTIONS:
+        original = getattr(importlib.import_module(module_name), attribute)
+        wrapped = _wrap_function(f"{module_name.rpartition('.')[2]}.{attribute}", original)
+        # Also replace copies imported by name into other loaded modules.
+        for module in list(sys.modules.values()):
+            if module is not None and getattr(module, attribute, None) is original:
+                _patch(module, attribute, wrapped)
+    for module_name, class_name, attribute in NESTED_METHODS:
+        owner = getattr(importlib.import_module(module_name), class_name)
+        _patch(owner, attribute, _wrap_method(f"{class_name}.{attribute}", getattr(owner, attribute)))
+    for name, kind in FS_CALLS.items():
+        if hasattr(os, name):
+            _patch(os, name, _wrap_fs_call(name, getattr(os, name), kind))
+    _patch(builtins, "open", _wrap_fs_call("open", builtins.open, None))
+
+
+def _uninstall():
+    """Restore every patched attribute, newest first."""
+    while _patched:
+        owner, attribute, original = _patched.pop()
+        setattr(owner, attribute, original)
+
+
+# ======================== Public API ========================
+
+def enable(collector: Instrumentation | None = None) -> Instrumentation:
+    """Start collecting measurements for ioHelper.fileOperations.
+
+    Replaces the module's functions (plus directory scans, log calls and the
+    os filesystem calls they make) with
+    measuring wrappers; :func:`disable` puts the originals back, so there is
+    no overhead at all while instrumentation is off. Code that imported a
+    function by name (``from ioHelper.fileOperations import copy_file``)
+    before enabling keeps the unmeasured original.
+
+    Args:
+        collector (Instrumentation | None): Where to record; a new one by
+            default.
+
+    Returns:
+        Instrumentation: The active collector.
+    """
+    global _active
+    with _patch_lock:
+        if not _patched:
+            _install()
+        _active = collector if collector is not None else Instrumentation()
+        return _active
+
+
+def disable() -> Instrumentation | None:
+    """Stop collecting and restore the original functions.
+
+    Returns:
+        Instrumentation | None: The collector that was active.
+    """
+    global _active
+    with _patch_lock:
+        collector, _active = _active, None
+        _uninstall()
+        return collector
+
+
+def active() -> Instrumentation | None:
+    """Return the active collector, or None when instrumentation is off."""
+    return _active
+
+
+@contextmanager
+def measure():
+    """Collect measurements for the duration of a ``with`` block.
+
+    Example::
+
+        with instrumentation.measure() as stats:
+            fileOperations.copy_files(pairs)
+        print(stats.summary_table())
+
+    Nested blocks each get their own collector; the outer one resumes when
+    the inner block ends (calls made inside the inner block are not added to
+    the outer one).
+
+    Yields:
+        Instrumentation: The collector for the block.
+    """
+    global _active
+    previous = _active
+    collector = enable(Instrumentation())
+    try:
+        yield collector
+    finally:
+        if previous is None:
+            disable()
+        else:
+            _active = previous
@@ -0,0 +1,193 @@
+# ======================== Imports ========================
+from __future__ import annotations
+
+import os
+import stat
+import threading
+from collections import OrderedDict
+
+from ioHelper.treeWalker import scan_directory
+
+# ======================== Constants ========================
+
+DEFAULT_MAX_ENTRIES = 1024
+
+
+# ======================== Cached Entry ========================
+class CachedEntry:
+
+    __slots__ = ("name", "path", "_is_dir", "_is_file", "_is_symlink")
+
+    def __init__(self, entry: os.DirEntry):
+        """Name and type of a scanned directory entry, with uncached stat data.
+
+        Offers the parts of the ``os.DirEntry`` interface the walkers and
+        filters use. Types come from the scan; ``stat()`` and the
+        symlink-following type checks call ``os.stat`` each time.
+
+        Args:
+            entry (os.DirEntry): Entry from ``os.scandir``.
+        """
+        self.name = entry.name
+        self.path = entry.path
+        self._is_dir = entry.is_dir(follow_symlinks=False)
+        self._is_file = entry.is_file(follow_symlinks=False)
+        self._is_symlink = entry.is_symlink()
+
+    def __fspath__(self) -> str:
+        return self.path
+
+    def __repr__(self) -> str:
+        return f"<CachedEntry {self.name!r}>"
+
+    def is_symlink(self) -> bool:
+        return self._is_symlink
+
+    def is_dir(self, follow_symlinks: bool = True) -> bool:
+        if follow_symlinks and self._is_symlink:
+            return self._target_mode(stat.S_ISDIR)
+        return self._is_dir
+
+    def is_file(self, follow_symlinks: bool = True) -> bool:
+        if follow_symlinks and self._is_symlink:
+            return self._target_mode(stat.S_ISREG)
+        return self._is_file
+
+    def stat(self, follow_symlinks: bool = True) -> os.stat_result:
+        return os.stat(self.path, follow_symlinks=follow_symlinks)
+
+    def inode(self) -> int:
+        return os.stat(self.path, follow_symlinks=False).st_ino
+
+    def _target_mode(self, test) -> bool:
+        """Apply `test` to the mode of the symlink's target (False if it is dangling)."""
+        try:
+            return test(os.stat(self.path).st_mode)
+        except OSError:
+            return False
+
+
+# ======================== Listing Cache ========================
+class ListingCache:
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """LRU cache of directory listings, validated by the directory's stat.
+
+        Only names and entry types are cached. The listing is returned as
+        :class:`CachedEntry` objects, which read stat data (sizes, mtimes)
+        fresh on every ``stat()`` call, because rewriting a file in place
+        does not change its directory's mtime.
+
+        Entries are keyed by the path string exactly as passed to
+        :meth:`scan`, since the returned entries carry that spelling in their
+        ``path``; the same directory reached as ``t/d`` and as ``/abs/t/d``
+        is cached twice. Each entry remembers the device, inode and
+        ``st_mtime_ns`` of the directory when it was scanned. A lookup stats
+        the directory once and reuses the listing if all three are unchanged
+        (so a relative path that names another directory after ``os.chdir``
+        is scanned again); adding, removing or renaming an entry changes the
+        directory's mtime, so a changed directory is scanned again. On
+        filesystems with coarse timestamps a change within the same tick can
+        go unnoticed; call :meth:`invalidate` after modifying a directory to
+        be safe (the fileOperations functions do this automatically).
+
+        Args:
+            max_entries (int): Number of directories kept; the least
+                recently used one is dropped first.
+
+        Attributes:
+            hits (int): Lookups served from the cache.
+            misses (int): Lookups that scanned the directory.
+            evictions (int): Entries dropped to stay within `max_entries`.
+        """
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be at least 1, got {max_entries}")
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        # Absolute directory path -> the spellings cached for it, for invalidate().
+        self._spellings = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def scan(self, path: str) -> list:
+        """Return the entries of directory `path`, from the cache when valid.
+
+        A drop-in for :func:`ioHelper.treeWalker.scan_directory`.
+
+        Args:
+            path (str): Directory to list.
+
+        Returns:
+            list[CachedEntry]: Entries in scandir order (a new list each
+                call; the entry objects are shared).
+
+        Raises:
+            OSError: If the directory cannot be read.
+        """
+        key = os.fspath(path)
+        directory_stat = os.stat(path)
+        signature = (directory_stat.st_dev, directory_stat.st_ino, directory_stat.st_mtime_ns)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None and cached[0] == signature:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return list(cached[1])
+            self.misses += 1
+        entries = tuple(map(CachedEntry, scan_directory(path)))
+        absolute = os.path.abspath(key)
+        with self._lock:
+            previous = self._entries.get(key)
+            if previous is not None:
+                self._forget_spelling(previous[2], key)
+            self._entries[key] = (signature, entries, absolute)
+            self._entries.move_to_end(key)
+            self._spellings.setdefault(absolute, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                evicted, (_, _, evicted_absolute) = self._entries.popitem(last=False)
+                self._forget_spelling(evicted_absolute, evicted)
+                self.evictions += 1
+        return list(entries)
+
+    def invalidate(self, path=None):
+        """Drop the cached listing of directory `path`, or of every directory.
+
+        Every spelling of the directory cached so far is dropped.
+
+        Args:
+            path (str | pathlib.Path | None): Directory whose entries to drop;
+                None clears the cache.
+        """
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+                self._spellings.clear()
+            else:
+                for key in self._spellings.pop(os.path.abspath(path), ()):
+                    self._entries.pop(key, None)
+
+    def _forget_spelling(self, absolute: str, key: str):
+        """Remove `key` from the spellings of `absolute` (lock held)."""
+        keys = self._spellings.get(absolute)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._spellings[absolute]
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and the current size.
+
+        Returns:
+            dict[str, int | float]: ``hits``, ``misses``, ``evictions``,
+                ``entries``, ``max_entries`` and ``hit_rate`` (0.0 before any
+                lookup).
+        """
+        lookups = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                "entries": len(self._entries), "max_entries": self.max_entries,
+                "hit_rate": self.hits / lookups if lookups else 0.0}
@@ -0,0 +1,147 @@
+# ======================== Imports ========================
+from __future__ import annotations
+
+import fnmatch
+import re
+
+
+# ======================== Independent Functions ========================
+
+def _as_tuple(value) -> tuple:
+    """Return `value` as a tuple: None -> (), a string -> (value,)."""
+    if value is None:
+        return ()
+    if isinstance(value, str):
+        return (value,)
+    return tuple(value)
+
+
+def compile_patterns(globs=None, regexes=None, ignore_case: bool = False):
+    """Compile glob and regex patterns into one regular expression.
+
+    Args:
+        globs (str | Iterable[str] | None): Shell-style patterns
+            (``*.txt``) matched against the whole name.
+        regexes (str | Iterable[str] | None): Regular expressions searched
+            anywhere in the name.
+        ignore_case (bool): Match case-insensitively.
+
+    Returns:
+        re.Pattern | None: A pattern whose ``match`` succeeds when any of the
+            inputs match, or None when no patterns were given.
+    """
+    parts = [fnmatch.translate(glob) for glob in _as_tuple(globs)]
+    parts += [f".*?(?:{regex})" for regex in _as_tuple(regexes)]
+    if not parts:
+        return None
+    return re.compile("|".join(f"(?:{part})" for part in parts), re.IGNORECASE if ignore_case else 0)
+
+
+# ======================== Scan Filter ========================
+class ScanFilter:
+
+    def __init__(self, include=None, exclude=None, include_regex=None, exclude_regex=None,
+                 extensions=None, min_size: int | None = None, max_size: int | None = None,
+                 modified_after: float | None = None, modified_before: float | None = None,
+                 prune=None, prune_regex=None, ignore_case: bool = False):
+        """Describe which entries a directory scan should report or descend into.
+
+        All patterns are compiled once here. Checks run on the raw names and
+        cached stat data of ``os.DirEntry`` objects, cheapest first, so
+        rejected entries never become Path objects and size/mtime checks only
+        stat entries whose name already matched.
+
+        Args:
+            include (str | Iterable[str] | None): Glob patterns; when given,
+                only names matching one of them are reported.
+            exclude (str | Iterable[str] | None): Glob patterns of names that
+                are never reported.
+            include_regex (str | Iterable[str] | None): Like `include`, as
+                regular expressions searched in the name.
+            exclude_regex (str | Iterable[str] | None): Like `exclude`, as
+                regular expressions searched in the name.
+            extensions (Iterable[str] | None): File extensions to report,
+                with or without the leading dot (``{".txt", "log"}``).
+                Directories are not affected.
+            min_size (int | None): Smallest file size in bytes to report.
+            max_size (int | None): Largest file size in bytes to report.
+            modified_after (float | None): Only report entries modified at or
+                after this POSIX timestamp.
+            modified_before (float | None): Only report entries modified
+                before this POSIX timestamp.
+            prune (str | Iterable[str] | None): Glob patterns of directory
+                names that are neither reported nor descended into
+                (e.g. ``".git"``).
+            prune_regex (str | Iterable[str] | None): Like `prune`, as
+                regular expressions.
+            ignore_case (bool): Match patterns and extensions
+                case-insensitively.
+        """
+        self.include = compile_patterns(include, include_regex, ignore_case)
+        self.exclude = compile_patterns(exclude, exclude_regex, ignore_case)
+        self.prune_pattern = compile_patterns(prune, prune_regex, ignore_case)
+        self.ignore_case = ignore_case
+        self.extensions = None
+        if extensions is not None:
+            normalized = (ext if ext.startswith(".") else f".{ext}" for ext in _as_tuple(extensions))
+            self.extensions = frozenset(ext.lower() if ignore_case else ext for ext in normalized)
+        self.min_size = min_size
+        self.max_size = max_size
+        self.modified_after_ns = int(modified_after * 1e9) if modified_after is not None else None
+        self.modified_before_ns = int(modified_before * 1e9) if modified_before is not None else None
+        self._needs_stat = (min_size is not None or max_size is not None
+                            or modified_after is not None or modified_before is not None)
+
+    def prunes(self, entry) -> bool:
+        """Return True if directory `entry` must be skipped entirely.
+
+        Args:
+            entry (os.DirEntry): A directory entry.
+
+        Returns:
+            bool: True when the name matches a prune rule.
+        """
+        return self.prune_pattern is not None and self.prune_pattern.match(entry.name) is not None
+
+    def matches(self, entry, is_dir: bool) -> bool:
+        """Return True if `entry` should be reported.
+
+        Args:
+            entry (os.DirEntry): Entry from a directory scan.
+            is_dir (bool): Whether the entry is a directory (extension and
+                size rules only apply to files).
+
+        Returns:
+            bool: True when the entry passes every configured rule.
+        """
+        name = entry.name
+        if self.include is not None and self.include.match(name) is None:
+            return False
+        if self.exclude is not None and self.exclude.match(name) is not None:
+            return False
+        if is_dir:
+            if self.prunes(entry):
+                return False
+        elif self.extensions is not None:
+            dot = name.rfind(".")
+            if dot <= 0:
+                return False
+            extension = name[dot:]
+            if (extension.lower() if self.ignore_case else extension) not in self.extensions:
+                return False
+        if not self._needs_stat:
+            return True
+        try:
+            entry_stat = entry.stat()
+        except OSError:
+            return False
+        if not is_dir:
+            if self.min_size is not None and entry_stat.st_size < self.min_size:
+                return False
+            if self.max_size is not None and entry_stat.st_size > self.max_size:
+                return False
+        if self.modified_after_ns is not None and entry_stat.st_mtime_ns < self.modified_after_ns:
+            return False
+        if self.modified_before_ns is not None and entry_stat.st_mtime_ns >= self.modified_before_ns:
+            return False
+        return True
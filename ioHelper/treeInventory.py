@@ -0,0 +1,132 @@
+# ======================== Imports ========================
+import os
+from array import array
+from pathlib import Path
+
+
+# ======================== Tree Inventory ========================
+class TreeInventory:
+    """Columnar record of every directory and file found under a root.
+
+    Instead of one Path object per entry, entries are stored as parallel
+    columns: a name list and an ``array`` of parent directory indexes, plus
+    optional size and mtime columns for files. Directory 0 is the root;
+    its name is the root path and its parent is -1. Paths are rebuilt on
+    demand from the parent chain.
+
+    Attributes:
+        root (str): Root path the inventory was taken from.
+        dir_names (list[str]): Directory names (the root path for index 0).
+        dir_parents (array): Parent directory index of each directory.
+        file_names (list[str]): File names.
+        file_parents (array): Parent directory index of each file.
+        file_sizes (array | None): File sizes in bytes (-1 if unavailable),
+            when collected with stats.
+        file_mtimes_ns (array | None): File modification times in
+            nanoseconds (-1 if unavailable), when collected with stats.
+    """
+
+    def __init__(self, root: str, with_stat: bool = False):
+        """Create an inventory containing only the root directory.
+
+        Args:
+            root (str): Root path.
+            with_stat (bool): Allocate size and mtime columns for files.
+        """
+        self.root = root
+        self.dir_names = [root]
+        self.dir_parents = array("q", [-1])
+        self.file_names = []
+        self.file_parents = array("q")
+        self.file_sizes = array("q") if with_stat else None
+        self.file_mtimes_ns = array("q") if with_stat else None
+        self._dir_paths = None
+
+    @property
+    def dir_count(self) -> int:
+        """int: Number of directories, excluding the root."""
+        return len(self.dir_names) - 1
+
+    @property
+    def file_count(self) -> int:
+        """int: Number of files."""
+        return len(self.file_names)
+
+    def add_directory(self, name: str, parent: int) -> int:
+        """Append a directory and return its index.
+
+        Args:
+            name (str): Directory name.
+            parent (int): Index of the containing directory.
+
+        Returns:
+            int: Index of the new directory.
+        """
+        self.dir_names.append(name)
+        self.dir_parents.append(parent)
+        self._dir_paths = None
+        return len(self.dir_names) - 1
+
+    def add_file(self, name: str, parent: int, size: int = -1, mtime_ns: int = -1):
+        """Append a file.
+
+        Args:
+            name (str): File name.
+            parent (int): Index of the containing directory.
+            size (int): Size in bytes; stored only when stats are collected.
+            mtime_ns (int): Modification time; stored only when stats are
+                collected.
+        """
+        self.file_names.append(name)
+        self.file_parents.append(parent)
+        if self.file_sizes is not None:
+            self.file_sizes.append(size)
+            self.file_mtimes_ns.append(mtime_ns)
+
+    def dir_path(self, index: int) -> str:
+        """Return the path of directory `index` as a string.
+
+        The full list of directory paths is built on first use and reused
+        until another directory is added.
+        """
+        if self._dir_paths is None:
+            paths = []
+            names = self.dir_names
+            # Parents always precede their children, so one forward pass works.
+            for i, parent in enumerate(self.dir_parents):
+                paths.append(names[i] if parent < 0 else os.path.join(paths[parent], names[i]))
+            self._dir_paths = paths
+        return self._dir_paths[index]
+
+    def file_path(self, index: int) -> str:
+        """Return the path of file `index` as a string."""
+        return os.path.join(self.dir_path(self.file_parents[index]), self.file_names[index])
+
+    def directories(self):
+        """Yield a Path for every directory below the root, in scan order.
+
+        Yields:
+            pathlib.Path: Directory paths.
+        """
+        for index in range(1, len(self.dir_names)):
+            yield Path(self.dir_path(index))
+
+    def files(self):
+        """Yield a Path for every file, in scan order.
+
+        Yields:
+            pathlib.Path: File paths.
+        """
+        for index in range(len(self.file_names)):
+            yield Path(self.file_path(index))
+
+    def files_in(self, dir_index: int) -> list:
+        """Return the indexes of the files directly inside directory `dir_index`.
+
+        Args:
+            dir_index (int): Directory index.
+
+        Returns:
+            list[int]: File indexes.
+        """
+        return [index for index, parent in enumerate(self.file_parents) if parent == dir_index]
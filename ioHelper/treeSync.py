@@ -0,0 +1,396 @@
+# ======================== Imports ========================
+from __future__ import annotations
+
+import marshal
+import os
+from pathlib import Path
+
+import Utils.Logger
+from ioHelper import fileHashing, fileOperations
+from ioHelper.scanFilter import ScanFilter
+from ioHelper.treeWalker import walk_tree
+
+# ======================== Initialization ========================
+log = Utils.Logger.LazyLogger("ioHelper.treeSync", logger_name="TreeSyncLogger", log_color=True)
+
+# ======================== Constants ========================
+
+# Default manifest file name, kept in the root of the target tree.
+MANIFEST_NAME = ".sync_manifest"
+MANIFEST_VERSION = 2
+
+
+# ======================== Manifest ========================
+
+def load_manifest(path: Path) -> dict | None:
+    """Read a manifest written by :func:`save_manifest`.
+
+    Args:
+        path (pathlib.Path): Manifest file.
+
+    Returns:
+        dict | None: ``{"files": {relpath: (size, mtime_ns, hash)}, "directories":
+            set[relpath]}``, or None when the file is missing, from another
+            version or unreadable (the caller then rescans the target).
+    """
+    try:
+        data = marshal.loads(path.read_bytes())
+        version, relpaths, sizes, mtimes, hashes, directories = data
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if version != MANIFEST_VERSION:
+        return None
+    return {"files": dict(zip(relpaths, zip(sizes, mtimes, hashes))), "directories": set(directories)}
+
+
+def save_manifest(path: Path, files: dict, directories) -> None:
+    """Atomically write a manifest.
+
+    Stored column by column with ``marshal``, which loads a million entries
+    in well under a second.
+
+    Args:
+        path (pathlib.Path): Manifest file.
+        files (dict[str, tuple[int, int, bytes | None]]): Size, mtime and
+            optional hash per relative file path.
+        directories (Iterable[str]): Relative directory paths.
+    """
+    relpaths = list(files)
+    values = list(files.values())
+    data = (MANIFEST_VERSION, relpaths, [value[0] for value in values], [value[1] for value in values],
+            [value[2] for value in values], sorted(directories))
+    temporary = path.with_name(path.name + ".tmp")
+    temporary.write_bytes(marshal.dumps(data))
+    os.replace(temporary, path)
+
+
+def file_hash(path, hash_cache: fileHashing.HashCache | None = None) -> bytes:
+    """Return the :func:`ioHelper.fileHashing.hash_file` digest of the file at `path`.
+
+    With `hash_cache`, a file whose stat matches a cached entry is not read
+    again, and new digests are added to the cache.
+    """
+    if hash_cache is None:
+        return fileHashing.hash_file(path)
+    file_stat = os.stat(path)
+    digest = hash_cache.get(file_stat)
+    if digest is None:
+        digest = fileHashing.hash_file(path)
+        hash_cache.put(file_stat, digest)
+    return digest
+
+
+# ======================== Scanning ========================
+
+def scan_tree(root: str, scan_filter: ScanFilter | None = None, skip: str | None = None) -> tuple:
+    """Collect the files and directories under `root` in one walk.
+
+    Symlinks to files are treated as the files they point to; symlinks to
+    directories are skipped.
+
+    Args:
+        root (str): Tree to scan.
+        scan_filter (ScanFilter | None): Limits which entries are included;
+            pruned directories are not scanned.
+        skip (str | None): Relative path to leave out (the manifest).
+
+    Returns:
+        tuple[dict[str, tuple[int, int, None]], set[str]]: Size and mtime per
+            relative file path, and the relative directory paths.
+    """
+    prefix = len(root) if root.endswith(os.sep) else len(root) + 1
+    prune = scan_filter.prunes if scan_filter is not None and scan_filter.prune_pattern is not None else None
+    files = {}
+    directories = set()
+    for _, entries in walk_tree(root, on_error=_log_scan_error, prune=prune):
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if scan_filter is None or not scan_filter.prunes(entry):
+                        directories.add(entry.path[prefix:])
+                    continue
+                if entry.is_dir():
+                    log.debug("skipping symlinked directory: %s", entry.path)
+                    continue
+                if scan_filter is not None and not scan_filter.matches(entry, False):
+                    continue
+                entry_stat = entry.stat()
+            except OSError as e:
+                log.debug("skipping unreadable entry %s: %s", entry.path, e)
+                continue
+            relpath = entry.path[prefix:]
+            if relpath != skip:
+                files[relpath] = (entry_stat.st_size, entry_stat.st_mtime_ns, None)
+    return files, directories
+
+
+def _same_content(source: str, target: str, relpath: str, target_hash: bytes | None,
+                  hash_cache: fileHashing.HashCache | None) -> bool:
+    """Return True if `relpath` has the same content in both trees.
+
+    Uses the manifest hash of the target file when there is one, otherwise
+    hashes the target file itself.
+    """
+    try:
+        if target_hash is None:
+            target_hash = file_hash(os.path.join(target, relpath), hash_cache)
+        return file_hash(os.path.join(source, relpath), hash_cache) == target_hash
+    except OSError:
+        return False
+
+
+def _find_renamed(source: str, target: str, relpath: str, candidates: list, target_files: dict,
+                  hash_cache: fileHashing.HashCache | None) -> str | None:
+    """Return the vanished target file that `relpath` was renamed from, or None.
+
+    Size and mtime only make a candidate; the content must match too, so a
+    different file that happens to share both is copied, not renamed over.
+    Candidates without a manifest hash are hashed in the target.
+    """
+    try:
+        digest = file_hash(os.path.join(source, relpath), hash_cache)
+    except OSError:
+        return None
+    for old in candidates:
+        try:
+            old_hash = target_files[old][2]
+            if old_hash is None:
+                old_hash = file_hash(os.path.join(target, old), hash_cache)
+        except OSError:
+            continue
+        if old_hash == digest:
+            return old
+    return None
+
+
+def _log_scan_error(error: OSError):
+    """Report a subdirectory that could not be scanned."""
+    log.debug("skipping unreadable directory: %s", error)
+
+
+# ======================== Sync ========================
+class SyncReport:
+
+    def __init__(self, dry_run: bool):
+        """What :func:`sync_tree` did (or, for a dry run, would do).
+
+        All paths are relative to the tree roots.
+
+        Args:
+            dry_run (bool): Whether the changes were only planned.
+
+        Attributes:
+            copied (list[str]): Files new in the source, copied.
+            updated (list[str]): Changed files, copied again.
+            touched (list[str]): Files whose mtime changed but whose hash did
+                not; only their metadata was copied.
+            renamed (list[tuple[str, str]]): ``(old, new)`` target files
+                renamed instead of copied.
+            deleted (list[str]): Target files removed.
+            created_directories (list[str]): Target directories created.
+            deleted_directories (list[str]): Target directories removed.
+            unchanged (int): Files left alone.
+            failed (list[tuple[str, Exception]]): Operations that failed.
+        """
+        self.dry_run = dry_run
+        self.copied = []
+        self.updated = []
+        self.touched = []
+        self.renamed = []
+        self.deleted = []
+        self.created_directories = []
+        self.deleted_directories = []
+        self.unchanged = 0
+        self.failed = []
+
+    def __repr__(self) -> str:
+        return (f"SyncReport(dry_run={self.dry_run}, copied={len(self.copied)}, updated={len(self.updated)}, "
+                f"touched={len(self.touched)}, renamed={len(self.renamed)}, deleted={len(self.deleted)}, "
+                f"created_directories={len(self.created_directories)}, "
+                f"deleted_directories={len(self.deleted_directories)}, unchanged={self.unchanged}, "
+                f"failed={len(self.failed)})")
+
+
+def sync_tree(source_root, target_root, delete: bool = True, dry_run: bool = False, use_hash: bool = False,
+              manifest_path=None, rescan_target: bool = False, scan_filter: ScanFilter | None = None,
+              workers: int | None = None, hash_cache: fileHashing.HashCache | None = None) -> SyncReport:
+    """Make `target_root` a mirror of `source_root`, copying only what changed.
+
+    The target's state after each sync is kept in a manifest (relative path,
+    size, mtime_ns and optionally a content hash). Later runs scan the
+    source once, load the manifest instead of scanning the target, and
+    compare: a file is copied when it is new or its size or mtime differ
+    (copies keep the source mtime, see :func:`ioHelper.fileOperations.copy_files`).
+    A new file with the size, mtime and content hash of a file that
+    disappeared is treated as a rename and renamed in the target instead of
+    copied (only such candidates are hashed). Without a manifest (first run, or `rescan_target`)
+    the target is scanned instead, so existing identical files are not
+    copied again.
+
+    Changes made to the target by other programs are not noticed while the
+    manifest is trusted; use `rescan_target` after such changes.
+
+    Args:
+        source_root (str | pathlib.Path): Tree to copy from.
+        target_root (str | pathlib.Path): Tree to update; created if missing.
+        delete (bool): Remove target files and directories that are no
+            longer in the source.
+        dry_run (bool): Only report what would change.
+        use_hash (bool): Store content hashes. Files whose mtime changed but
+            whose hash did not are not copied again (only their metadata),
+            Costs reading each copied file.
+        manifest_path (str | pathlib.Path | None): Where to keep the
+            manifest; defaults to MANIFEST_NAME in `target_root`.
+        rescan_target (bool): Ignore the manifest and scan the target.
+        scan_filter (ScanFilter | None): Limits which source entries are
+            mirrored; a target scan is filtered the same way, so excluded
+            target files are left alone.
+        workers (int | None): Threads used for copying (see
+            :func:`ioHelper.fileOperations.copy_files`).
+        hash_cache (ioHelper.fileHashing.HashCache | None): Digests reused
+            for content comparisons and rename detection, so unchanged
+            files are not read again on later runs. It is saved afterwards
+            if it has a file.
+
+    Returns:
+        SyncReport: What was (or would be) done.
+
+    Raises:
+        OSError: If `source_root` cannot be scanned.
+    """
+    source = os.path.normpath(str(source_root))
+    target = os.path.normpath(str(target_root))
+    manifest_file = Path(manifest_path) if manifest_path is not None else Path(target, MANIFEST_NAME)
+    manifest_relpath = os.path.relpath(manifest_file, target)
+    report = SyncReport(dry_run)
+
+    source_files, source_directories = scan_tree(source, scan_filter, skip=manifest_relpath)
+    manifest = None if rescan_target else load_manifest(manifest_file)
+    if manifest is not None:
+        target_files, target_directories = manifest["files"], manifest["directories"]
+    elif os.path.isdir(target):
+        log.info("no usable manifest at %s, scanning %s", manifest_file, target)
+        # Filtered like the source, so excluded target files are not deleted.
+        target_files, target_directories = scan_tree(target, scan_filter, skip=manifest_relpath)
+    else:
+        target_files, target_directories = {}, set()
+
+    # ---- Plan ----
+    to_copy = []
+    to_touch = []
+    for relpath, (size, mtime_ns, _) in source_files.items():
+        known = target_files.get(relpath)
+        if known is None:
+            to_copy.append(relpath)
+        elif known[0] == size and known[1] == mtime_ns:
+            report.unchanged += 1
+        elif use_hash and known[0] == size and _same_content(source, target, relpath, known[2], hash_cache):
+            to_touch.append(relpath)
+        else:
+            report.updated.append(relpath)
+    missing = [relpath for relpath in target_files if relpath not in source_files]
+    # Files that vanished, by (size, mtime_ns), as rename candidates.
+    vanished = {}
+    for relpath in missing:
+        size, mtime_ns, _ = target_files[relpath]
+        vanished.setdefault((size, mtime_ns), []).append(relpath)
+    for relpath in to_copy:
+        size, mtime_ns, _ = source_files[relpath]
+        candidates = vanished.get((size, mtime_ns))
+        match = _find_renamed(source, target, relpath, candidates, target_files, hash_cache) if candidates else None
+        if match is None:
+            report.copied.append(relpath)
+        else:
+            candidates.remove(match)
+            report.renamed.append((match, relpath))
+    renamed_from = {old for old, _ in report.renamed}
+    report.touched = to_touch
+    report.created_directories = sorted(source_directories - target_directories)
+    if delete:
+        report.deleted = [relpath for relpath in missing if relpath not in renamed_from]
+        # Deepest first, so children go before their parents.
+        report.deleted_directories = sorted(target_directories - source_directories, reverse=True)
+
+    if dry_run:
+        if hash_cache is not None:
+            hash_cache.save()
+        log.info("sync %s -> %s (dry run): %s", source, target, report)
+        return report
+
+    # ---- Apply ----
+    # Deletions come first so a path can change between file and directory
+    # in one run; renames go before directory deletions, which may still
+    # hold the renamed files.
+    files = dict(target_files)
+    for relpath in report.deleted:
+        try:
+            os.unlink(os.path.join(target, relpath))
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            report.failed.append((relpath, e))
+            continue
+        files.pop(relpath, None)
+    for old, new in report.renamed:
+        try:
+            os.makedirs(os.path.dirname(os.path.join(target, new)), exist_ok=True)
+            os.replace(os.path.join(target, old), os.path.join(target, new))
+        except OSError as e:
+            # Fall back to copying the file.
+            log.debug("rename %s -> %s failed (%s), copying instead", old, new, e)
+            report.copied.append(new)
+            continue
+        files[new] = files.pop(old)
+    directories = set(target_directories)
+    for relpath in report.deleted_directories:
+        try:
+            os.rmdir(os.path.join(target, relpath))
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            report.failed.append((relpath, e))
+            continue
+        directories.discard(relpath)
+    for relpath in report.created_directories:
+        try:
+            os.makedirs(os.path.join(target, relpath), exist_ok=True)
+        except OSError as e:
+            report.failed.append((relpath, e))
+            continue
+        directories.add(relpath)
+    if report.touched:
+        import shutil
+    for relpath in report.touched:
+        try:
+            shutil.copystat(os.path.join(source, relpath), os.path.join(target, relpath))
+        except OSError as e:
+            report.failed.append((relpath, e))
+            files.pop(relpath, None)
+            continue
+        files[relpath] = (*source_files[relpath][:2], files[relpath][2])
+    transfers = report.copied + report.updated
+    if transfers:
+        results = fileOperations.copy_files(
+            [(os.path.join(source, relpath), os.path.join(target, relpath)) for relpath in transfers],
+            replace_existing_target_file=True, workers=workers)
+        for relpath, result in zip(transfers, results):
+            if result.success:
+                digest = file_hash(result.target, hash_cache) if use_hash else None
+                files[relpath] = (*source_files[relpath][:2], digest)
+            else:
+                report.failed.append((relpath, result.error))
+                files.pop(relpath, None)
+
+    try:
+        manifest_file.parent.mkdir(parents=True, exist_ok=True)
+        save_manifest(manifest_file, files, directories)
+    except OSError as e:
+        log.error("Failed to write sync manifest %s: %s", manifest_file, e)
+        report.failed.append((str(manifest_file), e))
+    if hash_cache is not None:
+        hash_cache.save()
+    if report.failed:
+        log.error("sync %s -> %s finished with %s failures: %s", source, target, len(report.failed), report)
+    else:
+        log.success("sync %s -> %s: %s", source, target, report)
+    return report
@@ -0,0 +1,147 @@
+# ======================== Imports ========================
+from __future__ import annotations
+
+import os
+
+
+# ======================== Entry Utils ========================
+
+def scan_directory(path: str) -> list:
+    """Return the entries of one directory using a single ``os.scandir`` call.
+
+    Args:
+        path (str): Directory to scan.
+
+    Returns:
+        list[os.DirEntry]: Entries in scandir order.
+
+    Raises:
+        OSError: If the directory cannot be read (FileNotFoundError,
+            NotADirectoryError, PermissionError, ...).
+    """
+    with os.scandir(path) as iterator:
+        return list(iterator)
+
+
+def entry_is_dir(entry) -> bool:
+    """Return True if `entry` is a directory or a symlink to one.
+
+    Uses the type information cached on the DirEntry; only symlinks need a
+    stat call. Errors are treated as "not a directory", like
+    ``pathlib.Path.is_dir``.
+
+    Args:
+        entry (os.DirEntry): Entry to classify.
+
+    Returns:
+        bool: True for directories and symlinks to directories.
+    """
+    try:
+        return entry.is_dir()
+    except OSError:
+        return False
+
+
+# ======================== Walker ========================
+
+def child_directories(entries, follow_symlinks: bool, prune, visited: set, on_error) -> list:
+    """Return the paths among `entries` that a walk should descend into.
+
+    Args:
+        entries (list[os.DirEntry]): Entries of one directory.
+        follow_symlinks (bool): Include symlinks to directories whose target
+            is not in `visited`.
+        prune (Callable[[os.DirEntry], bool] | None): Returns True for
+            directories to skip.
+        visited (set[tuple[int, int]]): ``(st_dev, st_ino)`` of directories
+            already queued; only used and updated when `follow_symlinks`.
+        on_error (Callable[[OSError], None] | None): Called when an entry
+            cannot be classified.
+
+    Returns:
+        list[str]: Subdirectory paths in entry order.
+    """
+    subdirectories = []
+    for entry in entries:
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                if prune is not None and prune(entry):
+                    continue
+                if follow_symlinks:
+                    entry_stat = entry.stat(follow_symlinks=False)
+                    visited.add((entry_stat.st_dev, entry_stat.st_ino))
+                subdirectories.append(entry.path)
+            elif follow_symlinks and entry.is_symlink() and entry.is_dir():
+                if prune is not None and prune(entry):
+                    continue
+                entry_stat = entry.stat()
+                key = (entry_stat.st_dev, entry_stat.st_ino)
+                if key not in visited:
+                    visited.add(key)
+                    subdirectories.append(entry.path)
+        except OSError as e:
+            if on_error is not None:
+                on_error(e)
+    return subdirectories
+
+
+def walk_tree(root: str, recursive: bool = True, follow_symlinks: bool = False, on_error=None,
+              max_depth: int | None = None, prune=None, scanner=None):
+    """Walk a directory tree with ``os.scandir``, yielding one directory at a time.
+
+    Directories are visited depth-first in pre-order (the order used by
+    ``Path.rglob``). Entry types come from the DirEntry objects, so on Linux
+    classifying an entry costs no extra stat call unless it is a symlink.
+    The walk is lazy: a directory is only scanned when the previous one has
+    been consumed, so stopping iteration stops the walk.
+
+    Args:
+        root (str): Directory to start from. Errors scanning `root` itself are
+            raised to the caller.
+        recursive (bool): Descend into subdirectories when True; otherwise
+            only `root` is yielded.
+        follow_symlinks (bool): Descend into symlinks that point to
+            directories. Every visited directory is then stat'ed once so
+            symlink loops are detected and skipped.
+        on_error (Callable[[OSError], None] | None): Called with the error
+            when a subdirectory cannot be scanned; the subdirectory is then
+            skipped. None skips silently.
+        max_depth (int | None): Deepest level to scan when `recursive` is
+            True; `root` is level 0, its subdirectories level 1. None means
+            unlimited.
+        prune (Callable[[os.DirEntry], bool] | None): Called for each
+            subdirectory before it is descended into; when it returns True
+            the whole subtree is skipped.
+        scanner (Callable[[str], list[os.DirEntry]] | None): Replacement for
+            :func:`scan_directory`, e.g. ``ListingCache.scan``.
+
+    Yields:
+        tuple[str, list[os.DirEntry]]: A directory path and its entries.
+    """
+    if scanner is None:
+        scanner = scan_directory
+    visited = set()
+    if follow_symlinks:
+        root_stat = os.stat(root)
+        visited.add((root_stat.st_dev, root_stat.st_ino))
+    if not recursive:
+        max_depth = 0
+    stack = [(root, 0)]
+    is_root = True
+    while stack:
+        directory, depth = stack.pop()
+        try:
+            entries = scanner(directory)
+        except OSError as e:
+            if is_root:
+                raise
+            if on_error is not None:
+                on_error(e)
+            continue
+        is_root = False
+        yield directory, entries
+        if max_depth is not None and depth >= max_depth:
+            continue
+        depth += 1
+        subdirectories = child_directories(entries, follow_symlinks, prune, visited, on_error)
+        stack.extend((path, depth) for path in reversed(subdirectories))
@@ -0,0 +1,44 @@
+# ======================== Imports ========================
+import asyncio
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("LOGGER_LEVEL", "5")
+
+from ioHelper import afileOperations  # noqa: E402
+
+
+# ======================== Tests ========================
+
+class CopyFileResumableTest(unittest.TestCase):
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.source = Path(self._directory.name) / "source.bin"
+        self.source.write_bytes(os.urandom(1024 * 1024))
+        self.target = Path(self._directory.name) / "target.bin"
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def copy(self, **options) -> list:
+        calls = []
+        ok = asyncio.run(afileOperations.copy_file_resumable(
+            self.source, self.target, progress=lambda copied, total: calls.append(copied),
+            chunk_size=64 * 1024, **options))
+        self.assertTrue(ok)
+        self.assertEqual(self.target.read_bytes(), self.source.read_bytes())
+        return calls
+
+    def test_progress_throttled_by_default(self):
+        self.assertLess(len(self.copy()), 4)
+
+    def test_progress_bytes_passed_through(self):
+        self.assertGreaterEqual(len(self.copy(progress_bytes=64 * 1024)), 16)
+
+
+if __name__ == "__main__":
+    unittest.main()
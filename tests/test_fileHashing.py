@@ -0,0 +1,44 @@
+# ======================== Imports ========================
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("LOGGER_LEVEL", "5")
+
+from ioHelper.fileHashing import HashCache  # noqa: E402
+
+
+# ======================== Tests ========================
+
+class HashCacheTest(unittest.TestCase):
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.path = Path(self._directory.name) / "data.bin"
+        self.path.write_bytes(b"x" * 100)
+        self.stat = os.stat(self.path)
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def test_edge_digests_keyed_by_block_size(self):
+        cache = HashCache()
+        cache.put(self.stat, b"small", "edges", block_size=16)
+        self.assertEqual(cache.get(self.stat, "edges", block_size=16), b"small")
+        self.assertIsNone(cache.get(self.stat, "edges", block_size=32))
+        self.assertIsNone(cache.get(self.stat, "full"))
+
+    def test_saved_entries_reload(self):
+        cache_path = Path(self._directory.name) / "cache"
+        cache = HashCache(cache_path)
+        cache.put(self.stat, b"edges", "edges", block_size=16)
+        cache.save()
+        reloaded = HashCache(cache_path)
+        self.assertEqual(reloaded.get(self.stat, "edges", block_size=16), b"edges")
+        self.assertIsNone(reloaded.get(self.stat, "edges"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+# ======================== Imports ========================
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("LOGGER_LEVEL", "5")
+
+import ioHelper.fileOperations as fileOperations  # noqa: E402
+
+
+# ======================== Tests ========================
+
+class MoveFileTest(unittest.TestCase):
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.directory = Path(self._directory.name)
+        self.source = self.directory / "source.txt"
+        self.source.write_text("data")
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def test_move_onto_hard_link_removes_source(self):
+        target = self.directory / "link.txt"
+        os.link(self.source, target)
+        self.assertTrue(fileOperations.move_file(self.source, target, True))
+        self.assertFalse(self.source.exists())
+        self.assertEqual(target.read_text(), "data")
+
+    def test_move_onto_symlink_to_linked_source_keeps_data(self):
+        os.link(self.source, self.directory / "other.txt")
+        target = self.directory / "symlink.txt"
+        target.symlink_to(self.source)
+        self.assertTrue(fileOperations.move_file(self.source, target, True))
+        self.assertFalse(target.is_symlink())
+        self.assertEqual(target.read_text(), "data")
+
+
+class NonRegularSourceTest(unittest.TestCase):
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.directory = Path(self._directory.name)
+        self.fifo = self.directory / "fifo"
+        os.mkfifo(self.fifo)
+        self.target = self.directory / "target"
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def test_copy_file_rejects_fifo(self):
+        self.assertFalse(fileOperations.copy_file(self.fifo, self.target))
+        self.assertFalse(self.target.exists())
+
+    def test_copy_file_resumable_rejects_fifo(self):
+        self.assertFalse(fileOperations.copy_file_resumable(self.fifo, self.target))
+        self.assertFalse(self.target.exists())
+
+    def test_copy_files_reports_fifo(self):
+        [result] = fileOperations.copy_files([(self.fifo, self.target)])
+        self.assertFalse(result.success)
+        self.assertIsInstance(result.error, OSError)
+
+    def test_copy_file_contents_rejects_fifo(self):
+        with self.assertRaises(OSError):
+            fileOperations.copy_file_contents(self.fifo, self.target)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+# ======================== Imports ========================
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("LOGGER_LEVEL", "5")
+
+from ioHelper.listingCache import ListingCache  # noqa: E402
+
+
+# ======================== Tests ========================
+
+class ListingCacheTest(unittest.TestCase):
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.directory = self._directory.name
+        self.file = Path(self.directory) / "file.txt"
+        self.file.write_bytes(b"a")
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def test_cached_listing_reports_fresh_stat(self):
+        cache = ListingCache()
+        [entry] = cache.scan(self.directory)
+        self.assertEqual(entry.stat().st_size, 1)
+        self.file.write_bytes(b"rewritten in place")
+        [entry] = cache.scan(self.directory)
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(entry.stat().st_size, len(b"rewritten in place"))
+        self.assertTrue(entry.is_file())
+
+    def test_new_entry_rescans(self):
+        cache = ListingCache()
+        cache.scan(self.directory)
+        (Path(self.directory) / "new.txt").write_bytes(b"")
+        cache.invalidate(self.directory)
+        self.assertEqual(sorted(entry.name for entry in cache.scan(self.directory)), ["file.txt", "new.txt"])
+        self.assertEqual(cache.misses, 2)
+
+    def test_invalidate_drops_every_spelling(self):
+        cache = ListingCache()
+        cache.scan(self.directory)
+        cache.scan(self.directory + os.sep)
+        cache.invalidate(self.directory)
+        self.assertEqual(len(cache), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,41 @@
+# ======================== Imports ========================
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("LOGGER_LEVEL", "5")
+
+from ioHelper.parallelWalker import walk_tree_parallel  # noqa: E402
+
+
+# ======================== Tests ========================
+
+class WalkTreeParallelTest(unittest.TestCase):
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.root = self._directory.name
+        for name in ("a/b", "a/c", "d"):
+            os.makedirs(os.path.join(self.root, name))
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def test_max_pending_must_be_positive(self):
+        for ordered in (True, False):
+            with self.subTest(ordered=ordered), self.assertRaises(ValueError):
+                list(walk_tree_parallel(self.root, workers=2, ordered=ordered, max_pending=0))
+
+    def test_max_pending_one_walks_everything(self):
+        for ordered in (True, False):
+            with self.subTest(ordered=ordered):
+                paths = [path for path, _ in walk_tree_parallel(self.root, workers=2, ordered=ordered,
+                                                                max_pending=1)]
+                self.assertEqual(sorted(os.path.relpath(path, self.root) for path in paths),
+                                 [".", "a", os.path.join("a", "b"), os.path.join("a", "c"), "d"])
+
+
+if __name__ == "__main__":
+    unittest.main()
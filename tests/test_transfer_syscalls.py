@@ -0,0 +1,57 @@
+# ======================== Imports ========================
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "benchmarks"))
+sys.path.insert(0, str(ROOT))
+os.environ.setdefault("LOGGER_LEVEL", "5")
+
+import transfer_syscalls  # noqa: E402
+
+# ======================== Constants ========================
+
+# Scenario -> (stat-family calls, open calls, rename/replace calls).
+EXPECTED = {
+    "move": (2, 0, 1),
+    "move, replace target": (2, 0, 1),
+    # The first replace fails on the missing parent and is retried after mkdir.
+    "move, create parent": (3, 0, 2),
+    "move, verify": (4, 0, 1),
+    "copy": (4, 2, 0),
+    "copy, replace target": (4, 2, 0),
+    "copy, verify": (5, 2, 0),
+}
+
+
+# ======================== Tests ========================
+
+class TransferSyscallsTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Lazy imports and logger setup happen on first use; keep them out of the counts.
+        for name in transfer_syscalls.SCENARIOS:
+            with tempfile.TemporaryDirectory() as directory:
+                transfer_syscalls.run_scenario(name, Path(directory))
+
+    def test_call_counts(self):
+        for name, (stat_calls, open_calls, rename_calls) in EXPECTED.items():
+            with self.subTest(name), tempfile.TemporaryDirectory() as directory:
+                counter = transfer_syscalls.run_scenario(name, Path(directory))
+                self.assertEqual(sum(counter[call] for call in transfer_syscalls.STAT_CALLS), stat_calls)
+                self.assertEqual(counter["open"], open_calls)
+                self.assertEqual(counter["rename"] + counter["replace"], rename_calls)
+
+    def test_within_budget(self):
+        for name, (max_stat, max_total) in transfer_syscalls.SCENARIOS.items():
+            with self.subTest(name), tempfile.TemporaryDirectory() as directory:
+                counter = transfer_syscalls.run_scenario(name, Path(directory))
+                self.assertLessEqual(sum(counter[call] for call in transfer_syscalls.STAT_CALLS), max_stat)
+                self.assertLessEqual(sum(counter.values()), max_total)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+# ======================== Imports ========================
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("LOGGER_LEVEL", "5")
+
+from ioHelper.fileHashing import HashCache  # noqa: E402
+from ioHelper.treeSync import sync_tree  # noqa: E402
+
+
+# ======================== Tests ========================
+
+class SyncTreeRenameTest(unittest.TestCase):
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.source = Path(self._directory.name) / "source"
+        self.target = Path(self._directory.name) / "target"
+        self.source.mkdir()
+        (self.source / "old.txt").write_bytes(b"content")
+        sync_tree(self.source, self.target)
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def test_rename_detected_through_hash_cache(self):
+        cache = HashCache()
+        os.rename(self.source / "old.txt", self.source / "new.txt")
+        report = sync_tree(self.source, self.target, hash_cache=cache)
+        self.assertEqual(report.renamed, [("old.txt", "new.txt")])
+        self.assertEqual(report.copied, [])
+        self.assertEqual((self.target / "new.txt").read_bytes(), b"content")
+        self.assertEqual(len(cache), 2)
+
+    def test_same_size_and_mtime_but_different_content_is_copied(self):
+        old_stat = os.stat(self.source / "old.txt")
+        os.unlink(self.source / "old.txt")
+        (self.source / "new.txt").write_bytes(b"CONTENT")
+        os.utime(self.source / "new.txt", ns=(old_stat.st_atime_ns, old_stat.st_mtime_ns))
+        report = sync_tree(self.source, self.target)
+        self.assertEqual(report.renamed, [])
+        self.assertEqual(report.copied, ["new.txt"])
+        self.assertEqual((self.target / "new.txt").read_bytes(), b"CONTENT")
+
+
+if __name__ == "__main__":
+    unittest.main()